@@ -36,7 +36,7 @@ from falcon.errors import *  # NOQA
 from falcon.redirects import *  # NOQA
 from falcon.http_error import HTTPError  # NOQA
 from falcon.http_status import HTTPStatus  # NOQA
-from falcon.middlewares import CORSMiddleware  # NOQA
+from falcon.middlewares import CompressionMiddleware, CORSMiddleware  # NOQA
 
 # NOTE(kgriffs): Ensure that "from falcon import uri" will import
 # the same front-door module as "import falcon.uri". This works by
@@ -48,6 +48,7 @@ from falcon.util import *  # NOQA
 from falcon.hooks import before, after  # NOQA
 from falcon.request import Request, RequestOptions, Forwarded  # NOQA
 from falcon.response import Response, ResponseOptions  # NOQA
+from falcon.response_cache import ResponseCache, SharedMemoryResponseCache  # NOQA
 
 
 ASGI_SUPPORTED = _sys.version_info.minor > 5
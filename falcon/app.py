@@ -27,6 +27,7 @@ from falcon.middlewares import CORSMiddleware
 from falcon.request import Request, RequestOptions
 import falcon.responders
 from falcon.response import Response, ResponseOptions
+from falcon.routing.util import _unpack_route
 import falcon.status_codes as status
 from falcon.util import deprecation
 from falcon.util import misc
@@ -159,6 +160,11 @@ class App:
             (default ``False``).
             (See also: :ref:`CORS <cors>`)
 
+        response_cache (ResponseCache): An instance of
+            :class:`~.ResponseCache` to use for caching rendered responses
+            in-process (default ``None``). Cached responses are served
+            before running any middleware, routing or responders.
+
     Attributes:
         req_options: A set of behavioral options related to incoming
             requests. (See also: :py:class:`~.RequestOptions`)
@@ -193,15 +199,22 @@ class App:
                  '_error_handlers', '_router', '_sinks',
                  '_serialize_error', 'req_options', 'resp_options',
                  '_middleware', '_independent_middleware', '_router_search',
-                 '_static_routes', '_cors_enable', '_unprepared_middleware')
+                 '_static_routes', '_cors_enable', '_unprepared_middleware',
+                 '_find_sink', '_find_static_route', '_response_cache')
 
     def __init__(self, media_type=DEFAULT_MEDIA_TYPE,
                  request_type=Request, response_type=Response,
                  middleware=None, router=None,
-                 independent_middleware=True, cors_enable=False):
+                 independent_middleware=True, cors_enable=False,
+                 response_cache=None):
         self._sinks = []
         self._static_routes = []
 
+        # NOTE: Similar to the CompiledRouter, the search functions for sinks
+        #   and static routes are compiled upon first use.
+        self._find_sink = self._compile_and_find_sink
+        self._find_static_route = self._compile_and_find_static_route
+
         if cors_enable:
             cm = CORSMiddleware()
 
@@ -228,6 +241,8 @@ class App:
         self._router = router or routing.DefaultRouter()
         self._router_search = self._router.find
 
+        self._response_cache = response_cache
+
         self._request_type = request_type
         self._response_type = response_type
 
@@ -261,6 +276,16 @@ class App:
 
         """
         req = self._request_type(env, options=self.req_options)
+
+        response_cache = self._response_cache
+        if response_cache is not None:
+            cached = response_cache.lookup(req)
+            if cached is not None:
+                status, headers, body, age = cached
+
+                start_response(status, headers + [('age', str(age))])
+                return [] if req.method == 'HEAD' else [body]
+
         resp = self._response_type(options=self.resp_options)
         resource = None
         responder = None
@@ -340,7 +365,7 @@ class App:
         length = 0
 
         try:
-            body, length = self._get_body(resp, env.get('wsgi.file_wrapper'))
+            body, length = self._get_body(resp, env.get('wsgi.file_wrapper'), req)
         except Exception as ex:
             if not self._handle_exception(req, resp, ex, params):
                 raise
@@ -388,6 +413,10 @@ class App:
 
         headers = resp._wsgi_headers(default_media_type)
 
+        # NOTE: Streamed responses are not cached.
+        if response_cache is not None and length is not None and req.method == 'GET':
+            response_cache.store(req, resp, resp_status, headers, body[0] if body else b'')
+
         # Return the response per the WSGI spec.
         start_response(resp_status, headers)
         return body
@@ -497,20 +526,73 @@ class App:
             ignore any keyword arguments that they don't support.
         """
 
-        # NOTE(richardolsson): Doing the validation here means it doesn't have
-        # to be duplicated in every future router implementation.
-        if not isinstance(uri_template, str):
-            raise TypeError('uri_template is not a string')
+        self._check_uri_template(uri_template)
+        self._router.add_route(uri_template, resource, **kwargs)
 
-        if not uri_template.startswith('/'):
-            raise ValueError("uri_template must start with '/'")
+    def add_routes(self, routes, **kwargs):
+        """Associate several templatized URI paths with resources at once.
 
-        if '//' in uri_template:
-            raise ValueError("uri_template may not contain '//'")
+        This method is equivalent to calling :meth:`~.add_route` for each
+        route. However, when the configured router implements an
+        ``add_routes()`` method (as does the default
+        :class:`.CompiledRouter`), all of the routes are passed to it in a
+        single call, which may be considerably faster when adding a large
+        number of routes::
 
-        self._router.add_route(uri_template, resource, **kwargs)
+            app.add_routes([
+                ('/things', things),
+                ('/things/{thing_id}', things, {'suffix': 'item'}),
+                ('/users', users),
+            ], compile=True)
+
+        The :class:`.CompiledRouter` validates every URI template before
+        adding any of the routes, and it only resets (or compiles) its
+        routing logic once, after the last route has been added. (See also:
+        :meth:`.CompiledRouter.add_routes`)
+
+        Args:
+            routes (iterable): An iterable of ``(uri_template, resource)``
+                or ``(uri_template, resource, kwargs)`` tuples, where
+                `kwargs` is a ``dict`` of keyword arguments for that
+                particular route, as would otherwise be passed to
+                :meth:`~.add_route`.
+
+        Keyword Args:
+            compile (bool): Optional flag that can be provided when using the
+                default :class:`.CompiledRouter` to compile the routing logic
+                once all of the routes have been added, since it will
+                otherwise delay compilation until the first request is
+                routed.
+
+        Note:
+            Any additional keyword arguments are passed through to the
+            router for every route, unless overridden by the `kwargs` of a
+            given route.
+        """
 
-    def add_static_route(self, prefix, directory, downloadable=False, fallback_filename=None):
+        should_compile = kwargs.pop('compile', False)
+
+        prepared = []
+        for route in routes:
+            uri_template, resource, route_kwargs = _unpack_route(route, kwargs)
+            self._check_uri_template(uri_template)
+            prepared.append((uri_template, resource, route_kwargs))
+
+        add_routes = getattr(self._router, 'add_routes', None)
+        if add_routes is not None:
+            add_routes(prepared, compile=should_compile)
+            return
+
+        if should_compile and prepared:
+            uri_template, resource, route_kwargs = prepared[-1]
+            prepared[-1] = (uri_template, resource, dict(route_kwargs, compile=True))
+
+        for uri_template, resource, route_kwargs in prepared:
+            self._router.add_route(uri_template, resource, **route_kwargs)
+
+    def add_static_route(self, prefix, directory, downloadable=False, fallback_filename=None,
+                         cache_control=None, stat_cache_ttl=1.0, file_cache=None,
+                         precompressed=False):
         """Add a route to a directory of static files.
 
         Static routes provide a way to serve files directly. This
@@ -558,14 +640,50 @@ class App:
             fallback_filename (str): Fallback filename used when the requested file
                 is not found. Can be a relative path inside the prefix folder or any valid
                 absolute path.
-
+            cache_control (dict): A mapping of file suffixes (e.g., ``'.css'``)
+                to the value of the Cache-Control header to set when serving
+                files with that suffix, either as a string or as a list of
+                directives. The value mapped to the special key ``'*'``, if
+                any, is used for any other suffix. For example::
+
+                    app.add_static_route('/assets', assets_path, cache_control={
+                        '.html': 'no-cache',
+                        '*': ['public', 'max-age=86400'],
+                    })
+
+            stat_cache_ttl (float): Number of seconds for which the size and
+                modification time of each file are cached (default ``1.0``).
+                Set to ``0`` to disable caching.
+            file_cache (falcon.routing.StaticFileCache): Cache from which to
+                serve small files as a single buffer, rather than opening and
+                streaming them for each request (default ``None``). The same
+                cache may be shared by several static routes, and it exposes
+                hit and miss counters.
+            precompressed (bool): Set to ``True`` to serve the ``.br`` or
+                ``.gz`` sibling of the requested file, when one exists and
+                the client accepts its content coding as indicated by the
+                Accept-Encoding request header (default ``False``). The
+                Content-Type header is still derived from the name of the
+                requested file, and ``Vary: Accept-Encoding`` is added to
+                every response.
+
+        The ETag and Last-Modified headers are derived from the size and
+        modification time of each file that is served, and conditional GET
+        and HEAD requests (i.e., requests that include an If-None-Match or
+        If-Modified-Since header) are answered with ``304 Not Modified``
+        when the file has not been modified.
         """
 
         self._static_routes.insert(
             0,
             self._STATIC_ROUTE_TYPE(prefix, directory, downloadable=downloadable,
-                                    fallback_filename=fallback_filename)
+                                    fallback_filename=fallback_filename,
+                                    cache_control=cache_control,
+                                    stat_cache_ttl=stat_cache_ttl,
+                                    file_cache=file_cache,
+                                    precompressed=precompressed)
         )
+        self._find_static_route = self._compile_and_find_static_route
 
     def add_sink(self, sink, prefix=r'/'):
         """Register a sink method for the App.
@@ -608,6 +726,7 @@ class App:
         # in the case of a duplicate prefix, the last one added
         # is preferred.
         self._sinks.insert(0, (prefix, sink))
+        self._find_sink = self._compile_and_find_sink
 
     def add_error_handler(self, exception, handler=None):
         """Register a handler for one or more exception types.
@@ -792,6 +911,18 @@ class App:
             independent_middleware=independent_middleware
         )
 
+    def _check_uri_template(self, uri_template):
+        # NOTE(richardolsson): Doing the validation here means it doesn't have
+        # to be duplicated in every future router implementation.
+        if not isinstance(uri_template, str):
+            raise TypeError('uri_template is not a string')
+
+        if not uri_template.startswith('/'):
+            raise ValueError("uri_template must start with '/'")
+
+        if '//' in uri_template:
+            raise ValueError("uri_template may not contain '//'")
+
     def _get_responder(self, req):
         """Search routes for a matching responder.
 
@@ -848,26 +979,32 @@ class App:
                 #   module, so we just grab it directly here.
                 responder = self.__class__._default_responder_bad_request
         else:
-            params = {}
-
-            for pattern, sink in self._sinks:
-                m = pattern.match(path)
-                if m:
-                    params = m.groupdict()
-                    responder = sink
+            # PERF: Rather than trying each sink and static route in turn,
+            #   use search functions that were compiled from all of them.
+            sink_match = self._find_sink(path)
 
-                    break
+            if sink_match is not None:
+                responder, params = sink_match
             else:
+                params = {}
+                responder = self._find_static_route(path)
 
-                for sr in self._static_routes:
-                    if sr.match(path):
-                        responder = sr
-                        break
-                else:
+                if responder is None:
                     responder = self.__class__._default_responder_path_not_found
 
         return (responder, params, resource, uri_template)
 
+    def _compile_and_find_sink(self, path):
+        # NOTE: Compile the search function, replace this method with it,
+        #   and return its result.
+        self._find_sink = helpers.compile_sink_finder(self._sinks)
+        return self._find_sink(path)
+
+    def _compile_and_find_static_route(self, path):
+        # NOTE: See also _compile_and_find_sink()
+        self._find_static_route = helpers.compile_static_route_finder(self._static_routes)
+        return self._find_static_route(path)
+
     def _compose_status_response(self, req, resp, http_status):
         """Compose a response for the given HTTPStatus instance."""
 
@@ -959,7 +1096,7 @@ class App:
     # PERF(kgriffs): Moved from api_helpers since it is slightly faster
     # to call using self, and this function is called for most
     # requests.
-    def _get_body(self, resp, wsgi_file_wrapper=None):
+    def _get_body(self, resp, wsgi_file_wrapper=None, req=None):
         """Convert resp content into an iterable as required by PEP 333.
 
         Args:
@@ -967,6 +1104,10 @@ class App:
             wsgi_file_wrapper: Reference to wsgi.file_wrapper from the
                 WSGI environ dict, if provided by the WSGI server. Used
                 when resp.stream is a file-like object (default None).
+            req: Instance of falcon.Request, used to negotiate the media
+                type and to evaluate the If-None-Match header when the
+                negotiate_media_type and auto_etag response options,
+                respectively, are enabled (default None).
 
         Returns:
             tuple: A two-member tuple of the form (iterable, content_length).
@@ -974,7 +1115,8 @@ class App:
             iterable is determined as follows:
 
                 * If the result of render_body() is not ``None``, returns
-                  ([data], len(data))
+                  ([data], len(data)), or ([], 0) when the response was
+                  turned into a 304 by the auto_etag response option
                 * If resp.stream is not ``None``, returns resp.stream
                   iterable using wsgi.file_wrapper, if necessary:
                   (closeable_iterator, None)
@@ -982,8 +1124,17 @@ class App:
 
         """
 
+        if req is not None and resp.options.negotiate_media_type:
+            helpers.negotiate_media_type(req, resp)
+
         data = resp.render_body()
         if data is not None:
+            if (
+                req is not None and resp.options.auto_etag and
+                helpers.apply_auto_etag(req, resp, data)
+            ):
+                return [], 0
+
             return [data], len(data)
 
         stream = resp.stream
@@ -14,13 +14,25 @@
 
 """Utilities for the App class."""
 
+import hashlib
 from inspect import iscoroutinefunction
+import re
 
 from falcon import util
 from falcon.errors import CompatibilityError
+import falcon.status_codes as status
+from falcon.util.misc import http_status_to_code
 from falcon.util.sync import _wrap_non_coroutine_unsafe
 
 
+_SINK_GROUP_PREFIX = '_falcon_sink_'
+
+# NOTE: Patterns with global inline flags or with numeric group references
+#   can not be safely combined with other patterns.
+_INLINE_FLAGS_PATTERN = re.compile(r'\(\?[aiLmsux]+\)')
+_NUMERIC_REFERENCE_PATTERN = re.compile(r'\\\d|\(\?\(\d')
+
+
 def prepare_middleware(middleware, independent_middleware=False, asgi=False):
     """Check middleware interfaces and prepare the methods for request handling.
 
@@ -199,6 +211,229 @@ def default_serialize_error(req, resp, exception):
     resp.append_header('Vary', 'Accept')
 
 
+def negotiate_media_type(req, resp):
+    """Choose the media type used to serialize the response media.
+
+    The media type is chosen among those registered in the response
+    ``media_handlers`` according to the request's Accept header, in the
+    case that media has been set on the response without specifying its
+    Content-Type explicitly. The default media type is used when the client
+    does not accept any of the registered types.
+
+    This function is called by the app before rendering the body when the
+    ``negotiate_media_type`` response option is enabled. Since it always
+    sets the Content-Type, it may also be called beforehand by middleware
+    that renders the body in ``process_response()``; the app's call is then
+    a no-op.
+
+    Args:
+        req: Instance of ``falcon.Request``
+        resp: Instance of ``falcon.Response``
+    """
+
+    if resp._media is None or resp.body is not None or resp._data is not None:
+        return
+
+    if resp.content_type:
+        return
+
+    options = resp.options
+    media_types = options.media_handlers._get_serializable_media_types(
+        options.default_media_type)
+
+    # NOTE: The Content-Type is always set here, so that calling this
+    #   function again (e.g., from the app after a middleware component has
+    #   already rendered the body) is a no-op.
+    resp.content_type = req.client_prefers(media_types) or options.default_media_type
+
+    resp.append_header('Vary', 'Accept')
+
+
+def apply_auto_etag(req, resp, data):
+    """Set a weak ETag derived from the rendered body of the response.
+
+    The ETag is only set for successful (200) responses to GET and HEAD
+    requests that do not already specify an ETag. If the ETag matches one
+    of the entity tags listed in the If-None-Match request header, the
+    response is turned into a 304 Not Modified.
+
+    Args:
+        req: Instance of ``falcon.Request``
+        resp: Instance of ``falcon.Response``
+        data (bytes): The rendered body of the response.
+
+    Returns:
+        bool: ``True`` if the response was turned into a 304, in which case
+        its body must not be sent; ``False`` otherwise.
+    """
+
+    if req.method not in ('GET', 'HEAD') or 'etag' in resp._headers:
+        return False
+
+    if http_status_to_code(resp.status) != 200:
+        return False
+
+    # PERF: BLAKE2 is fast enough to hash typical response bodies in a few
+    #   microseconds, while still being collision-resistant.
+    etag = hashlib.blake2b(data, digest_size=12).hexdigest()
+    resp._headers['etag'] = 'W/"' + etag + '"'
+
+    if_none_match = req.if_none_match
+    if if_none_match is None:
+        return False
+
+    # NOTE: The weak comparison function is used (RFC 7232, Section 3.2).
+    if if_none_match != ['*'] and etag not in if_none_match:
+        return False
+
+    resp.status = status.HTTP_304
+
+    # NOTE: A 304 response is bodiless, and so the headers that describe
+    #   the (omitted) body are removed.
+    resp._headers.pop('content-type', None)
+    resp._headers.pop('content-length', None)
+
+    return True
+
+
+def compile_sink_finder(sinks):
+    """Combine the prefix patterns of sinks into a single search function.
+
+    Consecutive sink patterns are joined into a single alternation, which
+    is equivalent to trying each pattern in turn, but is evaluated by the
+    regex engine rather than in a Python loop. Patterns that could change
+    meaning as part of an alternation (such as patterns that use flags or
+    numeric backreferences), or that reuse a group name of another
+    pattern in the same alternation, are matched separately.
+
+    Args:
+        sinks (list): A list of ``(pattern, sink)`` tuples, in order of
+            precedence, where each pattern is a compiled regex.
+
+    Returns:
+        callable: A function that takes the requested path and returns a
+        ``(sink, params)`` tuple for the first matching sink, or ``None``
+        if no sink matches the path.
+    """
+
+    steps = []
+    chunk = []
+    chunk_names = set()
+
+    def flush():
+        if not chunk:
+            return
+
+        src = '|'.join(
+            '(?P<{0}{1}>{2})'.format(_SINK_GROUP_PREFIX, idx, pattern.pattern)
+            for idx, (pattern, __) in enumerate(chunk)
+        )
+        entries = {
+            '{0}{1}'.format(_SINK_GROUP_PREFIX, idx): (sink, tuple(pattern.groupindex))
+            for idx, (pattern, sink) in enumerate(chunk)
+        }
+
+        steps.append((re.compile(src), entries, None))
+
+        chunk.clear()
+        chunk_names.clear()
+
+    for pattern, sink in sinks:
+        if not _is_combinable(pattern):
+            flush()
+            steps.append((pattern, None, sink))
+            continue
+
+        names = set(pattern.groupindex)
+        if names & chunk_names:
+            flush()
+
+        chunk.append((pattern, sink))
+        chunk_names.update(names)
+
+    flush()
+
+    def find(path):
+        for pattern, entries, sink in steps:
+            m = pattern.match(path)
+            if m:
+                if entries is None:
+                    return sink, m.groupdict()
+
+                # NOTE: The group wrapping each pattern is closed after any
+                #   group nested within it, so it is always the last one.
+                sink, names = entries[m.lastgroup]
+                return sink, {name: m.group(name) for name in names}
+
+        return None
+
+    return find
+
+
+def compile_static_route_finder(static_routes):
+    """Index static routes by their prefixes.
+
+    Rather than checking every static route in turn, the requested path is
+    sliced at each of its first few path separators, and each slice is
+    looked up in a table of prefixes. The number of lookups is therefore
+    bounded by the number of path segments in the longest prefix, rather
+    than by the number of routes.
+
+    Args:
+        static_routes (list): A list of :class:`~falcon.routing.StaticRoute`
+            instances, in order of precedence.
+
+    Returns:
+        callable: A function that takes the requested path and returns the
+        first matching static route, or ``None`` if no route matches the
+        path.
+    """
+
+    # NOTE: Map each prefix to the route that takes precedence for it,
+    #   together with its rank (lower is better).
+    prefixes = {}
+    exact_paths = {}
+
+    for rank, route in enumerate(static_routes):
+        prefix = route._prefix
+        prefixes.setdefault(prefix, (rank, route))
+
+        # NOTE: See also StaticRoute.match()
+        if route._fallback_filename is not None:
+            exact_paths.setdefault(prefix[:-1], (rank, route))
+
+    max_depth = max((prefix.count('/') for prefix in prefixes), default=0)
+
+    def find(path):
+        best = exact_paths.get(path)
+
+        end = 0
+        for __ in range(max_depth):
+            end = path.find('/', end) + 1
+            if not end:
+                break
+
+            candidate = prefixes.get(path[:end])
+            if candidate is not None and (best is None or candidate[0] < best[0]):
+                best = candidate
+
+        return None if best is None else best[1]
+
+    return find
+
+
+def _is_combinable(pattern):
+    src = pattern.pattern
+
+    return (
+        isinstance(src, str) and
+        pattern.flags == re.UNICODE and
+        not _INLINE_FLAGS_PATTERN.search(src) and
+        not _NUMERIC_REFERENCE_PATTERN.search(src) and
+        not any(name.startswith(_SINK_GROUP_PREFIX) for name in pattern.groupindex)
+    )
+
+
 class CloseableStreamIterator:
     """Iterator that wraps a file-like stream with support for close().
 
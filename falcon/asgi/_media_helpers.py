@@ -0,0 +1,115 @@
+# Copyright 2020 by Kurt Griffiths
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Async generators backing the streaming methods of media handlers.
+
+NOTE: The media handlers live in modules that must remain importable
+    (and compilable with Cython) under Python 3.5, which lacks async
+    generators. Therefore, the handlers' ``*_async`` streaming methods
+    import this module lazily and delegate to the helpers below.
+"""
+
+from falcon.media.base import _iter_media_path, _NEED_DATA, _parse_media_path
+
+
+async def iterate(iterable):
+    """Adapt a synchronous iterable to the async iteration protocol."""
+    for item in iterable:
+        yield item
+
+
+async def collect(media):
+    """Collect the items of an iterable or async iterable into a list."""
+    if not hasattr(media, '__aiter__'):
+        return list(media)
+
+    items = []
+    async for item in media:
+        items.append(item)
+
+    return items
+
+
+async def serialize_collected(handler, media, content_type):
+    """Serialize the collected items of `media` as a single chunk."""
+    items = await collect(media)
+    yield await handler.serialize_async(items, content_type)
+
+
+async def serialize_chunked(media, dumps, chunk_size, prefix=b'', separator=b'', suffix=b''):
+    """Serialize the items of an async iterable in chunks of `chunk_size`."""
+    chunk = bytearray(prefix)
+    sep = b''
+
+    async for item in media:
+        chunk += sep
+        chunk += dumps(item)
+        sep = separator
+
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+
+    chunk += suffix
+    if chunk:
+        yield bytes(chunk)
+
+
+async def deserialize_path(handler, stream, content_type, content_length, path):
+    """Yield the values at `path` within the fully deserialized body."""
+    media = await handler.deserialize_async(stream, content_type, content_length)
+    for value in _iter_media_path(media, _parse_media_path(path)):
+        yield value
+
+
+async def drive_parser(parser, stream):
+    """Drive a push-style incremental parser by reading from `stream`."""
+    for value in parser:
+        if value is _NEED_DATA:
+            parser.feed(await stream.read(parser.read_size))
+        else:
+            yield value
+
+
+async def iter_records(handler, stream):
+    """Yield the records of an NDJSON body, one line at a time."""
+    size = handler.max_record_size + 1
+
+    while True:
+        line = await stream.read_until(b'\n', size)
+        handler._check_record_size(line)
+
+        delimiter = await stream.read(1)
+
+        if line.strip():
+            yield handler._loads_record(line)
+
+        if not delimiter:
+            break
+
+
+async def iter_records_path(handler, stream, content_type, content_length, path):
+    """Yield the values at `path`, treating the records as a top-level array."""
+    records = await handler.deserialize_async(stream, content_type, content_length)
+    components = _parse_media_path(path)
+
+    if components[:1] != ('item',):
+        records = await collect(records)
+        for value in _iter_media_path(records, components):
+            yield value
+        return
+
+    async for record in records:
+        for value in _iter_media_path(record, components[1:]):
+            yield value
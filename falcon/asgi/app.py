@@ -19,13 +19,14 @@ from inspect import isasyncgenfunction, iscoroutinefunction
 import traceback
 
 import falcon.app
-from falcon.app_helpers import prepare_middleware
+from falcon.app_helpers import apply_auto_etag, negotiate_media_type, prepare_middleware
 from falcon.asgi_spec import EventType
 from falcon.errors import CompatibilityError, UnsupportedError, UnsupportedScopeError
 from falcon.http_error import HTTPError
 from falcon.http_status import HTTPStatus
 from falcon.media.multipart import MultipartFormHandler
 import falcon.routing
+from falcon.routing.static import _AsyncFileReader
 from falcon.util.misc import http_status_to_code, is_python_func
 from falcon.util.sync import _wrap_non_coroutine_unsafe, get_running_loop
 from .multipart import MultipartForm
@@ -312,8 +313,16 @@ class App(falcon.app.App):
                 f'The ASGI http scope version {spec_version} is not supported.'
             )
 
-        resp = self._response_type(options=self.resp_options)
         req = self._request_type(scope, receive, options=self.req_options)
+
+        response_cache = self._response_cache
+        if response_cache is not None:
+            cached = response_cache.lookup(req)
+            if cached is not None:
+                await self._send_cached_response(req, send, cached)
+                return
+
+        resp = self._response_type(options=self.resp_options)
         if self.req_options.auto_parse_form_urlencoded:
             raise UnsupportedError(
                 'The deprecated WSGI RequestOptions.auto_parse_form_urlencoded option '
@@ -403,6 +412,9 @@ class App(falcon.app.App):
 
         data = b''
 
+        if resp.options.negotiate_media_type:
+            negotiate_media_type(req, resp)
+
         try:
             data = await resp.render_body()
         except Exception as ex:
@@ -411,6 +423,12 @@ class App(falcon.app.App):
 
             req_succeeded = False
 
+        if (
+            data is not None and resp.options.auto_etag and
+            apply_auto_etag(req, resp, data)
+        ):
+            data = None
+
         resp_status = http_status_to_code(resp.status)
         default_media_type = self.resp_options.default_media_type
 
@@ -520,11 +538,15 @@ class App(falcon.app.App):
             #   when the header doesn't match the body (sometimes choosing to
             #   drop the HTTP connection prematurely, for example).
             resp._headers['content-length'] = str(len(data))
+            headers = resp._asgi_headers(default_media_type)
+
+            if response_cache is not None and req.method == 'GET':
+                response_cache.store(req, resp, resp_status, headers, data)
 
             await send({
                 'type': EventType.HTTP_RESPONSE_START,
                 'status': resp_status,
-                'headers': resp._asgi_headers(default_media_type)
+                'headers': headers
             })
 
             await send({
@@ -546,6 +568,14 @@ class App(falcon.app.App):
         })
 
         if stream:
+            # PERF: Files that are served by static routes may be handed off
+            #   to the server, when supported, or at least be read in larger
+            #   blocks than other streams.
+            if isinstance(stream, _AsyncFileReader):
+                await self._send_file(scope, send, stream)
+                self._schedule_callbacks(resp)
+                return
+
             # Detect whether this is one of the following:
             #
             #   (a) async file-like object (e.g., aiofiles)
@@ -615,6 +645,13 @@ class App(falcon.app.App):
 
     add_route.__doc__ = falcon.app.App.add_route.__doc__
 
+    def add_routes(self, routes, **kwargs):
+        # NOTE: See also the note in add_route() above.
+        kwargs['_asgi'] = True
+        super().add_routes(routes, **kwargs)
+
+    add_routes.__doc__ = falcon.app.App.add_routes.__doc__
+
     def add_error_handler(self, exception, handler=None):
         """Register a handler for one or more exception types.
 
@@ -725,6 +762,57 @@ class App(falcon.app.App):
     # Helper methods
     # ------------------------------------------------------------------------
 
+    async def _send_cached_response(self, req, send, cached):
+        status, headers, body, age = cached
+
+        await send({
+            'type': EventType.HTTP_RESPONSE_START,
+            'status': status,
+            'headers': headers + [(b'age', str(age).encode())],
+        })
+
+        if req.method == 'HEAD':
+            await send(_EVT_RESP_EOF)
+        else:
+            await send({
+                'type': EventType.HTTP_RESPONSE_BODY,
+                'body': body,
+            })
+
+    async def _send_file(self, scope, send, reader):
+        extensions = scope.get('extensions') or {}
+
+        try:
+            path = reader.path
+
+            if path and EventType.HTTP_RESPONSE_PATHSEND in extensions:
+                await send({
+                    'type': EventType.HTTP_RESPONSE_PATHSEND,
+                    'path': path,
+                })
+
+            elif EventType.HTTP_RESPONSE_ZEROCOPYSEND in extensions:
+                await send({
+                    'type': EventType.HTTP_RESPONSE_ZEROCOPYSEND,
+                    'file': reader.file,
+                })
+
+            else:
+                async for data in reader:
+                    await send({
+                        'type': EventType.HTTP_RESPONSE_BODY,
+                        'body': data,
+                        'more_body': True
+                    })
+
+                await send(_EVT_RESP_EOF)
+
+        finally:
+            # NOTE: The file is closed even when it was handed off to the
+            #   server, which is expected to have sent it in full by the
+            #   time the awaited send() returns.
+            await reader.close()
+
     def _schedule_callbacks(self, resp):
         callbacks = resp._registered_callbacks
         if not callbacks:
@@ -0,0 +1,221 @@
+# Copyright 2020 by Kurt Griffiths
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Worker pool for offloading media (de)serialization from the event loop."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import io
+import os
+from threading import Lock
+
+from falcon.util.sync import get_running_loop
+
+
+__all__ = ['MediaOffloadPool']
+
+_DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_default_pool = None
+_default_pool_lock = Lock()
+
+
+class MediaOffloadPool:
+    """Bounded pool of workers for CPU-heavy media (de)serialization.
+
+    By default, media handlers are invoked directly on the event loop, which
+    is unable to service other requests while a large body is being
+    (de)serialized. When the ``media_offload_threshold`` option of
+    :attr:`~falcon.asgi.App.req_options` (in bytes) and/or the
+    ``media_offload_min_items`` option of
+    :attr:`~falcon.asgi.App.resp_options` (in elements) are set, larger
+    media is instead (de)serialized by an instance of this class, using the
+    synchronous methods of the media handler::
+
+        app = falcon.asgi.App()
+
+        app.req_options.media_offload_threshold = 1024 * 1024
+        app.resp_options.media_offload_min_items = 10000
+        app.req_options.media_offload_pool = app.resp_options.media_offload_pool = (
+            falcon.asgi.MediaOffloadPool(max_workers=2))
+
+    The pool keeps track of the number of jobs that are either running or
+    waiting for a free worker; these metrics may be exported periodically in
+    order to monitor the pool, and to size it appropriately.
+
+    Note:
+        Under CPython, media handlers implemented as C extensions (such as
+        the standard :mod:`json` module's encoder and decoder) may hold the
+        global interpreter lock for the duration of a call, so that a thread
+        pool does not necessarily unblock the event loop. To mitigate this,
+        :class:`~falcon.media.JSONHandler` serializes long arrays in
+        slices. Alternatively, a process pool may be used, at the expense of
+        pickling the media object and its serialized form between processes;
+        in that case, the media handlers must be picklable.
+
+    Keyword Arguments:
+        max_workers (int): Maximum number of workers (default
+            ``min(4, os.cpu_count())``).
+        use_processes (bool): Set to ``True`` in order to use a pool of
+            processes, rather than threads (default ``False``).
+    """
+
+    def __init__(self, max_workers=None, use_processes=False):
+        self._max_workers = max_workers or _DEFAULT_MAX_WORKERS
+        self._use_processes = use_processes
+
+        self._executor = None
+        self._lock = Lock()
+
+        self._in_flight = 0
+        self._peak_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+
+    @property
+    def max_workers(self):
+        """Maximum number of workers."""
+        return self._max_workers
+
+    @property
+    def in_flight(self):
+        """Number of jobs that are either running or queued."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self):
+        """Number of jobs that are waiting for a free worker."""
+        return max(0, self._in_flight - self._max_workers)
+
+    @property
+    def peak_queue_depth(self):
+        """Highest queue depth observed since the pool was created."""
+        return self._peak_queue_depth
+
+    @property
+    def submitted(self):
+        """Total number of jobs submitted to the pool."""
+        return self._submitted
+
+    @property
+    def completed(self):
+        """Total number of jobs that have finished, successfully or not."""
+        return self._completed
+
+    async def run(self, func, *args):
+        """Run a function in the pool, and return its result.
+
+        Args:
+            func (callable): Function to run.
+            *args: Positional arguments to pass to `func`.
+
+        Returns:
+            object: The value returned by `func`.
+        """
+
+        executor = self._executor or self._create_executor()
+
+        with self._lock:
+            self._in_flight += 1
+            self._submitted += 1
+            queue_depth = self._in_flight - self._max_workers
+            if queue_depth > self._peak_queue_depth:
+                self._peak_queue_depth = queue_depth
+
+        try:
+            return await get_running_loop().run_in_executor(executor, partial(func, *args))
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+    def shutdown(self, wait=True):
+        """Shut down the workers of the pool.
+
+        Keyword Arguments:
+            wait (bool): Whether to wait for the pending jobs to finish
+                (default ``True``).
+        """
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _create_executor(self):
+        with self._lock:
+            if self._executor is None:
+                if self._use_processes:
+                    self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix='falcon-media',
+                    )
+
+            return self._executor
+
+
+def get_default_pool():
+    """Return the pool shared by apps that do not specify their own."""
+
+    global _default_pool
+
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = MediaOffloadPool()
+
+    return _default_pool
+
+
+def estimate_media_size(media, limit):
+    """Count the elements of a media object, stopping once above `limit`.
+
+    The elements of the top-level container are counted, together with
+    those of the containers it directly holds.
+    """
+
+    if not isinstance(media, (dict, list, tuple)):
+        return 0
+
+    total = len(media)
+    if total > limit:
+        return total
+
+    for item in (media.values() if isinstance(media, dict) else media):
+        if isinstance(item, (dict, list, tuple)):
+            total += len(item)
+            if total > limit:
+                break
+
+    return total
+
+
+def serialize(handler, media, content_type):
+    """Serialize a media object with the handler's synchronous method."""
+
+    # NOTE: A handler may provide a variant of serialize() that is better
+    #   suited to running in a worker (see also: JSONHandler).
+    serialize_offloaded = getattr(handler, '_serialize_offloaded', None)
+    if serialize_offloaded is not None:
+        return serialize_offloaded(media, content_type)
+
+    return handler.serialize(media, content_type)
+
+
+def deserialize(handler, data, content_type):
+    """Deserialize a buffered request body with the handler's synchronous method."""
+    return handler.deserialize(io.BytesIO(data), content_type, len(data))
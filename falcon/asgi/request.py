@@ -16,12 +16,14 @@
 
 from falcon import errors
 from falcon import request_helpers as helpers  # NOQA: Required by fixed up WSGI Request attrs
-from falcon.constants import SINGLETON_HEADERS
+from falcon.constants import _UNSET, SINGLETON_HEADERS
 from falcon.forwarded import _parse_forwarded_header  # NOQA: Req. by fixed up WSGI Request attrs
 from falcon.forwarded import Forwarded  # NOQA
+from falcon.media.models import decode_media
 import falcon.request
-from falcon.util.uri import parse_host, parse_query_string
+from falcon.util.uri import parse_host
 from . import _request_helpers as asgi_helpers
+from . import offload
 from .stream import BoundedStream
 
 
@@ -324,7 +326,9 @@ class Request(falcon.request.Request):
         params (dict): The mapping of request query parameter names to their
             values.  Where the parameter appears multiple times in the query
             string, the value mapped to that parameter key will be a list of
-            all the values in the order seen.
+            all the values in the order seen. The query string is parsed the
+            first time the params are accessed, either via this attribute or
+            one of the ``get_param*()`` methods.
 
         options (falcon.request.RequestOptions): Set of global options passed
             in from the App handler.
@@ -335,8 +339,8 @@ class Request(falcon.request.Request):
     """
 
     __slots__ = [
-        '_asgi_headers',
         '_asgi_server_cached',
+        '_cached_content_type',
         '_receive',
         '_stream',
         'scope',
@@ -344,34 +348,17 @@ class Request(falcon.request.Request):
 
     def __init__(self, scope, receive, options=None):
 
-        # =====================================================================
-        # Prepare headers
-        # =====================================================================
-
-        req_headers = {}
-        for header_name, header_value in scope['headers']:
-            # NOTE(kgriffs): According to ASGI 3.0, header names are always
-            #   lowercased, and both name and value are byte strings. Although
-            #   technically header names and values are restricted to US-ASCII
-            #   we decode using the default 'utf-8' because it is a little
-            #   faster than passing an encoding option.
-            header_name = header_name.decode()
-            header_value = header_value.decode()
-
-            # NOTE(kgriffs): There are no standard request headers that
-            #   allow multiple instances to appear in the request while also
-            #   disallowing list syntax.
-            if header_name not in req_headers or header_name in SINGLETON_HEADERS:
-                req_headers[header_name] = header_value
-            else:
-                req_headers[header_name] += ',' + header_value
-
-        self._asgi_headers = req_headers
-
         # =====================================================================
         #  Misc.
         # =====================================================================
 
+        # NOTE: Headers are decoded the first time they are needed (see also:
+        #   self._asgi_headers). We avoid touching them here so that the
+        #   cost of creating a request does not depend on the number of
+        #   headers sent by the client.
+        self._cached_headers = None
+        self._cached_content_type = _UNSET
+
         self._asgi_server_cached = None  # Lazy
 
         self.scope = scope
@@ -393,42 +380,17 @@ class Request(falcon.request.Request):
         else:
             self.path = path
 
-        query_string = scope['query_string'].decode()
-        self.query_string = query_string
-        if query_string:
-            self._params = parse_query_string(
-                query_string,
-                keep_blank=self.options.keep_blank_qs_values,
-                csv=self.options.auto_parse_qs_csv,
-            )
-
-        else:
-            self._params = {}
+        self.query_string = scope['query_string'].decode()
+        self._cached_params = None  # Lazy
 
         self._cached_access_route = None
         self._cached_forwarded = None
         self._cached_forwarded_prefix = None
         self._cached_forwarded_uri = None
-        self._cached_headers = req_headers
         self._cached_prefix = None
         self._cached_relative_uri = None
         self._cached_uri = None
 
-        if self.method == 'GET':
-            # PERF(kgriffs): Normally we expect no Content-Type header, so
-            #   use this pattern which is a little bit faster than dict.get()
-            if 'content-type' in req_headers:
-                self.content_type = req_headers['content-type']
-            else:
-                self.content_type = None
-        else:
-            # PERF(kgriffs): This is the most performant pattern when we expect
-            #   the key to be present most of the time.
-            try:
-                self.content_type = req_headers['content-type']
-            except KeyError:
-                self.content_type = None
-
         # =====================================================================
         # The request body stream is created lazily
         # =====================================================================
@@ -477,6 +439,24 @@ class Request(falcon.request.Request):
         except KeyError:
             return '*/*'
 
+    @property
+    def content_type(self):
+        if self._cached_content_type is _UNSET:
+            # PERF(kgriffs): Normally we expect no Content-Type header for
+            #   GET requests, so use this pattern which is a little bit
+            #   faster than dict.get()
+            headers = self._asgi_headers
+            if 'content-type' in headers:
+                self._cached_content_type = headers['content-type']
+            else:
+                self._cached_content_type = None
+
+        return self._cached_content_type
+
+    @content_type.setter
+    def content_type(self, value):
+        self._cached_content_type = value
+
     @property
     def content_length(self):
         try:
@@ -517,6 +497,10 @@ class Request(falcon.request.Request):
     #   it in greenfield ASGI apps.
     bounded_stream = stream
 
+    @property
+    def headers(self):
+        return self._asgi_headers
+
     @property
     def root_path(self):
         # PERF(kgriffs): try...except is faster than get() assuming that
@@ -677,7 +661,7 @@ class Request(falcon.request.Request):
 
         return netloc_value
 
-    async def get_media(self):
+    async def get_media(self, into=None):
         """Return a deserialized form of the request stream.
 
         The first time this method is called, the request stream will be
@@ -693,15 +677,37 @@ class Request(falcon.request.Request):
 
         See also :ref:`media` for more information regarding media handling.
 
+        If `into` is specified, the deserialized media is additionally
+        converted to the given type, such as a dataclass or an attrs class.
+        Nested models, as well as lists and dicts thereof, are converted
+        according to the fields' type annotations; other values are passed
+        through as deserialized. The decoder for each class is generated
+        once, and then cached::
+
+            order = await req.get_media(into=Order)
+            orders = await req.get_media(into=List[Order])
+
+        Keys that do not correspond to any field are ignored, while a
+        missing required field results in a 400 Bad Request error.
+
         Warning:
             This operation will consume the request stream the first time
             it's called and cache the results. Follow-up calls will just
             retrieve a cached version of the object.
 
+        Keyword Arguments:
+            into (type): Type to convert the deserialized media to (default
+                ``None``). This may be a dataclass or an attrs class, or
+                :class:`~typing.List`, :class:`~typing.Dict`, or
+                :data:`~typing.Optional` thereof.
+
         Returns:
             media (object): The deserialized media representation.
         """
 
+        if into is not None:
+            return decode_media(await self.get_media(), into)
+
         if self._media is not None or self.stream.eof:
             return self._media
 
@@ -711,11 +717,18 @@ class Request(falcon.request.Request):
         )
 
         try:
-            self._media = await handler.deserialize_async(
-                self.stream,
-                self.content_type,
-                self.content_length
-            )
+            if self._should_offload_media(handler):
+                pool = self.options.media_offload_pool or offload.get_default_pool()
+                data = await self.stream.read()
+
+                self._media = await pool.run(
+                    offload.deserialize, handler, data, self.content_type)
+            else:
+                self._media = await handler.deserialize_async(
+                    self.stream,
+                    self.content_type,
+                    self.content_length
+                )
         finally:
             if handler.exhaust_stream:
                 await self.stream.exhaust()
@@ -724,6 +737,53 @@ class Request(falcon.request.Request):
 
     media = property(get_media)
 
+    async def iter_media(self, path='item'):
+        """Iterate over the values found at the given path within the request body.
+
+        Unlike :meth:`~.get_media`, this method parses the request stream
+        incrementally (if supported by the matched media handler), yielding
+        each value found at `path` as soon as it is complete. This allows
+        processing very large documents while keeping memory use proportional
+        to a single value, rather than to the whole document::
+
+            # Request body: {"items": [{"id": 1}, {"id": 2}, ...]}
+            async for item in req.iter_media('items.item'):
+                await process(item)
+
+        The path consists of dot-separated components, where ``item`` denotes
+        the elements of an array, and any other component denotes the member
+        of an object with the matching name (see also:
+        :meth:`falcon.media.BaseHandler.deserialize_stream`).
+
+        Warning:
+            The request stream is consumed as the returned iterator is
+            advanced. The deserialized values are not cached, and so this
+            method cannot be combined with :meth:`~.get_media`.
+
+        Keyword Args:
+            path (str): Path to the values to yield (default ``'item'``, i.e.,
+                the elements of the top-level array).
+
+        Yields:
+            object: Deserialized values.
+        """
+
+        if self.stream.eof:
+            return
+
+        handler = self.options.media_handlers.find_by_media_type(
+            self.content_type,
+            self.options.default_media_type
+        )
+
+        async for value in handler.deserialize_stream_async(
+            self.stream,
+            self.content_type,
+            self.content_length,
+            path
+        ):
+            yield value
+
     @property
     def if_match(self):
         # TODO(kgriffs): It may make sense at some point to create a
@@ -859,6 +919,33 @@ class Request(falcon.request.Request):
     # Private Helpers
     # ------------------------------------------------------------------------
 
+    @property
+    def _asgi_headers(self):
+        if self._cached_headers is None:
+            req_headers = {}
+            for header_name, header_value in self.scope['headers']:
+                # NOTE(kgriffs): According to ASGI 3.0, header names are
+                #   always lowercased, and both name and value are byte
+                #   strings. Although technically header names and values are
+                #   restricted to US-ASCII we decode using the default 'utf-8'
+                #   because it is a little faster than passing an encoding
+                #   option.
+                header_name = header_name.decode()
+                header_value = header_value.decode()
+
+                # NOTE(kgriffs): There are no standard request headers that
+                #   allow multiple instances to appear in the request while
+                #   also disallowing list syntax.
+                if (header_name not in req_headers or
+                        header_name in SINGLETON_HEADERS):
+                    req_headers[header_name] = header_value
+                else:
+                    req_headers[header_name] += ',' + header_value
+
+            self._cached_headers = req_headers
+
+        return self._cached_headers
+
     @property
     def _asgi_server(self):
         if not self._asgi_server_cached:
@@ -875,3 +962,13 @@ class Request(falcon.request.Request):
                 self._asgi_server_cached = ('localhost', default_port)
 
         return self._asgi_server_cached
+
+    def _should_offload_media(self, handler):
+        threshold = self.options.media_offload_threshold
+        if threshold is None or not getattr(handler, 'offloadable', False):
+            return False
+
+        # NOTE: Bodies of unknown length are never offloaded, since they
+        #   would need to be buffered before their size could be checked.
+        content_length = self.content_length
+        return content_length is not None and content_length > threshold
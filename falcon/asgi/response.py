@@ -16,10 +16,12 @@
 
 from asyncio.coroutines import CoroWrapper  # type: ignore
 from inspect import iscoroutine, iscoroutinefunction
+from types import AsyncGeneratorType, GeneratorType
 
 from falcon.constants import _UNSET
 import falcon.response
 from falcon.util.misc import is_python_func
+from . import offload
 
 __all__ = ['Response']
 
@@ -46,6 +48,11 @@ class Response(falcon.response.Response):
         media (object): A serializable object supported by the media handlers
             configured via :class:`falcon.RequestOptions`.
 
+            If a generator or async generator is assigned, the items it yields are serialized
+            incrementally by the media handler, and streamed to the client
+            via :attr:`stream` when the response is rendered (for JSON, the
+            items are rendered as an array).
+
             Note:
                 See also :ref:`media` for more information regarding media
                 handling.
@@ -240,7 +247,10 @@ class Response(falcon.response.Response):
 
         Note:
             This method ignores :attr:`~.stream`; the caller must check
-            and handle that attribute directly.
+            and handle that attribute directly. However, when a generator
+            or async generator is assigned to :attr:`~.media`, the stream
+            of serialized chunks is assigned to :attr:`~.stream` by this
+            method, and ``None`` is returned.
 
         Returns:
             bytes: The UTF-8 encoded value of the `body` attribute, if
@@ -265,10 +275,31 @@ class Response(falcon.response.Response):
                         self.options.default_media_type
                     )
 
-                    self._media_rendered = await handler.serialize_async(
-                        self._media,
-                        self.content_type
-                    )
+                    if isinstance(self._media, (GeneratorType, AsyncGeneratorType)):
+                        self.stream = handler.serialize_stream_async(
+                            self._media,
+                            self.content_type
+                        )
+                        self._media_rendered = None
+                    else:
+                        if self._should_offload_media(handler):
+                            pool = self.options.media_offload_pool or offload.get_default_pool()
+                            self._media_rendered = await pool.run(
+                                offload.serialize,
+                                handler,
+                                self._media,
+                                self.content_type
+                            )
+                        else:
+                            self._media_rendered = await handler.serialize_async(
+                                self._media,
+                                self.content_type
+                            )
+
+                        get_content_type = getattr(handler, '_get_content_type', None)
+                        if get_content_type is not None:
+                            self.content_type = get_content_type(
+                                self._media, self.content_type)
 
                 data = self._media_rendered
         else:
@@ -426,3 +457,10 @@ class Response(falcon.response.Response):
             items += [(b'set-cookie', c.OutputString().encode())
                       for c in self._cookies.values()]
         return items
+
+    def _should_offload_media(self, handler):
+        min_items = self.options.media_offload_min_items
+        if min_items is None or not getattr(handler, 'offloadable', False):
+            return False
+
+        return offload.estimate_media_size(self._media, min_items) >= min_items
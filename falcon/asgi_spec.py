@@ -19,6 +19,8 @@ class EventType:
     HTTP_REQUEST = 'http.request'
     HTTP_RESPONSE_START = 'http.response.start'
     HTTP_RESPONSE_BODY = 'http.response.body'
+    HTTP_RESPONSE_PATHSEND = 'http.response.pathsend'
+    HTTP_RESPONSE_ZEROCOPYSEND = 'http.response.zerocopysend'
     HTTP_DISCONNECT = 'http.disconnect'
 
     LIFESPAN_STARTUP = 'lifespan.startup'
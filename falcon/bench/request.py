@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmarks for Request construction.
+
+Run with::
+
+    $ python -m falcon.bench.request
+
+Reference results (CPython 3.8, pure-Python build, μs per operation; lower
+is better):
+
+    ==================  ======  =====
+    Benchmark           Before  After
+    ==================  ======  =====
+    wsgi-init             7.33   1.37
+    wsgi-init+param       7.94   7.91
+    asgi-init             7.50   1.66
+    asgi-init+header      8.02   2.15
+    ==================  ======  =====
+
+"Before" refers to eagerly parsing the query string (WSGI and ASGI) and
+decoding every header (ASGI) in the initializer; "After" refers to deferring
+that work until the corresponding attribute is first accessed.
+"""
+
+import argparse
+import gc
+import timeit
+
+import falcon
+import falcon.testing as helpers
+
+try:
+    import falcon.asgi
+except ImportError:  # pragma: nocover
+    pass
+
+
+QUERY_STRING = 'limit=10&marker=4bc2e4a8&thing=a+b&x=%23%24&flags=a,b,c'
+
+HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    'Content-Type': 'application/json',
+    'Cookie': 'session=c2fa1ec3b3a4; theme=dark; tz=UTC',
+    'Pragma': 'no-cache',
+    'Referer': 'https://example.com/things',
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:80.0) Firefox/80.0',
+    'X-Forwarded-For': '192.0.2.1, 198.51.100.7',
+    'X-Request-ID': '1e4dd0ff-5f84-4a05-9f2a-6a9d4d0b3c0a',
+}
+
+
+async def _receive():  # pragma: nocover
+    return {'type': 'http.request', 'body': b''}
+
+
+def _wsgi_benchmarks():
+    env = helpers.create_environ('/things/1337', query_string=QUERY_STRING,
+                                 headers=HEADERS)
+    options = falcon.RequestOptions()
+    request_type = falcon.Request
+
+    def init():
+        request_type(env, options)
+
+    def init_param():
+        request_type(env, options).get_param('limit')
+
+    return [
+        ('wsgi-init', init),
+        ('wsgi-init+param', init_param),
+    ]
+
+
+def _asgi_benchmarks():
+    if not falcon.ASGI_SUPPORTED:  # pragma: nocover
+        return []
+
+    scope = helpers.create_scope('/things/1337', query_string=QUERY_STRING,
+                                 headers=HEADERS)
+    options = falcon.RequestOptions()
+    request_type = falcon.asgi.Request
+
+    def init():
+        request_type(scope, _receive, options)
+
+    def init_header():
+        request_type(scope, _receive, options).user_agent
+
+    return [
+        ('asgi-init', init),
+        ('asgi-init+header', init_header),
+    ]
+
+
+def run(iterations, trials):
+    results = []
+
+    for name, func in _wsgi_benchmarks() + _asgi_benchmarks():
+        gc.collect()
+        best = min(timeit.repeat(func, setup=gc.enable,
+                                 number=iterations, repeat=trials))
+        results.append((name, best / iterations * 10 ** 6))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Falcon Request construction benchmark')
+    parser.add_argument('-i', '--iterations', type=int, default=100000)
+    parser.add_argument('-t', '--trials', type=int, default=5)
+    args = parser.parse_args()
+
+    print()
+    for name, us_per_op in run(args.iterations, args.trials):
+        print('{0:.<30s}{1: >8.2f} μs'.format(name, us_per_op))
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Script that saves the compiled routing logic of an App instance to a file.
+"""
+import argparse
+
+from falcon.cmd.inspect_app import load_app
+from falcon.routing import CompiledRouter
+
+
+def make_parser():
+    """Create the parser or the application."""
+    parser = argparse.ArgumentParser(
+        description='Example: falcon-compile-router myprogram:app -o routes.precompiled'
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='routes.precompiled',
+        help='Path of the file to write (default: routes.precompiled)',
+    )
+    parser.add_argument(
+        'app_module',
+        help='The module and app to compile. Example: myapp.somemodule:api',
+    )
+    return parser
+
+
+def main():
+    parser = make_parser()
+    args = parser.parse_args()
+    app = load_app(parser, args)
+
+    router = app._router
+    if not isinstance(router, CompiledRouter):
+        parser.error(
+            'The app must use the default router (or a subclass of '
+            'falcon.routing.CompiledRouter)'
+        )
+
+    router.save_compiled(args.output)
+    print('Saved the compiled routing logic to {}'.format(args.output))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -1,16 +1,20 @@
 from .base import BaseHandler
+from .buffer import BufferHandler
 from .handlers import Handlers
 from .json import JSONHandler
 from .msgpack import MessagePackHandler
 from .multipart import MultipartFormHandler
+from .ndjson import NDJSONHandler
 from .urlencoded import URLEncodedFormHandler
 
 
 __all__ = [
     'BaseHandler',
+    'BufferHandler',
     'Handlers',
     'JSONHandler',
     'MessagePackHandler',
     'MultipartFormHandler',
+    'NDJSONHandler',
     'URLEncodedFormHandler',
 ]
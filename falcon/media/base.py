@@ -1,6 +1,86 @@
 import abc
 import io
 
+# NOTE: Sentinel yielded by push-style incremental parsers when more input is
+#   needed (see also: _drive_parser()).
+_NEED_DATA = object()
+
+
+def _drive_parser(parser, stream):
+    """Drive a push-style incremental parser by reading from `stream`.
+
+    Iterating over the parser yields either the parsed values, or the
+    :data:`_NEED_DATA` sentinel, in which case up to ``parser.read_size``
+    bytes are read from the stream and fed to the parser (an empty byte
+    string signals the end of the input).
+    """
+
+    for value in parser:
+        if value is _NEED_DATA:
+            parser.feed(stream.read(parser.read_size))
+        else:
+            yield value
+
+
+def _serialize_chunked(media, dumps, chunk_size, prefix=b'', separator=b'', suffix=b''):
+    """Serialize the items of an iterable in chunks of roughly `chunk_size`."""
+
+    chunk = bytearray(prefix)
+    sep = b''
+
+    for item in media:
+        chunk += sep
+        chunk += dumps(item)
+        sep = separator
+
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+
+    chunk += suffix
+    if chunk:
+        yield bytes(chunk)
+
+
+def _iter_sequence_path(records, components):
+    """Yield the values at the given path, treating `records` as an array."""
+
+    if components[:1] != ('item',):
+        yield from _iter_media_path(list(records), components)
+        return
+
+    for record in records:
+        yield from _iter_media_path(record, components[1:])
+
+
+def _parse_media_path(path):
+    """Split a media path (e.g., ``'items.item'``) into its components."""
+    return tuple(path.split('.')) if path else ()
+
+
+def _iter_media_path(media, components):
+    """Yield the values found at the given path within a media object.
+
+    The ``'item'`` path component denotes the elements of an array (i.e.,
+    :class:`list`), while any other component denotes the member of an
+    object (i.e., :class:`dict`) with the matching key. Values whose type
+    does not match the path are skipped.
+    """
+
+    if not components:
+        yield media
+        return
+
+    component, rest = components[0], components[1:]
+
+    if component == 'item':
+        if isinstance(media, list):
+            for item in media:
+                yield from _iter_media_path(item, rest)
+
+    elif isinstance(media, dict) and component in media:
+        yield from _iter_media_path(media[component], rest)
+
 
 class BaseHandler(metaclass=abc.ABCMeta):
     """Abstract Base Class for an internet media type handler."""
@@ -51,6 +131,51 @@ class BaseHandler(metaclass=abc.ABCMeta):
         """
         return self.serialize(media, content_type)
 
+    def serialize_stream(self, media, content_type):
+        """Serialize a sequence of items incrementally.
+
+        This method is used when a generator is assigned to
+        :attr:`falcon.Response.media`, in order to render the items it
+        yields as a single document without materializing the whole
+        document in memory. The default implementation simply collects the
+        items into a :class:`list`, and passes it to
+        :py:meth:`~.BaseHandler.serialize`. Child classes that support
+        incremental serialization should override this method.
+
+        Args:
+            media (iterable): An iterable of serializable items.
+            content_type (str): Type of response content.
+
+        Returns:
+            iterable: An iterable of byte strings making up the serialized
+            document.
+        """
+
+        yield self.serialize(list(media), content_type)
+
+    def serialize_stream_async(self, media, content_type):
+        """Serialize a sequence of items incrementally.
+
+        This method is similar to :py:meth:`~.BaseHandler.serialize_stream`
+        except that it returns an async iterable, and that `media` may also
+        be an async iterable. The default implementation collects the items
+        into a :class:`list`, and passes it to
+        :py:meth:`~.BaseHandler.serialize_async`.
+
+        Args:
+            media (object): An iterable or async iterable of serializable
+                items.
+            content_type (str): Type of response content.
+
+        Returns:
+            object: An async iterable of byte strings making up the
+            serialized document.
+        """
+
+        from falcon.asgi import _media_helpers
+
+        return _media_helpers.serialize_collected(self, media, content_type)
+
     def deserialize(self, stream, content_type, content_length):
         """Deserialize the :any:`falcon.Request` body.
 
@@ -105,6 +230,64 @@ class BaseHandler(metaclass=abc.ABCMeta):
 
         return self.deserialize(io.BytesIO(data), content_type, content_length)
 
+    def deserialize_stream(self, stream, content_type, content_length, path):
+        """Deserialize the :any:`falcon.Request` body incrementally.
+
+        This method is used by :meth:`falcon.Request.iter_media` in order to
+        yield the values found at the given `path` within the request body,
+        one by one. The path consists of dot-separated components, where
+        ``item`` denotes the elements of an array, and any other component
+        denotes the member of an object with the matching name. For
+        instance, ``'items.item'`` refers to the elements of the array
+        found under the ``items`` key of the top-level object.
+
+        The default implementation deserializes the whole body via
+        :py:meth:`~.BaseHandler.deserialize`, and then walks the
+        resulting object. Child classes that are able to parse the body
+        incrementally should override this method.
+
+        Args:
+            stream (object): Readable file-like object to deserialize.
+            content_type (str): Type of request content.
+            content_length (int): Length of request content.
+            path (str): Path to the values to yield.
+
+        Returns:
+            iterable: An iterable of deserialized values.
+        """
+
+        media = self.deserialize(stream, content_type, content_length)
+        return _iter_media_path(media, _parse_media_path(path))
+
+    def deserialize_stream_async(self, stream, content_type, content_length, path):
+        """Deserialize the :any:`falcon.Request` body incrementally.
+
+        This method is similar to
+        :py:meth:`~.BaseHandler.deserialize_stream` except that it returns
+        an async iterable. The default implementation deserializes the whole
+        body via :py:meth:`~.BaseHandler.deserialize_async`.
+
+        Args:
+            stream (object): Asynchronous file-like object to deserialize.
+            content_type (str): Type of request content.
+            content_length (int): Length of request content.
+            path (str): Path to the values to yield.
+
+        Returns:
+            object: An async iterable of deserialized values.
+        """
+
+        from falcon.asgi import _media_helpers
+
+        return _media_helpers.deserialize_path(
+            self, stream, content_type, content_length, path)
+
+    # NOTE: Optional hook allowing a handler to derive the Content-Type of
+    #   the response from the media being serialized (e.g., in order to add
+    #   parameters describing it). If defined, it is called with the media
+    #   object and the current content type, and returns the new one.
+    _get_content_type = None
+
     exhaust_stream = False
     """Whether to exhaust the WSGI input stream upon finishing deserialization.
 
@@ -112,3 +295,16 @@ class BaseHandler(metaclass=abc.ABCMeta):
     consume the whole stream, but the deserialized media object is complete and
     does not involve further streaming.
     """
+
+    offloadable = False
+    """Whether (de)serialization may be offloaded to a pool of workers (ASGI only).
+
+    If ``True``, and either the request body exceeds the
+    ``media_offload_threshold`` request option, or the response media holds
+    at least ``media_offload_min_items`` elements (response option), the
+    synchronous :meth:`~.deserialize` and :meth:`~.serialize` methods are
+    run in a :class:`falcon.asgi.MediaOffloadPool`, rather than awaiting
+    the async ones on the event loop. These methods must then be safe to call from
+    multiple threads concurrently (and the handler must be picklable, if the
+    pool uses processes).
+    """
@@ -0,0 +1,286 @@
+import array
+import cgi
+import io
+import sys
+
+from falcon import errors
+from falcon.media.base import BaseHandler
+
+_NATIVE_BYTE_ORDER = '<' if sys.byteorder == 'little' else '>'
+
+# NOTE: Kinds of the array interface type strings (e.g., '<f8'), keyed by
+#   the corresponding buffer protocol (struct module) format characters.
+_FORMAT_KINDS = {}
+_FORMAT_KINDS.update((char, 'i') for char in 'bhilqn')
+_FORMAT_KINDS.update((char, 'u') for char in 'BHILQN')
+_FORMAT_KINDS.update((char, 'f') for char in 'efd')
+_FORMAT_KINDS['?'] = 'b'
+
+# NOTE: array.array type codes, keyed by (kind, itemsize).
+_TYPECODES = {}
+for _typecode in 'bBhHiIlLqQfd':
+    _TYPECODES.setdefault(
+        (_FORMAT_KINDS[_typecode], array.array(_typecode).itemsize), _typecode)
+
+
+class BufferHandler(BaseHandler):
+    """Handler for raw binary arrays, such as NumPy arrays.
+
+    This handler serializes objects supporting the buffer protocol, such as
+    :class:`bytes`, :class:`memoryview`, :class:`array.array`, or NumPy's
+    ``ndarray``, as their raw (C-ordered) content, rather than converting
+    each element to text. The element type and the shape of the array are
+    conveyed via the ``dtype`` and ``shape`` parameters of the Content-Type
+    header, where ``dtype`` is a type string as used by NumPy's array
+    interface (e.g., ``<f8`` for little-endian 64-bit floats)::
+
+        Content-Type: application/x-array; dtype="<f8"; shape="1000,3"
+
+    When deserializing, the same parameters are read from the request's
+    Content-Type header (`dtype` defaults to the value passed to the
+    initializer, and the array is one-dimensional if `shape` is absent).
+    The array is allocated upfront based on the Content-Length, and the
+    body is read directly into it via ``readinto()``.
+
+    Note:
+        This handler is not registered by default; it needs to be added to
+        the request and/or response media handlers for the desired media
+        type, such as ``application/x-array``::
+
+            buffer_handler = media.BufferHandler(use_numpy=True)
+            app.req_options.media_handlers['application/x-array'] = buffer_handler
+            app.resp_options.media_handlers['application/x-array'] = buffer_handler
+
+        The media type must also be set explicitly on responses, e.g.::
+
+            resp.content_type = 'application/x-array'
+            resp.media = numpy.arange(1000, dtype='float64').reshape(-1, 4)
+
+    Note:
+        Since WSGI and ASGI servers require response bodies to be byte
+        strings, the content of buffers other than :class:`bytes` is copied
+        once into a byte string upon serialization.
+
+    Keyword Arguments:
+        dtype (str): Default element type when deserializing a request
+            body whose Content-Type does not specify one (default
+            ``'|u1'``, i.e., bytes).
+        use_numpy (bool): Set to ``True`` in order to deserialize request
+            bodies into NumPy arrays of the specified shape (default
+            ``False``). Otherwise, a flat :class:`array.array` is
+            returned. Note that NumPy must be installed separately.
+        max_size (int): Maximum size of the request body, in bytes, that
+            may be allocated when deserializing (default ``None``, i.e., no
+            limit). Setting a limit is recommended, since the array is
+            allocated according to the Content-Length header before reading
+            the body. When the length of the body is unknown, no more than
+            ``max_size + 1`` bytes are read before rejecting it.
+    """
+
+    def __init__(self, dtype='|u1', use_numpy=False, max_size=None):
+        self.dtype = dtype
+        self.max_size = max_size
+
+        self._numpy = None
+        if use_numpy:
+            import numpy
+
+            self._numpy = numpy
+
+    def serialize(self, media, content_type):
+        if isinstance(media, bytes):
+            return media
+
+        return _get_view(media).tobytes()
+
+    async def serialize_async(self, media, content_type):
+        return self.serialize(media, content_type)
+
+    def deserialize(self, stream, content_type, content_length):
+        if content_length is None:
+            # NOTE: Read at most one byte past the limit, which suffices for
+            #   _allocate() to reject a body that is too large, without
+            #   buffering the remainder of it.
+            limit = None if self.max_size is None else self.max_size + 1
+            chunks = []
+            while limit is None or limit > 0:
+                chunk = stream.read(limit)
+                if not chunk:
+                    break
+
+                chunks.append(chunk)
+                if limit is not None:
+                    limit -= len(chunk)
+
+            data = b''.join(chunks)
+            content_length = len(data)
+            stream = io.BytesIO(data)
+
+        view, finish = self._allocate(content_type, content_length)
+
+        position = 0
+        while position < content_length:
+            num_bytes = stream.readinto(view[position:])
+            if not num_bytes:
+                break
+
+            position += num_bytes
+
+        if position < content_length:
+            raise _invalid_array('Incomplete request body')
+
+        return finish()
+
+    async def deserialize_async(self, stream, content_type, content_length):
+        if content_length is None:
+            # NOTE: See also the comment in deserialize().
+            limit = None if self.max_size is None else self.max_size + 1
+            chunks = []
+            while limit is None or limit > 0:
+                chunk = await stream.read(limit)
+                if not chunk:
+                    break
+
+                chunks.append(chunk)
+                if limit is not None:
+                    limit -= len(chunk)
+
+            data = b''.join(chunks)
+            return self.deserialize(io.BytesIO(data), content_type, len(data))
+
+        view, finish = self._allocate(content_type, content_length)
+
+        # NOTE: Copy the chunks directly into the array as they arrive,
+        #   rather than joining them into an intermediate byte string.
+        position = 0
+        async for chunk in stream:
+            end = position + len(chunk)
+            if end > content_length:
+                break
+
+            view[position:end] = chunk
+            position = end
+
+        if position < content_length:
+            raise _invalid_array('Incomplete request body')
+
+        return finish()
+
+    def _get_content_type(self, media, content_type):
+        view = _get_view(media)
+        media_type, _ = cgi.parse_header(content_type)
+
+        return '{0}; dtype="{1}"; shape="{2}"'.format(
+            media_type, _get_typestr(view), ','.join(str(dim) for dim in view.shape))
+
+    def _allocate(self, content_type, size):
+        """Allocate an array for the request body.
+
+        Returns:
+            tuple: A writable byte-oriented view of the array, and a function
+            returning the array once it has been filled in.
+        """
+
+        if self.max_size is not None and size > self.max_size:
+            raise errors.HTTPPayloadTooLarge(
+                description='Array exceeds the maximum size of {0} bytes'.format(
+                    self.max_size)
+            )
+
+        _, params = cgi.parse_header(content_type or '')
+        typestr = params.get('dtype', self.dtype)
+        byte_order, kind, itemsize = _parse_typestr(typestr)
+
+        if size % itemsize:
+            raise _invalid_array(
+                'Body size is not a multiple of the item size of {0}'.format(typestr))
+
+        count = size // itemsize
+        shape = _parse_shape(params.get('shape'), count)
+
+        if self._numpy is not None:
+            data = bytearray(size)
+            numpy = self._numpy
+
+            def finish():
+                return numpy.frombuffer(data, dtype=typestr).reshape(shape)
+
+            return memoryview(data), finish
+
+        typecode = _TYPECODES.get((kind, itemsize))
+        if typecode is None:
+            raise _invalid_array('Unsupported dtype: {0}'.format(typestr))
+
+        result = array.array(typecode, [0]) * count
+
+        def finish():
+            if byte_order not in ('|', '=', _NATIVE_BYTE_ORDER):
+                result.byteswap()
+
+            return result
+
+        return memoryview(result).cast('B'), finish
+
+
+def _get_view(media):
+    try:
+        return memoryview(media)
+    except TypeError:
+        raise TypeError(
+            'Object of type {0} does not support the buffer protocol'.format(
+                type(media).__name__))
+
+
+def _get_typestr(view):
+    fmt = view.format
+    byte_order = _NATIVE_BYTE_ORDER
+
+    if len(fmt) > 1 and fmt[0] in '@=<>!':
+        if fmt[0] in '<>!':
+            byte_order = '<' if fmt[0] == '<' else '>'
+
+        fmt = fmt[1:]
+
+    kind = _FORMAT_KINDS.get(fmt)
+    if kind is None:
+        raise TypeError('Unsupported buffer format: {0!r}'.format(view.format))
+
+    if view.itemsize == 1:
+        byte_order = '|'
+
+    return '{0}{1}{2}'.format(byte_order, kind, view.itemsize)
+
+
+def _parse_typestr(typestr):
+    try:
+        byte_order, kind, itemsize = typestr[0], typestr[1], int(typestr[2:])
+    except (IndexError, ValueError):
+        raise _invalid_array('Invalid dtype: {0}'.format(typestr))
+
+    if byte_order not in '<>|=' or kind not in 'biuf' or itemsize < 1:
+        raise _invalid_array('Invalid dtype: {0}'.format(typestr))
+
+    return byte_order, kind, itemsize
+
+
+def _parse_shape(shape, count):
+    if not shape:
+        return (count,)
+
+    try:
+        dims = tuple(int(dim) for dim in shape.split(','))
+    except ValueError:
+        raise _invalid_array('Invalid shape: {0}'.format(shape))
+
+    product = 1
+    for dim in dims:
+        product *= dim
+
+    if product != count or any(dim < 0 for dim in dims):
+        raise _invalid_array('Shape {0} does not match the body size'.format(shape))
+
+    return dims
+
+
+def _invalid_array(description):
+    return errors.HTTPBadRequest(title='Invalid array', description=description)
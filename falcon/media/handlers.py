@@ -8,10 +8,25 @@ from falcon.media.urlencoded import URLEncodedFormHandler
 from falcon.vendor import mimeparse
 
 
+_FORM_MEDIA_TYPES = frozenset((MEDIA_MULTIPART, MEDIA_URLENCODED))
+
+
 class Handlers(UserDict):
     """A :class:`dict`-like object that manages Internet media type handlers."""
 
+    # NOTE: Upper bound on the number of distinct media type strings
+    #   whose resolution is memoized by find_by_media_type(). The cache is
+    #   simply reset once this limit is reached, since in practice the set of
+    #   media types seen by an app is small, and anything beyond that is more
+    #   likely to be the result of clients varying the type's parameters.
+    _MAX_RESOLVED_MEDIA_TYPES = 64
+
     def __init__(self, initial=None):
+        # NOTE: Must be set before calling UserDict.__init__(), since
+        #   self.update(...) results in __setitem__() being called.
+        self._resolved_media_types = {}
+        self._serializable_media_types = None
+
         handlers = initial or {
             'application/json': JSONHandler(),
             'application/json; charset=UTF-8': JSONHandler(),
@@ -23,6 +38,50 @@ class Handlers(UserDict):
         # Also, this results in self.update(...) being called.
         UserDict.__init__(self, handlers)
 
+    def __setitem__(self, key, item):
+        self._resolved_media_types.clear()
+        self._serializable_media_types = None
+        self.data[key] = item
+
+    def __delitem__(self, key):
+        self._resolved_media_types.clear()
+        self._serializable_media_types = None
+        del self.data[key]
+
+    def __copy__(self):
+        # NOTE: UserDict only implements __copy__() as of Python 3.7, so the
+        #   copy is assembled here in the same way. The caches are not
+        #   shared with the copy, since either dict may change later on.
+        inst = self.__class__.__new__(self.__class__)
+        inst.__dict__.update(self.__dict__)
+        inst.data = self.data.copy()
+        inst._resolved_media_types = {}
+        inst._serializable_media_types = None
+        return inst
+
+    def _get_serializable_media_types(self, default_media_type):
+        """Return the media types that are eligible for content negotiation.
+
+        Form media types are excluded, since these are used for request
+        bodies rather than for response representations. The default media
+        type, if registered, is listed last so that it is preferred in the
+        case of a tie (see also: :meth:`falcon.Request.client_prefers`).
+        """
+
+        cached = self._serializable_media_types
+        if cached is None or cached[0] != default_media_type:
+            media_types = [
+                media_type for media_type in self.data
+                if media_type not in _FORM_MEDIA_TYPES and media_type != default_media_type
+            ]
+            if default_media_type in self.data:
+                media_types.append(default_media_type)
+
+            cached = (default_media_type, tuple(media_types))
+            self._serializable_media_types = cached
+
+        return cached[1]
+
     def _resolve_media_type(self, media_type, all_media_types):
         resolved = None
 
@@ -48,8 +107,19 @@ class Handlers(UserDict):
         except KeyError:
             pass
 
-        # PERF(jmvrbanac): Fallback to the slower method
-        resolved = self._resolve_media_type(media_type, self.data.keys())
+        # PERF: Remember the outcome of the slower method below (be
+        #   it a match or not) for each distinct media type string, since
+        #   parsing with mimeparse is comparatively expensive. The cache is
+        #   invalidated whenever a handler is added or removed.
+        try:
+            resolved = self._resolved_media_types[media_type]
+        except KeyError:
+            # PERF(jmvrbanac): Fallback to the slower method
+            resolved = self._resolve_media_type(media_type, self.data.keys())
+
+            if len(self._resolved_media_types) >= self._MAX_RESOLVED_MEDIA_TYPES:
+                self._resolved_media_types.clear()
+            self._resolved_media_types[media_type] = resolved
 
         if not resolved:
             raise errors.HTTPUnsupportedMediaType(
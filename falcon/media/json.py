@@ -1,9 +1,15 @@
+import codecs
 from functools import partial
 
 from falcon import errors
-from falcon.media import BaseHandler
+from falcon.media.base import (
+    _drive_parser, _NEED_DATA, _parse_media_path, _serialize_chunked, BaseHandler)
+from falcon.media.models import encode_model
 from falcon.util import json
 
+_WHITESPACE = frozenset(' \t\n\r')
+_NUMBER_TERMINATORS = frozenset(' \t\n\r,]}')
+
 
 class JSONHandler(BaseHandler):
     """JSON media handler.
@@ -60,13 +66,50 @@ class JSONHandler(BaseHandler):
             ),
         )
 
+    Instances of dataclasses and attrs classes are serialized by the default
+    ``dumps`` function as objects of their fields, using an encoder that is
+    generated and cached per class. When overriding ``dumps``, the same
+    behavior can be obtained by passing
+    :func:`falcon.media.models.encode_model` as the ``default`` hook, if the
+    JSON library supports one (note that `orjson` natively serializes
+    dataclasses)::
+
+        from falcon.media.models import encode_model
+
+        json_handler = media.JSONHandler(
+            dumps=partial(rapidjson.dumps, default=encode_model),
+        )
+
+    When a generator is assigned to :attr:`falcon.Response.media` (or, in
+    the case of ASGI, also an async generator), the items it yields are
+    serialized one by one into a JSON array that is streamed to the client
+    in chunks of roughly 64 KiB, rather than being rendered in its entirety
+    in memory (see also: :meth:`~.serialize_stream`).
+
+    Conversely, large request bodies can be parsed incrementally via
+    :meth:`falcon.Request.iter_media` (see also:
+    :meth:`~.deserialize_stream`). Note that the standard library's JSON
+    decoder is always used in that case, regardless of `loads`.
+
     Keyword Arguments:
         dumps (func): Function to use when serializing JSON responses.
         loads (func): Function to use when deserializing JSON requests.
     """
 
+    offloadable = True
+
+    # NOTE: Target size of the chunks emitted by the streaming serializer.
+    #   Individual items that are larger than this are not split.
+    _STREAM_CHUNK_SIZE = 64 * 1024
+
+    # NOTE: Number of items of a top-level array that the default dumps()
+    #   function serializes at a time when offloaded (see also:
+    #   _serialize_offloaded()).
+    _SLICE_SIZE = 1024
+
     def __init__(self, dumps=None, loads=None):
-        self.dumps = dumps or partial(json.dumps, ensure_ascii=False)
+        self._slice_arrays = dumps is None
+        self.dumps = dumps or partial(json.dumps, ensure_ascii=False, default=encode_model)
         self.loads = loads or json.loads
 
     def deserialize(self, stream, content_type, content_length):
@@ -110,3 +153,381 @@ class JSONHandler(BaseHandler):
             return result.encode('utf-8')
 
         return result
+
+    def serialize_stream(self, media, content_type):
+        """Serialize an iterable of items as a JSON array, incrementally.
+
+        Args:
+            media (iterable): An iterable of JSON-serializable items.
+            content_type (str): Type of response content.
+
+        Returns:
+            iterable: An iterable of consecutive chunks of the JSON array.
+        """
+
+        return _serialize_chunked(
+            media, self._dumps_bytes, self._STREAM_CHUNK_SIZE, b'[', b',', b']')
+
+    def serialize_stream_async(self, media, content_type):
+        """Serialize an iterable of items as a JSON array, incrementally.
+
+        Args:
+            media (object): An iterable or async iterable of
+                JSON-serializable items.
+            content_type (str): Type of response content.
+
+        Returns:
+            object: An async iterable of consecutive chunks of the JSON
+            array.
+        """
+
+        from falcon.asgi import _media_helpers
+
+        if not hasattr(media, '__aiter__'):
+            return _media_helpers.iterate(self.serialize_stream(media, content_type))
+
+        return _media_helpers.serialize_chunked(
+            media, self._dumps_bytes, self._STREAM_CHUNK_SIZE, b'[', b',', b']')
+
+    def deserialize_stream(self, stream, content_type, content_length, path):
+        """Parse the values at the given path within the JSON body, incrementally.
+
+        The body is read and tokenized in chunks, and each value found at
+        `path` is yielded as soon as it has been parsed, so that memory use
+        is proportional to the largest value rather than to the whole
+        document. Note, however, that any other values encountered along the
+        way (e.g., object members preceding the path) are still decoded in
+        full before being discarded.
+
+        Args:
+            stream (object): Readable file-like object to deserialize.
+            content_type (str): Type of request content.
+            content_length (int): Length of request content.
+            path (str): Path to the values to yield (see also:
+                :meth:`falcon.media.BaseHandler.deserialize_stream`).
+
+        Returns:
+            iterable: An iterable of deserialized values.
+        """
+
+        return _drive_parser(_IncrementalJSONParser(path), stream)
+
+    def deserialize_stream_async(self, stream, content_type, content_length, path):
+        """Parse the values at the given path within the JSON body, incrementally.
+
+        This method is similar to :meth:`~.deserialize_stream`, except that
+        it returns an async iterable reading from an asynchronous stream.
+
+        Args:
+            stream (object): Asynchronous file-like object to deserialize.
+            content_type (str): Type of request content.
+            content_length (int): Length of request content.
+            path (str): Path to the values to yield.
+
+        Returns:
+            object: An async iterable of deserialized values.
+        """
+
+        from falcon.asgi import _media_helpers
+
+        return _media_helpers.drive_parser(_IncrementalJSONParser(path), stream)
+
+    def _serialize_offloaded(self, media, content_type):
+        """Serialize media in a worker of a MediaOffloadPool."""
+
+        # NOTE: Defer to serialize() when it is overridden by a subclass, or
+        #   when the array is short enough to be serialized at once.
+        if (
+            not self._slice_arrays or type(self).serialize is not JSONHandler.serialize or
+            type(media) is not list or len(media) <= self._SLICE_SIZE
+        ):
+            return self.serialize(media, content_type)
+
+        # PERF: The standard library's C encoder holds the GIL until the whole
+        #   document has been rendered, which would stall the event loop for
+        #   the duration when serializing in a worker thread (see also:
+        #   falcon.asgi.MediaOffloadPool). Serializing long arrays in slices
+        #   lets other threads run in between, while yielding the same output
+        #   at a comparable speed.
+        dumps = self.dumps
+        size = self._SLICE_SIZE
+        return ('[' + ', '.join(
+            dumps(media[start:start + size])[1:-1] for start in range(0, len(media), size)
+        ) + ']').encode('utf-8')
+
+    def _dumps_bytes(self, media):
+        result = self.dumps(media)
+
+        if not isinstance(result, bytes):
+            return result.encode('utf-8')
+
+        return result
+
+
+class _IncrementalJSONParser:
+    """Push-style JSON parser yielding the values found at a given path.
+
+    Iterating over the parser yields either the parsed values, or the
+    :data:`_NEED_DATA` sentinel, in which case the caller must
+    :meth:`feed` the next chunk of input (an empty chunk denoting the EOF)
+    before resuming iteration. This allows the same parser to be driven by
+    both synchronous and asynchronous streams.
+
+    Rather than tokenizing the input character by character, the parser
+    only walks the structure along the requested path, and decodes whole
+    values with :meth:`json.JSONDecoder.raw_decode`.
+    """
+
+    # NOTE: Whenever a value does not fit into the buffered input, decoding
+    #   is not reattempted until the amount of buffered input has doubled, in
+    #   order to avoid decoding large values over and over again (i.e.,
+    #   quadratic complexity).
+    _MIN_READ_SIZE = 64 * 1024
+
+    def __init__(self, path):
+        self._components = _parse_media_path(path)
+        self._decoder = json.JSONDecoder()
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+        # NOTE: Number of chars that were discarded from the buffer, which
+        #   must be added to self._pos in order to report error positions
+        #   relative to the whole document.
+        self._offset = 0
+
+        self.read_size = self._MIN_READ_SIZE
+
+    def __iter__(self):
+        yield from self._walk(self._components)
+        yield from self._end()
+
+    def feed(self, data):
+        try:
+            text = self._utf8_decoder.decode(data, final=not data)
+        except UnicodeDecodeError as err:
+            raise self._error(err)
+
+        if not data:
+            self._eof = True
+
+        # PERF: Discard the input that has already been consumed.
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._offset += self._pos
+            self._pos = 0
+
+        self._buffer += text
+
+    def _error(self, description):
+        return errors.HTTPBadRequest(
+            title='Invalid JSON',
+            description='Could not parse JSON body - {0}'.format(description)
+        )
+
+    def _peek(self):
+        """Return the next non-whitespace char, or None if more input is needed."""
+
+        buffer = self._buffer
+        pos = self._pos
+        length = len(buffer)
+
+        while pos < length and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+        if pos < length:
+            return buffer[pos]
+        if self._eof:
+            raise self._error('unexpected end of document')
+
+        return None
+
+    def _end(self):
+        """Ensure that nothing but whitespace follows the top-level value."""
+
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            length = len(buffer)
+
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+
+            if pos < length:
+                raise self._error('extra data at char {0}'.format(self._offset + pos))
+            if self._eof:
+                return
+
+            yield _NEED_DATA
+
+    def _skip_whitespace(self):
+        # PERF: Avoid suspending the generator in the common case that the
+        #   next char has already been buffered.
+        char = self._peek()
+        while char is None:
+            yield _NEED_DATA
+            char = self._peek()
+
+        return char
+
+    def _expect(self, *chars):
+        char = self._peek()
+        if char is None:
+            char = yield from self._skip_whitespace()
+
+        if char not in chars:
+            raise self._error('expecting {0} at char {1}, found {2!r}'.format(
+                ' or '.join(repr(c) for c in chars), self._offset + self._pos, char))
+
+        self._pos += 1
+        return char
+
+    def _value(self):
+        while True:
+            if self._peek() is None:
+                yield _NEED_DATA
+                continue
+
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError as err:
+                if self._eof:
+                    # NOTE: The position reported by the decoder is relative
+                    #   to the buffered input, rather than to the document.
+                    if isinstance(err, json.JSONDecodeError):
+                        err = '{0} (char {1})'.format(err.msg, self._offset + err.pos)
+
+                    raise self._error(err)
+            else:
+                # NOTE: A number may continue in the next chunk, unless it is
+                #   followed by a terminating character (note that the
+                #   decoder happily returns 1 for '1.', for instance).
+                if self._eof or (
+                    end < len(self._buffer) and (
+                        not isinstance(value, (int, float)) or
+                        self._buffer[end] in _NUMBER_TERMINATORS
+                    )
+                ):
+                    self._pos = end
+                    self.read_size = self._MIN_READ_SIZE
+                    return value
+
+            wanted = max(2 * (len(self._buffer) - self._pos), self._MIN_READ_SIZE)
+            while not self._eof and len(self._buffer) - self._pos < wanted:
+                self.read_size = wanted - (len(self._buffer) - self._pos)
+                yield _NEED_DATA
+
+    def _scan_items(self):
+        """Decode the array items that are already buffered.
+
+        This is a fast path for the common case of iterating over the
+        elements of an array, that avoids the overhead of suspending and
+        resuming generators for every item. Decoding stops as soon as an
+        item (or its trailing separator) is incomplete or invalid, leaving it
+        to the regular code path to either request more input or raise an
+        error, as appropriate.
+
+        Returns:
+            tuple: A ``(values, done)`` tuple, where `done` is ``True`` if the
+            end of the array has been reached.
+        """
+
+        raw_decode = self._decoder.raw_decode
+        buffer = self._buffer
+        pos = self._pos
+        length = len(buffer)
+        values = []
+
+        while True:
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+
+            try:
+                value, end = raw_decode(buffer, pos)
+            except ValueError:
+                break
+
+            while end < length and buffer[end] in _WHITESPACE:
+                end += 1
+            if end >= length:
+                break
+
+            char = buffer[end]
+            if char == ',':
+                values.append(value)
+                pos = end + 1
+            elif char == ']':
+                values.append(value)
+                self._pos = end + 1
+                return values, True
+            else:
+                break
+
+        self._pos = pos
+        return values, False
+
+    def _walk(self, components):
+        if not components:
+            value = yield from self._value()
+            yield value
+            return
+
+        component, rest = components[0], components[1:]
+        char = yield from self._skip_whitespace()
+
+        if component == 'item':
+            if char != '[':
+                yield from self._value()
+                return
+
+            self._pos += 1
+            char = yield from self._skip_whitespace()
+            if char == ']':
+                self._pos += 1
+                return
+
+            while True:
+                if rest:
+                    yield from self._walk(rest)
+                else:
+                    values, done = self._scan_items()
+                    yield from values
+                    if done:
+                        return
+
+                    value = yield from self._value()
+                    yield value
+
+                char = yield from self._expect(',', ']')
+                if char == ']':
+                    return
+
+        if char != '{':
+            yield from self._value()
+            return
+
+        self._pos += 1
+        char = yield from self._skip_whitespace()
+        if char == '}':
+            self._pos += 1
+            return
+
+        while True:
+            key = yield from self._value()
+            if not isinstance(key, str):
+                raise self._error('expecting property name at char {0}'.format(
+                    self._offset + self._pos))
+
+            yield from self._expect(':')
+
+            if key == component:
+                yield from self._walk(rest)
+            else:
+                yield from self._value()
+
+            char = yield from self._expect(',', '}')
+            if char == '}':
+                return
@@ -0,0 +1,296 @@
+"""Compiled encoders and decoders for typed media models.
+
+Media models are :mod:`dataclasses` or `attrs <https://www.attrs.org/>`_
+classes. For each model class, the functions below generate (and cache) a
+specialized encoder that renders instances as :class:`dict` objects, and a
+decoder that builds instances from deserialized media, converting nested
+models along the way according to the fields' type annotations.
+"""
+
+import typing
+
+from falcon import errors
+
+try:
+    import dataclasses
+except ImportError:  # pragma: nocover
+    # NOTE: dataclasses are only available in the stdlib as of Python 3.7.
+    dataclasses = None
+
+
+_ENCODERS = {}
+_DECODERS = {}
+_CONVERTERS = {}
+
+# NOTE: Depending on the Python version, the __origin__ of List[X] and
+#   Dict[K, V] is either the builtin type or the typing alias.
+_LIST_TYPES = frozenset((list, typing.List))
+_DICT_TYPES = frozenset((dict, typing.Dict))
+
+
+def is_model(cls):
+    """Return ``True`` if `cls` is a dataclass or an attrs class."""
+    if not isinstance(cls, type):
+        return False
+
+    if getattr(cls, '__attrs_attrs__', None) is not None:
+        return True
+
+    return dataclasses is not None and dataclasses.is_dataclass(cls)
+
+
+def encode_model(obj):
+    """Render a model instance as a :class:`dict` of its fields.
+
+    This function is suitable for use as the ``default`` hook of
+    :func:`json.dumps` and of :class:`msgpack.Packer`, both of which call it
+    for each object that they do not know how to serialize natively. Since
+    the values of the returned :class:`dict` are not converted, nested models
+    are encoded in turn by further invocations of the hook.
+
+    Args:
+        obj (object): Model instance to encode.
+
+    Returns:
+        dict: The fields of the model instance, keyed by name.
+
+    Raises:
+        TypeError: `obj` is not an instance of a model class.
+    """
+
+    cls = type(obj)
+
+    try:
+        encoder = _ENCODERS[cls]
+    except KeyError:
+        if not is_model(cls):
+            raise TypeError('Object of type {0} is not serializable'.format(cls.__name__))
+
+        encoder = _ENCODERS[cls] = _compile_encoder(cls)
+
+    return encoder(obj)
+
+
+def decode_media(media, into):
+    """Convert deserialized media to the given type.
+
+    Args:
+        media (object): Deserialized media, as returned by a media handler.
+        into (type): Target type. This may be either a model class, or a
+            :class:`list` or :class:`dict` (e.g., ``List[Model]``, or
+            ``Dict[str, Model]``) or :data:`~typing.Optional` thereof.
+
+    Returns:
+        object: The converted media.
+
+    Raises:
+        falcon.HTTPBadRequest: The media does not match the structure of the
+            target type.
+    """
+
+    return _get_converter(into)(media)
+
+
+def _get_decoder(cls):
+    try:
+        return _DECODERS[cls]
+    except KeyError:
+        pass
+
+    # NOTE: Register a trampoline first, so that recursive references to
+    #   cls found while compiling its decoder resolve to the final one.
+    _DECODERS[cls] = lambda media: _DECODERS[cls](media)
+
+    try:
+        decoder = _DECODERS[cls] = _compile_decoder(cls)
+    except Exception:
+        del _DECODERS[cls]
+        raise
+
+    return decoder
+
+
+def _get_converter(tp):
+    try:
+        return _CONVERTERS[tp]
+    except KeyError:
+        pass
+    except TypeError:
+        # NOTE: Some annotations are unhashable; do not cache those.
+        return _build_converter(tp)
+
+    converter = _CONVERTERS[tp] = _build_converter(tp)
+    return converter
+
+
+def _build_converter(tp):
+    """Return a function converting deserialized media to `tp`."""
+
+    if is_model(tp):
+        return _get_decoder(tp)
+
+    origin = getattr(tp, '__origin__', None)
+    args = [arg for arg in (getattr(tp, '__args__', None) or ()) if arg is not type(None)]
+
+    if origin is typing.Union and len(args) == 1:
+        convert = _get_converter(args[0])
+        return lambda media: None if media is None else convert(media)
+
+    if origin in _LIST_TYPES and args:
+        convert = _get_converter(args[0])
+
+        def convert_list(media):
+            if not isinstance(media, list):
+                raise _invalid_media('Expected an array')
+            return [convert(item) for item in media]
+
+        return convert_list
+
+    if origin in _DICT_TYPES and len(args) == 2:
+        convert = _get_converter(args[1])
+
+        def convert_dict(media):
+            if not isinstance(media, dict):
+                raise _invalid_media('Expected an object')
+            return {key: convert(value) for key, value in media.items()}
+
+        return convert_dict
+
+    # NOTE: Any other values are passed through as deserialized.
+    return _identity
+
+
+def _identity(media):
+    return media
+
+
+def _get_fields(cls):
+    """Return (name, init_name, type, required, init) tuples for the model's fields."""
+
+    attrs_fields = getattr(cls, '__attrs_attrs__', None)
+
+    if attrs_fields is not None:
+        # NOTE: attrs is obviously installed if cls is an attrs class.
+        import attr
+
+        return [
+            (
+                field.name,
+                getattr(field, 'alias', None) or field.name.lstrip('_'),
+                field.type,
+                field.default is attr.NOTHING,
+                field.init,
+            )
+            for field in attrs_fields
+        ]
+
+    return [
+        (
+            field.name,
+            field.name,
+            field.type,
+            (
+                field.default is dataclasses.MISSING and
+                field.default_factory is dataclasses.MISSING
+            ),
+            field.init,
+        )
+        for field in dataclasses.fields(cls)
+    ]
+
+
+def _get_field_types(cls):
+    try:
+        return typing.get_type_hints(cls)
+    except Exception:
+        # NOTE: Some forward references could not be resolved; fall back to
+        #   the field types as declared.
+        return {}
+
+
+def _compile_encoder(cls):
+    items = ', '.join(
+        '{0!r}: obj.{0}'.format(field[0]) for field in _get_fields(cls)
+    )
+
+    source = 'def encode(obj):\n    return {{{0}}}\n'.format(items)
+    return _compile(source, 'encode', {}, cls)
+
+
+def _compile_decoder(cls):
+    field_types = _get_field_types(cls)
+    namespace = {
+        'cls': cls,
+        'invalid_media': _invalid_media,
+        'missing_field': _missing_field,
+    }
+
+    # PERF: Required fields are fetched within a single try block, and then
+    #   passed to the constructor as keyword arguments, while only optional
+    #   fields that are present in the media are collected into a dict.
+    fetch = []
+    optional = []
+    arguments = []
+
+    for index, (name, init_name, field_type, required, init) in enumerate(_get_fields(cls)):
+        if not init:
+            continue
+
+        field_type = field_types.get(name, field_type)
+        if isinstance(field_type, str):
+            # NOTE: Unresolved forward reference; pass the value through.
+            field_type = None
+
+        convert = _get_converter(field_type)
+        if convert is _identity:
+            template = '{0}'
+        else:
+            namespace['convert_{0}'.format(index)] = convert
+            template = 'convert_{0}({{0}})'.format(index)
+
+        if required:
+            fetch.append('        value_{0} = media[{1!r}]'.format(index, name))
+            arguments.append('{0}={1}'.format(
+                init_name, template.format('value_{0}'.format(index))))
+        else:
+            optional += [
+                '    if {0!r} in media:'.format(name),
+                '        kwargs[{0!r}] = {1}'.format(
+                    init_name, template.format('media[{0!r}]'.format(name))),
+            ]
+
+    lines = [
+        'def decode(media):',
+        '    if not isinstance(media, dict):',
+        '        raise invalid_media("Expected an object")',
+    ]
+
+    if fetch:
+        lines += ['    try:'] + fetch + [
+            '    except KeyError as ex:',
+            '        raise missing_field(ex)',
+        ]
+
+    if optional:
+        lines += ['    kwargs = {}'] + optional
+        arguments.append('**kwargs')
+
+    lines.append('    return cls({0})'.format(', '.join(arguments)))
+
+    return _compile('\n'.join(lines) + '\n', 'decode', namespace, cls)
+
+
+def _compile(source, name, namespace, cls):
+    filename = '<falcon media {0} for {1}.{2}>'.format(
+        name, cls.__module__, cls.__qualname__)
+
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace[name]
+
+
+def _invalid_media(description):
+    return errors.HTTPBadRequest(title='Invalid media', description=description)
+
+
+def _missing_field(key_error):
+    return _invalid_media('Missing required field "{0}"'.format(key_error.args[0]))
@@ -3,6 +3,10 @@ from __future__ import absolute_import
 
 from falcon import errors
 from falcon.media import BaseHandler
+from falcon.media.base import (
+    _drive_parser, _iter_media_path, _iter_sequence_path, _NEED_DATA,
+    _parse_media_path, _serialize_chunked)
+from falcon.media.models import encode_model
 
 
 class MessagePackHandler(BaseHandler):
@@ -10,7 +14,35 @@ class MessagePackHandler(BaseHandler):
 
     This handler uses ``msgpack.unpackb()`` and ``msgpack.packb()``. The
     MessagePack ``bin`` type is used to distinguish between Unicode strings
-    (of type ``str``) and byte strings (of type ``bytes``).
+    (of type ``str``) and byte strings (of type ``bytes``). Instances of
+    dataclasses and attrs classes are packed as maps of their fields.
+
+    When iterating over the elements of a top-level array via
+    :meth:`falcon.Request.iter_media`, the request body is fed to a
+    ``msgpack.Unpacker`` in chunks, and the elements are yielded one by
+    one as they are unpacked.
+
+    In the `sequence` mode, the body is treated as a sequence of
+    concatenated MessagePack objects (such as a stream of telemetry
+    records) rather than as a single object. The deserialized media object
+    is then an iterator (or, in the case of ASGI, an async iterator) that
+    unpacks the objects incrementally as it is iterated, so that arbitrarily
+    large bodies can be processed without buffering them in memory::
+
+        def on_post(self, req, resp):
+            for record in req.get_media():
+                self._store.add(record)
+
+    Conversely, the media object to serialize must be an iterable of
+    objects in that mode. If a generator (or, in the case of ASGI, an async
+    generator) is assigned to :attr:`falcon.Response.media`, the packed
+    objects are streamed to the client in chunks as they are produced.
+
+    Note:
+        Since the number of elements of a MessagePack array must be known
+        upfront, generators assigned to :attr:`falcon.Response.media` are
+        collected into a list before being packed as an array, unless the
+        handler is in the `sequence` mode.
 
     Note:
         This handler requires the extra ``msgpack`` package (version 0.5.2
@@ -20,18 +52,57 @@ class MessagePackHandler(BaseHandler):
         .. code::
 
             $ pip install msgpack
+
+    Keyword Arguments:
+        sequence (bool): Set to ``True`` in order to (de)serialize sequences
+            of concatenated MessagePack objects (default ``False``). A
+            dedicated handler instance is normally registered in this mode
+            for a separate media type, e.g.::
+
+                msgpack_seq_handler = media.MessagePackHandler(sequence=True)
+                app.req_options.media_handlers['application/x-msgpack-seq'] = (
+                    msgpack_seq_handler)
     """
 
-    def __init__(self):
+    # NOTE: Target size of the chunks emitted by the streaming serializer.
+    #   Individual objects that are larger than this are not split.
+    _STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, sequence=False):
+        self._init_msgpack()
+        self.sequence = sequence
+
+        # NOTE: Sequences are (de)serialized lazily, and therefore cannot be
+        #   offloaded as a whole.
+        self.offloadable = not sequence
+
+    def __getstate__(self):
+        # NOTE: Neither the msgpack module nor the packer can be pickled, as
+        #   is required for offloading to a pool of processes (see also:
+        #   falcon.asgi.MediaOffloadPool). Both are recreated upon unpickling.
+        state = self.__dict__.copy()
+        del state['msgpack']
+        del state['packer']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_msgpack()
+
+    def _init_msgpack(self):
         import msgpack
 
         self.msgpack = msgpack
         self.packer = msgpack.Packer(
             autoreset=True,
             use_bin_type=True,
+            default=encode_model,
         )
 
     def deserialize(self, stream, content_type, content_length):
+        if self.sequence:
+            return _drive_parser(_IncrementalUnpacker(self.msgpack), stream)
+
         try:
             # NOTE(jmvrbanac): Using unpackb since we would need to manage
             # a buffer for Unpacker() which wouldn't gain us much.
@@ -44,6 +115,11 @@ class MessagePackHandler(BaseHandler):
             )
 
     async def deserialize_async(self, stream, content_type, content_length):
+        if self.sequence:
+            from falcon.asgi import _media_helpers
+
+            return _media_helpers.drive_parser(_IncrementalUnpacker(self.msgpack), stream)
+
         data = await stream.read()
 
         try:
@@ -57,8 +133,178 @@ class MessagePackHandler(BaseHandler):
                     err)
             )
 
+    def deserialize_stream(self, stream, content_type, content_length, path):
+        components = _parse_media_path(path)
+
+        if self.sequence:
+            records = self.deserialize(stream, content_type, content_length)
+            return _iter_sequence_path(records, components)
+
+        if components[:1] != ('item',):
+            return super().deserialize_stream(stream, content_type, content_length, path)
+
+        return _drive_parser(_IncrementalUnpacker(self.msgpack, components), stream)
+
+    def deserialize_stream_async(self, stream, content_type, content_length, path):
+        from falcon.asgi import _media_helpers
+
+        components = _parse_media_path(path)
+
+        if self.sequence:
+            return _media_helpers.iter_records_path(
+                self, stream, content_type, content_length, path)
+
+        if components[:1] != ('item',):
+            return super().deserialize_stream_async(
+                stream, content_type, content_length, path)
+
+        return _media_helpers.drive_parser(
+            _IncrementalUnpacker(self.msgpack, components), stream)
+
     def serialize(self, media, content_type):
+        if self.sequence:
+            return b''.join(self.packer.pack(item) for item in media)
+
         return self.packer.pack(media)
 
     async def serialize_async(self, media, content_type):
-        return self.packer.pack(media)
+        return self.serialize(media, content_type)
+
+    def serialize_stream(self, media, content_type):
+        if not self.sequence:
+            return super().serialize_stream(media, content_type)
+
+        return _serialize_chunked(media, self.packer.pack, self._STREAM_CHUNK_SIZE)
+
+    def serialize_stream_async(self, media, content_type):
+        if not self.sequence:
+            return super().serialize_stream_async(media, content_type)
+
+        from falcon.asgi import _media_helpers
+
+        if not hasattr(media, '__aiter__'):
+            return _media_helpers.iterate(self.serialize_stream(media, content_type))
+
+        return _media_helpers.serialize_chunked(
+            media, self.packer.pack, self._STREAM_CHUNK_SIZE)
+
+
+class _IncrementalUnpacker:
+    """Push-style driver of a ``msgpack.Unpacker`` in the feed mode.
+
+    Iterating over the unpacker yields either the unpacked objects, or the
+    :data:`~falcon.media.base._NEED_DATA` sentinel, in which case the
+    caller must :meth:`feed` more data (an empty byte string signals the
+    end of the input).
+
+    If `components` is ``None``, the input is treated as a sequence of
+    concatenated objects, each of which is yielded in turn. Otherwise, the
+    input must consist of a single object, and the values found at the given
+    media path within it are yielded; if the path starts with ``'item'``,
+    and the object is an array, its elements are unpacked one by one.
+    """
+
+    read_size = 64 * 1024
+
+    def __init__(self, msgpack, components=None):
+        self._msgpack = msgpack
+        self._unpacker = msgpack.Unpacker(raw=False)
+        self._components = components
+
+        # NOTE: Since the unpacker consumes the bytes of incomplete objects
+        #   as it goes, keep track of the offset following the last complete
+        #   one in order to detect truncated input.
+        self._bytes_consumed = 0
+        self._bytes_fed = 0
+        self._eof = False
+
+    def __iter__(self):
+        try:
+            if self._components is None:
+                yield from self._iter_sequence()
+            else:
+                yield from self._iter_array()
+        except self._msgpack.BufferFull:
+            raise errors.HTTPPayloadTooLarge(
+                description='MessagePack object exceeds the maximum buffer size')
+        except ValueError as err:
+            raise errors.HTTPBadRequest(
+                title='Invalid MessagePack',
+                description='Could not parse MessagePack body - {0}'.format(
+                    str(err) or type(err).__name__)
+            )
+
+    def feed(self, data):
+        if data:
+            self._unpacker.feed(data)
+            self._bytes_fed += len(data)
+        else:
+            self._eof = True
+
+    def _iter_sequence(self):
+        unpacker = self._unpacker
+
+        while True:
+            # NOTE: In the feed mode, iteration stops as soon as the buffered
+            #   data is exhausted, retaining any incomplete trailing object.
+            for obj in unpacker:
+                self._bytes_consumed = unpacker.tell()
+                yield obj
+
+            if self._eof:
+                self._check_consumed('Unexpected end of data')
+                return
+
+            yield _NEED_DATA
+
+    def _iter_array(self):
+        msgpack = self._msgpack
+        unpacker = self._unpacker
+
+        while True:
+            try:
+                count = unpacker.read_array_header()
+                self._bytes_consumed = unpacker.tell()
+                break
+            except msgpack.OutOfData:
+                yield from self._need_data()
+            except ValueError:
+                # NOTE: The top-level object is not an array; fall back to
+                #   walking the whole object.
+                media = yield from self._unpack()
+                yield from _iter_media_path(media, self._components)
+                yield from self._finish()
+                return
+
+        rest = self._components[1:]
+        for _ in range(count):
+            item = yield from self._unpack()
+            yield from _iter_media_path(item, rest)
+
+        yield from self._finish()
+
+    def _unpack(self):
+        while True:
+            try:
+                obj = self._unpacker.unpack()
+            except self._msgpack.OutOfData:
+                yield from self._need_data()
+            else:
+                self._bytes_consumed = self._unpacker.tell()
+                return obj
+
+    def _need_data(self):
+        if self._eof:
+            raise ValueError('Unexpected end of data')
+
+        yield _NEED_DATA
+
+    def _finish(self):
+        while not self._eof:
+            yield _NEED_DATA
+
+        self._check_consumed('Extra data after the top-level object')
+
+    def _check_consumed(self, message):
+        if self._bytes_consumed != self._bytes_fed:
+            raise ValueError(message)
@@ -0,0 +1,158 @@
+from functools import partial
+
+from falcon import errors
+from falcon import request_helpers
+from falcon.media.base import (
+    _iter_sequence_path, _parse_media_path, _serialize_chunked, BaseHandler)
+from falcon.media.models import encode_model
+from falcon.util import BufferedReader
+from falcon.util import json
+
+
+class NDJSONHandler(BaseHandler):
+    """Newline-delimited JSON (NDJSON, also known as JSON Lines) handler.
+
+    Request bodies are parsed incrementally, one record (line) at a time, as
+    the deserialized media object is iterated, so that arbitrarily large
+    bodies can be processed without buffering them in memory::
+
+        def on_post(self, req, resp):
+            for event in req.get_media():
+                self._store.add(event)
+
+    In the case of ASGI, the media object is an async iterator instead::
+
+        async def on_post(self, req, resp):
+            async for event in await req.get_media():
+                await self._store.add(event)
+
+    When iterating over the request body via
+    :meth:`falcon.Request.iter_media`, the sequence of records is treated as
+    if it were a top-level array, e.g., ``req.iter_media('item.id')`` yields
+    the ``id`` member of each record.
+
+    Blank lines are skipped. The size of any single record is limited by
+    `max_record_size`; exceeding it results in an instance of
+    :class:`~falcon.HTTPPayloadTooLarge` being raised during iteration.
+
+    When serializing, the media object must be an iterable of records, which
+    are rendered as one JSON document per line. If a generator (or, in the
+    case of ASGI, an async generator) is assigned to
+    :attr:`falcon.Response.media`, the records are streamed to the client in
+    chunks as they are produced.
+
+    Note:
+        This handler is not registered by default; it needs to be added to
+        the request and/or response media handlers for a media type such as
+        ``application/x-ndjson``::
+
+            ndjson_handler = media.NDJSONHandler()
+            app.req_options.media_handlers['application/x-ndjson'] = ndjson_handler
+            app.resp_options.media_handlers['application/x-ndjson'] = ndjson_handler
+
+    Keyword Arguments:
+        dumps (func): Function to use when serializing records (default
+            ``json.dumps`` with ``ensure_ascii=False``). The function must
+            not emit newline characters; e.g., indentation must not be used.
+        loads (func): Function to use when deserializing records (default
+            ``json.loads``).
+        max_record_size (int): Maximum size, in bytes, of a single record
+            when deserializing (default 1 MiB).
+    """
+
+    # NOTE: Target size of the chunks emitted by the streaming serializer.
+    #   Individual records that are larger than this are not split.
+    _STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, dumps=None, loads=None, max_record_size=1024 * 1024):
+        self.dumps = dumps or partial(json.dumps, ensure_ascii=False, default=encode_model)
+        self.loads = loads or json.loads
+        self.max_record_size = max_record_size
+
+    def deserialize(self, stream, content_type, content_length):
+        # NOTE: Similar to MultipartForm, use BufferedReader directly on top
+        #   of the WSGI input in order to avoid the overhead of BoundedStream.
+        if not hasattr(stream, 'read_until'):
+            if isinstance(stream, request_helpers.BoundedStream):
+                stream = BufferedReader(stream.stream.read, content_length or 0)
+            else:
+                stream = BufferedReader(stream.read, content_length or 0)
+
+        return self._iter_records(stream)
+
+    async def deserialize_async(self, stream, content_type, content_length):
+        from falcon.asgi.reader import BufferedReader as AsyncBufferedReader
+
+        if not isinstance(stream, AsyncBufferedReader):
+            stream = AsyncBufferedReader(stream)
+
+        from falcon.asgi import _media_helpers
+
+        return _media_helpers.iter_records(self, stream)
+
+    def deserialize_stream(self, stream, content_type, content_length, path):
+        records = self.deserialize(stream, content_type, content_length)
+        return _iter_sequence_path(records, _parse_media_path(path))
+
+    def deserialize_stream_async(self, stream, content_type, content_length, path):
+        from falcon.asgi import _media_helpers
+
+        return _media_helpers.iter_records_path(
+            self, stream, content_type, content_length, path)
+
+    def serialize(self, media, content_type):
+        return b''.join(self._dumps_record(record) for record in media)
+
+    def serialize_stream(self, media, content_type):
+        return _serialize_chunked(media, self._dumps_record, self._STREAM_CHUNK_SIZE)
+
+    def serialize_stream_async(self, media, content_type):
+        from falcon.asgi import _media_helpers
+
+        if not hasattr(media, '__aiter__'):
+            return _media_helpers.iterate(self.serialize_stream(media, content_type))
+
+        return _media_helpers.serialize_chunked(
+            media, self._dumps_record, self._STREAM_CHUNK_SIZE)
+
+    def _dumps_record(self, record):
+        result = self.dumps(record)
+
+        if not isinstance(result, bytes):
+            result = result.encode('utf-8')
+
+        return result + b'\n'
+
+    def _loads_record(self, line):
+        try:
+            return self.loads(line.decode('utf-8'))
+        except ValueError as err:
+            raise errors.HTTPBadRequest(
+                title='Invalid NDJSON',
+                description='Could not parse NDJSON record - {0}'.format(err)
+            )
+
+    def _check_record_size(self, line):
+        if len(line) > self.max_record_size:
+            raise errors.HTTPPayloadTooLarge(
+                description='NDJSON record exceeds the maximum size of {0} bytes'.format(
+                    self.max_record_size)
+            )
+
+    def _iter_records(self, stream):
+        # NOTE: Read at most one byte more than the limit, so that an
+        #   oversized record can be detected without buffering it fully.
+        size = self.max_record_size + 1
+
+        while True:
+            line = stream.read_until(b'\n', size)
+            self._check_record_size(line)
+
+            # NOTE: Consume the delimiter (or detect EOF).
+            delimiter = stream.read(1)
+
+            if line.strip():
+                yield self._loads_record(line)
+
+            if not delimiter:
+                break
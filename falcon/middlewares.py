@@ -1,7 +1,10 @@
-from typing import Iterable, Optional, Union
+from typing import Dict, Iterable, Optional, Union
+import zlib
 
+from .app_helpers import negotiate_media_type
 from .request import Request
 from .response import Response
+from .util.misc import _negotiate_content_codings, http_status_to_code
 
 
 class CORSMiddleware(object):
@@ -118,3 +121,355 @@ class CORSMiddleware(object):
 
     async def process_response_async(self, *args):
         self.process_response(*args)
+
+
+class CompressionMiddleware(object):
+    """Response compression middleware.
+
+    This middleware compresses response bodies using the best content coding
+    that is acceptable to the client, as indicated by the Accept-Encoding
+    request header. The ``gzip`` and ``deflate`` codings are always
+    available, while ``br`` and ``zstd`` are also supported when the
+    `brotli <https://pypi.org/project/Brotli/>`_ and
+    `zstandard <https://pypi.org/project/zstandard/>`_ packages,
+    respectively, are installed.
+
+    Bodies set via :attr:`~falcon.Response.body`,
+    :attr:`~falcon.Response.data` or :attr:`~falcon.Response.media` are
+    compressed in one go, provided that they are at least `min_size` bytes
+    long. Streamed bodies (including async generators in the case of ASGI)
+    are compressed incrementally, chunk by chunk, as they are sent to the
+    client.
+
+    Responses are left alone when they already specify a Content-Encoding or
+    a Content-Range, when they do not have a body, or when their media type
+    is already compressed (e.g., images, audio, video, and archives). The
+    ``Vary: Accept-Encoding`` header is added to all other responses, and
+    any strong entity tag of a compressed response is made weak.
+
+    Keyword Arguments:
+        min_size (int): Minimum size, in bytes, of a non-streamed body to
+            be compressed (default ``1024``).
+        encodings (Iterable[str]): Content codings to use, in order of
+            preference. Supported values are ``'br'``, ``'zstd'``,
+            ``'gzip'`` and ``'deflate'`` (default: all of the codings for
+            which the required packages are installed, in that order).
+        levels (Dict[str, int]): Compression levels to use, keyed by
+            content coding (default ``{'br': 4, 'zstd': 3, 'gzip': 6,
+            'deflate': 6}``).
+        excluded_media_types (Iterable[str]): Media types that are not to
+            be compressed. A wildcard may be used as the subtype (e.g.,
+            ``'video/*'``) in order to exclude a whole media range
+            (default: a selection of common media types that are already
+            compressed).
+    """
+
+    DEFAULT_EXCLUDED_MEDIA_TYPES = frozenset([
+        'application/gzip',
+        'application/octet-stream',
+        'application/pdf',
+        'application/vnd.rar',
+        'application/x-7z-compressed',
+        'application/x-bzip2',
+        'application/x-gzip',
+        'application/x-rar-compressed',
+        'application/x-xz',
+        'application/zip',
+        'application/zstd',
+        'audio/*',
+        'font/woff',
+        'font/woff2',
+        'image/avif',
+        'image/gif',
+        'image/jpeg',
+        'image/png',
+        'image/webp',
+        'text/event-stream',
+        'video/*',
+    ])
+
+    _DEFAULT_LEVELS = {
+        'br': 4,
+        'zstd': 3,
+        'gzip': 6,
+        'deflate': 6,
+    }
+
+    _STREAM_BLOCK_SIZE = 64 * 1024  # 64 KiB
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        encodings: Optional[Iterable[str]] = None,
+        levels: Optional[Dict[str, int]] = None,
+        excluded_media_types: Optional[Iterable[str]] = None,
+    ):
+        self.min_size = min_size
+
+        levels = dict(self._DEFAULT_LEVELS, **(levels or {}))
+
+        if encodings is None:
+            encodings = [
+                encoding for encoding in ('br', 'zstd', 'gzip', 'deflate')
+                if encoding in ('gzip', 'deflate') or _is_importable(_COMPRESSOR_MODULES[encoding])
+            ]
+
+        self._compressor_factories = {}
+        for encoding in encodings:
+            if encoding not in _COMPRESSOR_FACTORIES:
+                raise ValueError('Unsupported content coding: {!r}'.format(encoding))
+
+            self._compressor_factories[encoding] = _COMPRESSOR_FACTORIES[encoding](
+                levels[encoding])
+
+        self.encodings = tuple(self._compressor_factories)
+
+        if excluded_media_types is None:
+            excluded_media_types = self.DEFAULT_EXCLUDED_MEDIA_TYPES
+        excluded_media_types = frozenset(media_type.lower() for media_type in excluded_media_types)
+
+        self._excluded_media_types = frozenset(
+            media_type for media_type in excluded_media_types if not media_type.endswith('/*'))
+        self._excluded_media_ranges = tuple(
+            media_type[:-1] for media_type in excluded_media_types if media_type.endswith('/*'))
+
+    def process_response(self, req: Request, resp: Response, resource, req_succeeded):
+        """Compress the response body, if applicable."""
+
+        encoding = self._negotiate(req, resp)
+        if encoding is None:
+            return
+
+        data = resp.render_body()
+        if data is not None:
+            self._compress_data(resp, encoding, data)
+        elif resp.stream is not None:
+            resp.stream = _compress_stream(
+                self._compressor_factories[encoding](), resp.stream, self._STREAM_BLOCK_SIZE)
+            self._set_content_encoding(resp, encoding)
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Compress the response body, if applicable."""
+
+        # NOTE: Server-sent events must not be buffered by the compressor.
+        if getattr(resp, 'sse', None) is not None:
+            return
+
+        encoding = self._negotiate(req, resp)
+        if encoding is None:
+            return
+
+        data = await resp.render_body()
+        if data is not None:
+            self._compress_data(resp, encoding, data)
+        elif resp.stream is not None:
+            resp.stream = _AsyncCompressedStream(
+                self._compressor_factories[encoding](), resp.stream, self._STREAM_BLOCK_SIZE)
+            self._set_content_encoding(resp, encoding)
+
+    def _negotiate(self, req, resp):
+        if resp.get_header('Content-Encoding') is not None:
+            return None
+
+        if resp.get_header('Content-Range') is not None:
+            return None
+
+        status = http_status_to_code(resp.status)
+        if status < 200 or status in (204, 304):
+            return None
+
+        # NOTE: The media handler, if any, has not been run yet at this
+        #   point, so fall back to the type that it would use. When media
+        #   type negotiation is enabled, it must take place before rendering
+        #   the body below.
+        if resp.options.negotiate_media_type:
+            negotiate_media_type(req, resp)
+
+        media_type = resp.content_type or resp.options.default_media_type
+        media_type = media_type.partition(';')[0].strip().lower()
+
+        if (
+            media_type in self._excluded_media_types or
+            media_type.startswith(self._excluded_media_ranges)
+        ):
+            return None
+
+        # NOTE: Whether or not the response ends up being compressed, its
+        #   representation depends on the Accept-Encoding request header.
+        vary = resp.get_header('Vary')
+        if vary is None:
+            resp.set_header('Vary', 'Accept-Encoding')
+        elif vary.strip() != '*' and 'accept-encoding' not in vary.lower():
+            resp.append_header('Vary', 'Accept-Encoding')
+
+        if req.method == 'HEAD':
+            return None
+
+        accept_encoding = req.get_header('Accept-Encoding')
+        if not accept_encoding:
+            return None
+
+        encodings = _negotiate_content_codings(accept_encoding, self.encodings)
+        return encodings[0] if encodings else None
+
+    def _compress_data(self, resp, encoding, data):
+        if len(data) < self.min_size:
+            return
+
+        compressor = self._compressor_factories[encoding]()
+        compressed = compressor.compress(data) + compressor.flush()
+
+        # NOTE: Don't bother the client with decompressing a body that
+        #   turned out to be incompressible.
+        if len(compressed) >= len(data):
+            return
+
+        resp.body = None
+        resp.data = compressed
+        self._set_content_encoding(resp, encoding)
+
+    def _set_content_encoding(self, resp, encoding):
+        resp.set_header('Content-Encoding', encoding)
+        resp.delete_header('Content-Length')
+
+        # NOTE: A strong validator must change along with the encoding of the
+        #   representation, so we simply weaken it (RFC 7232, Section 2.1).
+        etag = resp.get_header('ETag')
+        if etag is not None and not etag.startswith('W/'):
+            resp.set_header('ETag', 'W/' + etag)
+
+
+class _BrotliCompressor(object):
+    """Adapts a Brotli compressor to the interface of zlib's compressobj()."""
+
+    __slots__ = ('_compressor',)
+
+    def __init__(self, level):
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+def _brotli_factory(level):
+    # NOTE: Fail early if the package is not installed.
+    import brotli  # NOQA
+
+    return lambda: _BrotliCompressor(level)
+
+
+def _zstd_factory(level):
+    import zstandard
+
+    # NOTE: Compressor instances are not thread-safe, so a new one is
+    #   created for each response.
+    return lambda: zstandard.ZstdCompressor(level=level).compressobj()
+
+
+def _gzip_factory(level):
+    return lambda: zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _deflate_factory(level):
+    # NOTE: The deflate content coding is actually the zlib format
+    #   (RFC 7230, Section 4.2.2).
+    return lambda: zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS)
+
+
+_COMPRESSOR_FACTORIES = {
+    'br': _brotli_factory,
+    'zstd': _zstd_factory,
+    'gzip': _gzip_factory,
+    'deflate': _deflate_factory,
+}
+
+_COMPRESSOR_MODULES = {
+    'br': 'brotli',
+    'zstd': 'zstandard',
+}
+
+
+def _is_importable(module_name):
+    try:
+        __import__(module_name)
+    except ImportError:
+        return False
+
+    return True
+
+
+def _compress_stream(compressor, stream, block_size):
+    try:
+        # NOTE: Mirror the heuristic that the App uses to check if the
+        #   stream is file-like.
+        if hasattr(stream, 'read'):
+            chunks = iter(lambda: stream.read(block_size), b'')
+        else:
+            chunks = stream
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+
+        yield compressor.flush()
+
+    finally:
+        if hasattr(stream, 'close'):
+            stream.close()
+
+
+class _AsyncCompressedStream:
+    """Async iterator over the compressed chunks of an ASGI response stream.
+
+    NOTE: This is implemented as a class rather than as an async generator
+        in order to keep this module importable under Python 3.5.
+    """
+
+    def __init__(self, compressor, stream, block_size):
+        self._compressor = compressor
+        self._stream = stream
+        self._block_size = block_size
+        self._iterator = None if hasattr(stream, 'read') else stream.__aiter__()
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._exhausted:
+            chunk = await self._read_chunk()
+
+            if chunk is None:
+                self._exhausted = True
+                return self._compressor.flush()
+
+            if chunk:
+                compressed = self._compressor.compress(chunk)
+                if compressed:
+                    return compressed
+
+        raise StopAsyncIteration
+
+    async def close(self):
+        if hasattr(self._stream, 'close'):
+            await self._stream.close()
+
+    async def _read_chunk(self):
+        if self._iterator is None:
+            chunk = await self._stream.read(self._block_size)
+            return None if chunk == b'' else chunk
+
+        try:
+            # NOTE: As in the App, None signals the end of the stream.
+            return await self._iterator.__anext__()
+        except StopAsyncIteration:
+            return None
@@ -22,11 +22,11 @@ from falcon import util
 from falcon.forwarded import _parse_forwarded_header
 from falcon.forwarded import Forwarded  # NOQA
 from falcon.media import Handlers
+from falcon.media.models import decode_media
 from falcon.util import json
 from falcon.util import structures
 from falcon.util.misc import isascii
 from falcon.util.uri import parse_host, parse_query_string
-from falcon.vendor import mimeparse
 
 DEFAULT_ERROR_LOG_FORMAT = ('{0:%Y-%m-%d %H:%M:%S} [FALCON] [ERROR]'
                             ' {1} {2}{3} => ')
@@ -396,7 +396,9 @@ class Request:
         params (dict): The mapping of request query parameter names to their
             values.  Where the parameter appears multiple times in the query
             string, the value mapped to that parameter key will be a list of
-            all the values in the order seen.
+            all the values in the order seen. The query string is parsed the
+            first time the params are accessed, either via this attribute or
+            one of the ``get_param*()`` methods.
 
         options (dict): Set of global options passed from the App handler.
     """
@@ -411,8 +413,8 @@ class Request:
         '_cached_headers',
         '_cached_prefix',
         '_cached_relative_uri',
+        '_cached_params',
         '_cached_uri',
-        '_params',
         '_wsgierrors',
         'content_type',
         'context',
@@ -428,6 +430,7 @@ class Request:
 
     _cookies = None
     _cookies_collapsed = None
+    _cached_accept = None
     _cached_if_match = None
     _cached_if_none_match = None
 
@@ -478,17 +481,10 @@ class Request:
             self.query_string = env['QUERY_STRING']
         except KeyError:
             self.query_string = ''
-            self._params = {}
-        else:
-            if self.query_string:
-                self._params = parse_query_string(
-                    self.query_string,
-                    keep_blank=self.options.keep_blank_qs_values,
-                    csv=self.options.auto_parse_qs_csv,
-                )
 
-            else:
-                self._params = {}
+        # PERF: Parsing the query string is deferred until the params are
+        #   first accessed, since many responders never look at them.
+        self._cached_params = None
 
         self._cached_access_route = None
         self._cached_forwarded = None
@@ -872,7 +868,17 @@ class Request:
 
     @property
     def params(self):
-        return self._params
+        if self._cached_params is None:
+            if self.query_string:
+                self._cached_params = parse_query_string(
+                    self.query_string,
+                    keep_blank=self.options.keep_blank_qs_values,
+                    csv=self.options.auto_parse_qs_csv,
+                )
+            else:
+                self._cached_params = {}
+
+        return self._cached_params
 
     @property
     def cookies(self):
@@ -972,7 +978,7 @@ class Request:
 
         return netloc_value
 
-    def get_media(self):
+    def get_media(self, into=None):
         """Return a deserialized form of the request stream.
 
         The first time this method is called, the request stream will be
@@ -988,11 +994,33 @@ class Request:
 
         See also :ref:`media` for more information regarding media handling.
 
+        If `into` is specified, the deserialized media is additionally
+        converted to the given type, such as a dataclass or an attrs class.
+        Nested models, as well as lists and dicts thereof, are converted
+        according to the fields' type annotations; other values are passed
+        through as deserialized. The decoder for each class is generated
+        once, and then cached::
+
+            order = req.get_media(into=Order)
+            orders = req.get_media(into=List[Order])
+
+        Keys that do not correspond to any field are ignored, while a
+        missing required field results in a 400 Bad Request error.
+
         Warning:
             This operation will consume the request stream the first time
             it's called and cache the results. Follow-up calls will just
             retrieve a cached version of the object.
+
+        Keyword Arguments:
+            into (type): Type to convert the deserialized media to (default
+                ``None``). This may be a dataclass or an attrs class, or
+                :class:`~typing.List`, :class:`~typing.Dict`, or
+                :data:`~typing.Optional` thereof.
         """
+        if into is not None:
+            return decode_media(self.get_media(), into)
+
         if self._media is not None or self.bounded_stream.eof:
             return self._media
 
@@ -1015,6 +1043,52 @@ class Request:
 
     media = property(get_media)
 
+    def iter_media(self, path='item'):
+        """Iterate over the values found at the given path within the request body.
+
+        Unlike :meth:`~.get_media`, this method parses the request stream
+        incrementally (if supported by the matched media handler), yielding
+        each value found at `path` as soon as it is complete. This allows
+        processing very large documents while keeping memory use proportional
+        to a single value, rather than to the whole document::
+
+            # Request body: {"items": [{"id": 1}, {"id": 2}, ...]}
+            for item in req.iter_media('items.item'):
+                process(item)
+
+        The path consists of dot-separated components, where ``item`` denotes
+        the elements of an array, and any other component denotes the member
+        of an object with the matching name (see also:
+        :meth:`falcon.media.BaseHandler.deserialize_stream`).
+
+        Warning:
+            The request stream is consumed as the returned iterator is
+            advanced. The deserialized values are not cached, and so this
+            method cannot be combined with :meth:`~.get_media`.
+
+        Keyword Args:
+            path (str): Path to the values to yield (default ``'item'``, i.e.,
+                the elements of the top-level array).
+
+        Returns:
+            iterator: An iterator over the deserialized values.
+        """
+
+        if self.bounded_stream.eof:
+            return iter(())
+
+        handler = self.options.media_handlers.find_by_media_type(
+            self.content_type,
+            self.options.default_media_type
+        )
+
+        return iter(handler.deserialize_stream(
+            self.bounded_stream,
+            self.content_type,
+            self.content_length,
+            path
+        ))
+
     # ------------------------------------------------------------------------
     # Methods
     # ------------------------------------------------------------------------
@@ -1039,10 +1113,7 @@ class Request:
             return True
 
         # Fall back to full-blown parsing
-        try:
-            return mimeparse.quality(media_type, accept) != 0.0
-        except ValueError:
-            return False
+        return self._get_accepted_media_ranges().quality_and_fitness(media_type)[0] != 0.0
 
     def client_prefers(self, media_types):
         """Return the client's preferred media type, given several choices.
@@ -1058,14 +1129,7 @@ class Request:
             of the given types.
         """
 
-        try:
-            # NOTE(kgriffs): best_match will return '' if no match is found
-            preferred_type = mimeparse.best_match(media_types, self.accept)
-        except ValueError:
-            # Value for the accept header was not formatted correctly
-            preferred_type = ''
-
-        return (preferred_type if preferred_type else None)
+        return self._get_accepted_media_ranges().best_match(media_types)
 
     def get_header(self, name, required=False, default=None):
         """Retrieve the raw string value for the given header.
@@ -1230,7 +1294,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1290,7 +1354,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1361,7 +1425,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1435,7 +1499,7 @@ class Request:
                 be converted to a ``UUID``.
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1506,7 +1570,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1576,7 +1640,7 @@ class Request:
 
         """
 
-        params = self._params
+        params = self.params
 
         # PERF: Use if..in since it is a good all-around performer; we don't
         #       know how likely params are to be specified by clients.
@@ -1760,7 +1824,7 @@ class Request:
 
         """
 
-        if name in self._params:
+        if name in self.params:
             return True
         else:
             return False
@@ -1792,6 +1856,14 @@ class Request:
     # Helpers
     # ------------------------------------------------------------------------
 
+    def _get_accepted_media_ranges(self):
+        # PERF: The parsed media ranges are cached both per request, and
+        #   across requests by the Accept header value (in an LRU).
+        if self._cached_accept is None:
+            self._cached_accept = helpers._parse_accept(self.accept)
+
+        return self._cached_accept
+
     def _get_wrapped_wsgi_input(self):
         try:
             content_length = self.content_length or 0
@@ -1831,7 +1903,7 @@ class Request:
                 csv=self.options.auto_parse_qs_csv,
             )
 
-            self._params.update(extra_params)
+            self.params.update(extra_params)
 
 
 # PERF: To avoid typos and improve storage space and speed over a dict.
@@ -1921,6 +1993,20 @@ class RequestOptions:
             media-types to handle. By default, handlers are provided for the
             ``application/json``, ``application/x-www-form-urlencoded`` and
             ``multipart/form-data`` media types.
+
+        media_offload_threshold (int): ASGI only. Set to a number of bytes in
+            order to deserialize request bodies whose Content-Length exceeds
+            it in :attr:`media_offload_pool`, rather than on the event loop
+            (default ``None``, i.e., media is never offloaded). Only handlers
+            whose ``offloadable`` attribute is ``True`` (such as
+            :class:`~falcon.media.JSONHandler`) are offloaded; the body is
+            read into memory first, and then passed to the synchronous
+            :meth:`~falcon.media.BaseHandler.deserialize` method.
+
+        media_offload_pool (falcon.asgi.MediaOffloadPool): ASGI only. Pool
+            of workers used to deserialize media exceeding
+            :attr:`media_offload_threshold`. If ``None`` (default), a pool
+            that is shared by all apps in the process is used.
     """
     __slots__ = (
         'keep_blank_qs_values',
@@ -1929,6 +2015,8 @@ class RequestOptions:
         'strip_url_path_trailing_slash',
         'default_media_type',
         'media_handlers',
+        'media_offload_threshold',
+        'media_offload_pool',
     )
 
     def __init__(self):
@@ -1938,3 +2026,5 @@ class RequestOptions:
         self.strip_url_path_trailing_slash = False
         self.default_media_type = DEFAULT_MEDIA_TYPE
         self.media_handlers = Handlers()
+        self.media_offload_threshold = None
+        self.media_offload_pool = None
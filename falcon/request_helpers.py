@@ -19,6 +19,8 @@ import io
 import re
 
 from falcon.util import ETag
+from falcon.util.misc import _lru_cache_safe
+from falcon.vendor import mimeparse
 
 # https://tools.ietf.org/html/rfc6265#section-4.1.1
 #
@@ -172,6 +174,149 @@ def _parse_etags(etag_str):
     return etags or None
 
 
+class _AcceptedMediaRanges:
+    """Parsed representation of an Accept header value.
+
+    Instances are shared between requests carrying the same header value
+    (see also: :func:`_parse_accept`), and so must be treated as immutable
+    apart from the internal memo of quality and fitness values.
+
+    Quality and fitness are evaluated for a given media type the same way as
+    per :func:`falcon.vendor.mimeparse.quality_and_fitness_parsed`, but
+    against media ranges that have already been parsed and normalized.
+
+    Args:
+        media_ranges (list): A list of ``(type, subtype, params, q)`` tuples,
+            where *params* is a :class:`dict` of the media range parameters
+            other than the quality value *q* (:class:`float`).
+    """
+
+    __slots__ = ('_media_ranges', '_memo')
+
+    # NOTE: Upper bound on the number of memoized media types per instance.
+    #   These are normally supplied by the app rather than the client, so a
+    #   handful of entries should suffice.
+    _MAX_MEMO_SIZE = 32
+
+    def __init__(self, media_ranges):
+        self._media_ranges = media_ranges
+        self._memo = {}
+
+    def quality_and_fitness(self, media_type):
+        """Return the quality and fitness of the best matching media range.
+
+        Args:
+            media_type (str): An Internet media type to match.
+
+        Returns:
+            tuple: A ``(quality, fitness)`` tuple, or ``(0.0, -1)`` if none of
+            the media ranges match the given media type.
+        """
+
+        try:
+            return self._memo[media_type]
+        except KeyError:
+            pass
+
+        try:
+            target_type, target_subtype, target_params = mimeparse.parse_media_range(
+                media_type)
+        except ValueError:
+            result = (0.0, -1)
+        else:
+            target_q = float(target_params.pop('q'))
+            result = self._match(target_type, target_subtype, target_params, target_q)
+
+        memo = self._memo
+        if len(memo) >= self._MAX_MEMO_SIZE:
+            memo.clear()
+        memo[media_type] = result
+
+        return result
+
+    def best_match(self, media_types):
+        """Return the client's preferred media type among several choices.
+
+        Ties are resolved in favor of the media type listed last, as in
+        :func:`falcon.vendor.mimeparse.best_match`.
+
+        Args:
+            media_types (iterable of str): Internet media types to choose from.
+
+        Returns:
+            str: The preferred media type, or ``None`` if the client does not
+            accept any of the given types.
+        """
+
+        best = None
+        best_weight = (0.0, -1)
+
+        for media_type in media_types:
+            weight = self.quality_and_fitness(media_type)
+            if weight >= best_weight:
+                best = media_type
+                best_weight = weight
+
+        return best if best_weight[0] else None
+
+    def _match(self, target_type, target_subtype, target_params, target_q):
+        best_fitness = -1
+        best_fit_q = 0.0
+
+        for type_, subtype, params, q in self._media_ranges:
+            if type_ != target_type and '*' not in (type_, target_type):
+                continue
+            if subtype != target_subtype and '*' not in (subtype, target_subtype):
+                continue
+
+            fitness = target_q
+            if type_ == target_type:
+                fitness += 100
+            if subtype == target_subtype:
+                fitness += 10
+
+            for key, value in target_params.items():
+                if params.get(key) == value:
+                    fitness += 1
+
+            if fitness > best_fitness:
+                best_fitness = fitness
+                best_fit_q = q
+
+        return (best_fit_q, best_fitness)
+
+
+@_lru_cache_safe(maxsize=64)
+def _parse_accept(accept):
+    """Parse the value of an Accept header.
+
+    An LRU is used to avoid parsing the same header value over and over
+    again, since clients (and especially browsers and HTTP libraries) tend to
+    send one of a small number of distinct Accept headers.
+
+    Args:
+        accept (str): Accept header value.
+
+    Returns:
+        _AcceptedMediaRanges: The parsed media ranges. In the case that the
+        header value is malformed, an empty collection of media ranges
+        (accepting no media type) is returned.
+    """
+
+    media_ranges = []
+
+    try:
+        for media_range in accept.split(','):
+            if media_range.strip():
+                type_, subtype, params = mimeparse.parse_media_range(media_range)
+                q = float(params.pop('q'))
+                media_ranges.append((type_, subtype, params, q))
+    except ValueError:
+        media_ranges = []
+
+    return _AcceptedMediaRanges(media_ranges)
+
+
 class BoundedStream(io.IOBase):
     """Wrap *wsgi.input* streams to make them more robust.
 
@@ -264,6 +409,38 @@ class BoundedStream(io.IOBase):
 
         return self._read(size, self.stream.read)
 
+    def readinto(self, buffer):
+        """Read bytes from the stream into a pre-allocated buffer.
+
+        If the wrapped stream implements ``readinto()``, the data is read
+        directly into `buffer`; otherwise, it is read via ``read()``, and
+        then copied into `buffer`.
+
+        Args:
+            buffer (object): Writable bytes-like object, such as a
+                :class:`bytearray`, or a :class:`memoryview` thereof.
+
+        Returns:
+            int: Number of bytes read, which is ``0`` once the stream has
+            been exhausted.
+        """
+
+        view = memoryview(buffer).cast('B')
+        size = min(len(view), self._bytes_remaining)
+        if size <= 0:
+            return 0
+
+        readinto = getattr(self.stream, 'readinto', None)
+        if readinto is not None:
+            num_bytes = readinto(view[:size]) or 0
+        else:
+            data = self.stream.read(size)
+            num_bytes = len(data)
+            view[:num_bytes] = data
+
+        self._bytes_remaining -= num_bytes
+        return num_bytes
+
     def readline(self, limit=None):
         """Read a line from the stream.
 
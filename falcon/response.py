@@ -15,10 +15,11 @@
 """Response class."""
 
 import mimetypes
+from types import GeneratorType
 
 from falcon import DEFAULT_MEDIA_TYPE
 from falcon.constants import _UNSET
-from falcon.errors import HeaderNotSupported
+from falcon.errors import HeaderNotSupported, HTTPInvalidHeader
 from falcon.media import Handlers
 from falcon.response_helpers import (
     format_content_disposition,
@@ -28,6 +29,7 @@ from falcon.response_helpers import (
     header_property,
     is_ascii_encodable,
 )
+from falcon.status_codes import HTTP_304, HTTP_412
 from falcon.util import dt_to_http, http_cookies, structures, TimezoneGMT
 from falcon.util.uri import encode as uri_encode
 from falcon.util.uri import encode_value as uri_encode_value
@@ -68,6 +70,16 @@ class Response:
         media (object): A serializable object supported by the media handlers
             configured via :class:`falcon.RequestOptions`.
 
+            If a generator is assigned, the items it yields are serialized
+            incrementally by the media handler, and streamed to the client
+            via :attr:`stream` when the response is rendered (for JSON, the
+            items are rendered as an array).
+
+            Instances of dataclasses and attrs classes (including nested
+            ones) are rendered by the default JSON and MessagePack handlers
+            as objects of their fields, using an encoder that is generated
+            once per class.
+
             Note:
                 See also :ref:`media` for more information regarding media
                 handling.
@@ -228,7 +240,10 @@ class Response:
 
         Note:
             This method ignores :attr:`~.stream`; the caller must check
-            and handle that attribute directly.
+            and handle that attribute directly. However, when a generator
+            is assigned to :attr:`~.media`, the stream of serialized
+            chunks is assigned to :attr:`~.stream` by this method, and
+            ``None`` is returned.
 
         Returns:
             bytes: The UTF-8 encoded value of the `body` attribute, if
@@ -253,10 +268,22 @@ class Response:
                         self.options.default_media_type
                     )
 
-                    self._media_rendered = handler.serialize(
-                        self._media,
-                        self.content_type
-                    )
+                    if isinstance(self._media, GeneratorType):
+                        self.stream = handler.serialize_stream(
+                            self._media,
+                            self.content_type
+                        )
+                        self._media_rendered = None
+                    else:
+                        self._media_rendered = handler.serialize(
+                            self._media,
+                            self.content_type
+                        )
+
+                        get_content_type = getattr(handler, '_get_content_type', None)
+                        if get_content_type is not None:
+                            self.content_type = get_content_type(
+                                self._media, self.content_type)
 
                 data = self._media_rendered
         else:
@@ -302,6 +329,107 @@ class Response:
         #   the self.content_length property.
         self._headers['content-length'] = str(content_length)
 
+    def check_preconditions(self, req, etag=None, last_modified=None):
+        """Evaluate the preconditions of a conditional request.
+
+        This method evaluates the If-Match, If-Unmodified-Since,
+        If-None-Match and If-Modified-Since request headers, in the order of
+        precedence that is specified by RFC 7232, Section 6, against the
+        given validators of the current representation of the target
+        resource. When a precondition fails, the response status is set to
+        either ``304 Not Modified`` or ``412 Precondition Failed``, and the
+        response is marked as :attr:`~.complete`.
+
+        Since only the validators are required, the responder (or a hook, or
+        middleware) can call this method as soon as those are known, e.g.,
+        after looking up the version of a database record, but before
+        querying the rest of the data or rendering the body::
+
+            def on_get(self, req, resp, thing_id):
+                version = self._db.get_version(thing_id)
+
+                if resp.check_preconditions(req, etag=version.etag,
+                                            last_modified=version.modified):
+                    return
+
+                resp.media = self._db.get_thing(thing_id)
+
+        The ETag and Last-Modified headers of the response are set from the
+        given validators, if any.
+
+        Note:
+            The target resource is assumed to have a current representation
+            when either validator is passed; this affects the evaluation of
+            the ``*`` entity-tag in the If-Match and If-None-Match headers.
+
+        Args:
+            req: The request to evaluate.
+
+        Keyword Args:
+            etag (str): Entity-tag of the current representation, with or
+                without the surrounding quotes (default ``None``). A weak
+                entity-tag may be passed either as an instance of
+                :class:`~.ETag` whose ``is_weak`` attribute is ``True``, or
+                as a string prefixed by ``W/``.
+            last_modified (datetime): Modification date (UTC) of the current
+                representation (default ``None``).
+
+        Returns:
+            bool: ``True`` if a precondition failed and the response has been
+            completed accordingly, ``False`` if the request should be
+            processed as usual.
+        """
+
+        if etag is not None:
+            if not isinstance(etag, structures.ETag):
+                etag = structures.ETag.loads(format_etag_header(etag))
+
+            self._headers['etag'] = etag.dumps()
+
+        if last_modified is not None:
+            # NOTE: HTTP dates have a resolution of one second.
+            last_modified = last_modified.replace(microsecond=0)
+            self._headers['last-modified'] = dt_to_http(last_modified)
+
+        exists = etag is not None or last_modified is not None
+        safe = req.method in ('GET', 'HEAD')
+
+        # NOTE: Step 1 and 2 (RFC 7232, Section 6)
+        if_match = req.if_match
+        if if_match is not None:
+            if if_match == ['*']:
+                matched = exists
+            else:
+                matched = etag is not None and any(etag.strong_compare(t) for t in if_match)
+
+            if not matched:
+                return self._complete_precondition(HTTP_412)
+
+        elif last_modified is not None:
+            if_unmodified_since = _get_precondition_date(req, 'if_unmodified_since')
+            if if_unmodified_since is not None and last_modified > if_unmodified_since:
+                return self._complete_precondition(HTTP_412)
+
+        # NOTE: Step 3 and 4 (RFC 7232, Section 6)
+        if_none_match = req.if_none_match
+        if if_none_match is not None:
+            if if_none_match == ['*']:
+                matched = exists
+            else:
+                # NOTE: The weak comparison function is used, and so the
+                #   is_weak flag of each ETag (which is a str) is ignored.
+                matched = etag is not None and etag in if_none_match
+
+            if matched:
+                return self._complete_precondition(HTTP_304 if safe else HTTP_412)
+
+        elif safe and last_modified is not None:
+            if_modified_since = _get_precondition_date(req, 'if_modified_since')
+            if if_modified_since is not None and last_modified <= if_modified_since:
+                return self._complete_precondition(HTTP_304)
+
+        return False
+
     def set_cookie(self, name, value, expires=None, max_age=None,
                    domain=None, path=None, secure=None, http_only=True, same_site=None):
         """Set a response cookie.
@@ -1055,6 +1183,11 @@ class Response:
 
         """)
 
+    def _complete_precondition(self, status):
+        self.status = status
+        self.complete = True
+        return True
+
     def _set_media_type(self, media_type=None):
         """Set a content-type; wrapper around set_header.
 
@@ -1106,6 +1239,14 @@ class Response:
         return items
 
 
+def _get_precondition_date(req, attr_name):
+    try:
+        return getattr(req, attr_name)
+    except HTTPInvalidHeader:
+        # NOTE: An invalid date must be ignored (RFC 7232, Section 3.3 & 3.4)
+        return None
+
+
 class ResponseOptions:
     """Defines a set of configurable response options.
 
@@ -1135,12 +1276,59 @@ class ResponseOptions:
         static_media_types (dict): A mapping of dot-prefixed file extensions to
             Internet media types (RFC 2046). Defaults to ``mimetypes.types_map``
             after calling ``mimetypes.init()``.
+
+        auto_etag (bool): Set to ``True`` to automatically set a weak ETag
+            header, derived from a hash of the rendered body, on successful
+            responses to GET and HEAD requests that do not already specify an
+            ETag (default ``False``). When the ETag matches the If-None-Match
+            request header, a 304 Not Modified response is sent instead of
+            the body. Streamed responses are not affected.
+
+        negotiate_media_type (bool): Set to ``True`` to choose the media type
+            used to serialize :attr:`~.Response.media` among those registered
+            in :attr:`media_handlers`, based on the request's Accept header
+            (default ``False``). The Content-Type header is set to the
+            chosen media type, and ``Accept`` is added to the Vary header.
+            Negotiation only takes place when the Content-Type has not been
+            set explicitly; :attr:`default_media_type` is preferred in the
+            case of a tie, or when none of the registered media types are
+            acceptable. Form media types (such as ``multipart/form-data``)
+            are never chosen.
+
+            Note:
+                Negotiation normally takes place when the body is rendered
+                by the app, i.e., after ``process_response()`` middleware
+                methods have run. Middleware components that render the body
+                themselves (via :meth:`~.Response.render_body`) must call
+                :func:`falcon.app_helpers.negotiate_media_type` beforehand, as
+                :class:`~falcon.CompressionMiddleware` does.
+
+        media_offload_min_items (int): ASGI only. Set to a number of
+            elements in order to serialize :attr:`~.Response.media` in
+            :attr:`media_offload_pool`, rather than on the event loop, when
+            it holds at least that many elements (default ``None``, i.e.,
+            media is never offloaded). The elements of the media object are counted
+            together with those of the containers it directly holds; for
+            example, a list of 1000 objects having 5 fields each counts as
+            6000 elements. Only handlers whose ``offloadable`` attribute is
+            ``True`` (such as :class:`~falcon.media.JSONHandler`) are
+            offloaded, using their synchronous
+            :meth:`~falcon.media.BaseHandler.serialize` method.
+
+        media_offload_pool (falcon.asgi.MediaOffloadPool): ASGI only. Pool
+            of workers used to serialize media exceeding
+            :attr:`media_offload_min_items`. If ``None`` (default), a pool
+            that is shared by all apps in the process is used.
     """
     __slots__ = (
         'secure_cookies_by_default',
         'default_media_type',
         'media_handlers',
         'static_media_types',
+        'auto_etag',
+        'negotiate_media_type',
+        'media_offload_min_items',
+        'media_offload_pool',
     )
 
     def __init__(self):
@@ -1151,3 +1339,8 @@ class ResponseOptions:
         if not mimetypes.inited:
             mimetypes.init()
         self.static_media_types = mimetypes.types_map
+
+        self.auto_etag = False
+        self.negotiate_media_type = False
+        self.media_offload_min_items = None
+        self.media_offload_pool = None
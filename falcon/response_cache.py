@@ -0,0 +1,734 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process HTTP response cache."""
+
+import ast
+from collections import OrderedDict
+from datetime import datetime
+import marshal
+import mmap
+import multiprocessing
+import os
+import struct
+from threading import Lock
+import time
+import zlib
+
+from falcon.util.misc import http_date_to_dt, http_status_to_code
+
+__all__ = ['ResponseCache', 'SharedMemoryResponseCache']
+
+
+# NOTE: Status codes that are defined as cacheable by default
+#   (RFC 7231, Section 6.1).
+_CACHEABLE_STATUS_CODES = frozenset([
+    200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501,
+])
+
+# NOTE: Rough estimate of the memory used by an entry, in addition to the
+#   size of its body and headers.
+_ENTRY_OVERHEAD = 256
+
+
+class ResponseCache:
+    """Size-bounded, in-process cache of rendered responses.
+
+    A response cache may be passed to :class:`falcon.App` (or
+    :class:`falcon.asgi.App`) via the `response_cache` keyword argument.
+    The cache is checked for each GET or HEAD request before any middleware,
+    routing or responders are run; when a fresh response is found, it is
+    sent as-is, along with an Age header.
+
+    Responses to GET requests are stored only when they:
+
+    * have a status code that is cacheable by default (e.g., 200 or 404),
+    * have a body that was set via :attr:`~falcon.Response.body`,
+      :attr:`~falcon.Response.data` or :attr:`~falcon.Response.media`, rather
+      than being streamed,
+    * specify an explicit freshness lifetime via either the ``s-maxage`` or
+      ``max-age`` directive of the Cache-Control header, or the Expires
+      header,
+    * do not include any of the ``no-store``, ``no-cache`` or ``private``
+      Cache-Control directives, nor a Set-Cookie header, nor
+      ``Vary: *``, and
+    * are not in response to a request bearing an Authorization header,
+      unless explicitly allowed via the ``public``, ``s-maxage`` or
+      ``must-revalidate`` directives.
+
+    Entries are keyed on the request method and
+    :attr:`~falcon.Request.relative_uri`, as well as on the values of any
+    request headers named by the Vary header of the response.
+
+    Keyword Arguments:
+        max_size (int): Maximum combined size, in bytes, of the cached
+            responses (default 64 MiB). The least recently used responses
+            are evicted in order to stay within this budget.
+        max_entry_size (int): Maximum size, in bytes, of an individual
+            response to cache (default 1 MiB).
+        max_ttl (float): Maximum number of seconds for which to cache a
+            response, regardless of its freshness lifetime (default
+            ``None``, i.e., no limit).
+
+    Attributes:
+        hits (int): Number of requests that were served from the cache.
+        misses (int): Number of GET and HEAD requests that could not be
+            served from the cache.
+        evictions (int): Number of fresh responses that were evicted in order
+            to stay within the memory budget.
+
+    Note:
+        Since cached responses are stored in the format expected by the
+        server, a cache instance may not be shared between WSGI and ASGI
+        apps.
+    """
+
+    def __init__(self, max_size=64 * 1024 * 1024, max_entry_size=1024 * 1024, max_ttl=None):
+        self._max_size = max_size
+        self._max_entry_size = max_entry_size
+        self._max_ttl = max_ttl
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @property
+    def evictions(self):
+        return self._evictions
+
+    @property
+    def size(self):
+        """Combined size, in bytes, of the cached responses."""
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, req):
+        """Look up a fresh cached response to the given request.
+
+        Args:
+            req: The request to look up.
+
+        Returns:
+            tuple: A ``(status, headers, body, age)`` tuple, where `age` is
+            the number of seconds for which the response has been cached,
+            or ``None`` if the cache does not have a fresh response to the
+            given request.
+        """
+
+        method = req.method
+        if method == 'HEAD':
+            method = 'GET'
+        elif method != 'GET':
+            return None
+
+        primary_key = (method, req.relative_uri)
+
+        vary = self._get(primary_key)
+        if vary is not None:
+            key = (primary_key, tuple(req.get_header(name) for name in vary))
+
+            entry = self._get(key)
+            if entry is not None:
+                self._record_lookup(primary_key, True)
+
+                status, headers, body, stored_at = entry
+                return status, headers, body, int(time.monotonic() - stored_at)
+
+        self._record_lookup(primary_key, False)
+        return None
+
+    def store(self, req, resp, status, headers, body):
+        """Store the response to the given request, if it is cacheable.
+
+        Args:
+            req: The request that the response is for.
+            resp: The response to store.
+            status: The status of the response, as sent to the server.
+            headers (list): The headers of the response, as sent to the
+                server.
+            body (bytes): The body of the response.
+
+        Returns:
+            bool: ``True`` if the response was stored, ``False`` otherwise.
+        """
+
+        if req.method != 'GET' or http_status_to_code(resp.status) not in _CACHEABLE_STATUS_CODES:
+            return False
+
+        ttl = _get_freshness_lifetime(req, resp)
+        if ttl is None or ttl <= 0:
+            return False
+
+        if self._max_ttl is not None:
+            ttl = min(ttl, self._max_ttl)
+
+        vary = resp.get_header('Vary')
+        if vary:
+            vary = tuple(name.strip().lower() for name in vary.split(',') if name.strip())
+            if '*' in vary:
+                return False
+        else:
+            vary = ()
+
+        size = len(body) + sum(len(name) + len(value) for name, value in headers)
+        size += _ENTRY_OVERHEAD
+        if size > self._max_entry_size:
+            return False
+
+        primary_key = (req.method, req.relative_uri)
+        key = (primary_key, tuple(req.get_header(name) for name in vary))
+
+        now = time.monotonic()
+        expires = now + ttl
+
+        self._set(primary_key, vary, expires, _ENTRY_OVERHEAD)
+        self._set(key, (status, headers, body, now), expires, size)
+
+        return True
+
+    def purge(self, relative_uri):
+        """Remove all cached responses for the given URI.
+
+        Args:
+            relative_uri (str): The path and query string of the URI to purge,
+                as returned by :attr:`falcon.Request.relative_uri`.
+
+        Returns:
+            int: Number of responses that were removed from the cache.
+        """
+
+        def matches(key):
+            # NOTE: Vary records are keyed on (method, relative_uri), while
+            #   responses are keyed on ((method, relative_uri), values).
+            primary_key = key[0] if isinstance(key[0], tuple) else key
+            return primary_key[1] == relative_uri
+
+        return self._delete_matching(matches)
+
+    def clear(self):
+        """Remove all responses from the cache and reset its counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _record_lookup(self, primary_key, hit):
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def _get(self, key):
+        with self._lock:
+            try:
+                value, expires, size = self._entries[key]
+            except KeyError:
+                return None
+
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self._size -= size
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key, value, expires, size):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+
+            self._entries[key] = (value, expires, size)
+            self._size += size
+
+            now = time.monotonic()
+            while self._size > self._max_size:
+                __, (__, evicted_expires, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+                if evicted_expires > now:
+                    self._evictions += 1
+
+    def _delete_matching(self, predicate):
+        # NOTE: Only responses are counted, not the Vary records that
+        #   accompany them.
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+
+            for key in keys:
+                self._size -= self._entries.pop(key)[2]
+
+            return sum(1 for key in keys if isinstance(key[0], tuple))
+
+
+class SharedMemoryResponseCache(ResponseCache):
+    """Response cache that is shared by the worker processes of a server.
+
+    This cache stores rendered responses in an anonymous, shared memory
+    map, so that all of the worker processes forked by a prefork server
+    (such as Gunicorn or uWSGI) read and populate the same set of entries,
+    without relying on any external service. Apart from that, it behaves
+    just like :class:`~.ResponseCache`, including its hit and miss counters,
+    which are aggregated across all workers.
+
+    The memory map is divided into a number of stripes, each of which is
+    guarded by its own lock, and holds a hash index along with a circular
+    log of entries. When a stripe runs out of space, its oldest entries are
+    overwritten.
+
+    Important:
+        The cache must be created *before* the worker processes are forked.
+        With Gunicorn, for instance, this means that the app must be loaded
+        in the master process using the ``--preload`` option. A cache that is
+        created in each worker after forking will not be shared.
+
+    Note:
+        In order to keep a worker that was killed while holding a lock from
+        stalling the others, a lookup or an update that cannot acquire the
+        lock of its stripe within `lock_timeout` is simply treated as a miss
+        or skipped, respectively. Likewise, :meth:`~.purge` and
+        :meth:`~.clear` skip any such stripe, and then raise a
+        :class:`TimeoutError` once they are done with the other stripes.
+
+    Keyword Arguments:
+        max_size (int): Size, in bytes, of the shared memory map
+            (default 64 MiB).
+        max_entry_size (int): Maximum size, in bytes, of an individual
+            response to cache (default 1 MiB). Responses that do not fit
+            within a single stripe are never cached.
+        max_ttl (float): Maximum number of seconds for which to cache a
+            response, regardless of its freshness lifetime (default
+            ``None``, i.e., no limit).
+        stripes (int): Number of independently locked stripes to divide the
+            memory map into (default 16).
+        lock_timeout (float): Maximum number of seconds to wait for the lock
+            of a stripe (default ``0.1``).
+    """
+
+    # NOTE: The header of each stripe holds the following fields.
+    _HEADER = struct.Struct('<8Q')
+    _HITS = 0
+    _MISSES = 1
+    _EVICTIONS = 2
+    _COUNT = 3
+    _USED = 4
+    _WRITE_OFFSET = 5
+    _OLDEST_OFFSET = 6
+    _OLDEST_END = 7
+
+    # NOTE: Each index slot holds the hash of the key, as well as the offset
+    #   into the log, length and expiration time of the entry.
+    _SLOT = struct.Struct('<QIId')
+
+    # NOTE: Each entry in the log is prefixed with its length, the index of
+    #   its slot and the length of its encoded key.
+    _RECORD = struct.Struct('<III')
+
+    # NOTE: Special hash values for slots that were never used, and for
+    #   slots whose entries were removed, respectively.
+    _EMPTY = 0
+    _DELETED = 1
+
+    _MAX_PROBES = 16
+
+    # NOTE: Expected average size of an entry, used to size the index.
+    _AVG_ENTRY_SIZE = 2048
+
+    def __init__(self, max_size=64 * 1024 * 1024, max_entry_size=1024 * 1024, max_ttl=None,
+                 stripes=16, lock_timeout=0.1):
+        super().__init__(max_size=max_size, max_entry_size=max_entry_size, max_ttl=max_ttl)
+
+        self._stripes = stripes
+        self._stripe_size = max_size // stripes
+        self._slots = max(self._MAX_PROBES, self._stripe_size // self._AVG_ENTRY_SIZE)
+        self._index_offset = self._HEADER.size
+        self._log_offset = self._index_offset + self._slots * self._SLOT.size
+        self._log_size = self._stripe_size - self._log_offset
+
+        if self._log_size <= 0:
+            raise ValueError('max_size is too small for the given number of stripes')
+
+        # NOTE: Anonymous memory maps are shared with child processes, and
+        #   are guaranteed to be zero-filled (i.e., empty).
+        self._mmap = mmap.mmap(-1, self._stripe_size * stripes)
+        self._locks = [multiprocessing.Lock() for __ in range(stripes)]
+        self._lock_timeout = lock_timeout
+
+    @property
+    def hits(self):
+        return self._sum_header_field(self._HITS)
+
+    @property
+    def misses(self):
+        return self._sum_header_field(self._MISSES)
+
+    @property
+    def evictions(self):
+        return self._sum_header_field(self._EVICTIONS)
+
+    @property
+    def size(self):
+        """Combined size, in bytes, of the cached responses."""
+        return self._sum_header_field(self._USED)
+
+    def __len__(self):
+        return self._sum_header_field(self._COUNT)
+
+    def clear(self):
+        """Remove all responses from the cache and reset its counters."""
+
+        for base in self._iter_locked_stripes():
+            self._mmap[base:base + self._log_offset] = bytes(self._log_offset)
+
+    def _record_lookup(self, primary_key, hit):
+        # NOTE: Any stripe will do, since the counters are summed up anyway,
+        #   so spread the workers over the stripes to reduce contention.
+        stripe = os.getpid() % self._stripes
+
+        lock = self._locks[stripe]
+        if lock.acquire(timeout=self._lock_timeout):
+            try:
+                self._update_header(stripe * self._stripe_size,
+                                    self._HITS if hit else self._MISSES, 1)
+            finally:
+                lock.release()
+
+    def _get(self, key):
+        key_bytes = _encode_key(key)
+        stripe, key_hash = self._locate(key_bytes)
+
+        lock = self._locks[stripe]
+        if not lock.acquire(timeout=self._lock_timeout):
+            return None
+
+        try:
+            base = stripe * self._stripe_size
+
+            slot, record = self._find(base, key_hash, key_bytes)
+            if slot is None:
+                return None
+
+            __, __, __, expires = self._SLOT.unpack_from(self._mmap, slot)
+            if expires <= time.monotonic():
+                self._remove(base, slot, evicted=False)
+                return None
+
+        finally:
+            lock.release()
+
+        return marshal.loads(record[self._RECORD.size + len(key_bytes):])
+
+    def _set(self, key, value, expires, size):
+        key_bytes = _encode_key(key)
+        value_bytes = marshal.dumps(value)
+
+        length = self._RECORD.size + len(key_bytes) + len(value_bytes)
+        if length > self._log_size:
+            return
+
+        stripe, key_hash = self._locate(key_bytes)
+
+        lock = self._locks[stripe]
+        if not lock.acquire(timeout=self._lock_timeout):
+            return
+
+        try:
+            base = stripe * self._stripe_size
+
+            slot, __ = self._find(base, key_hash, key_bytes)
+            if slot is not None:
+                self._remove(base, slot, evicted=False)
+
+            offset = self._allocate(base, length)
+            slot = self._find_free_slot(base, key_hash)
+            slot_idx = (slot - base - self._index_offset) // self._SLOT.size
+
+            start = base + self._log_offset + offset
+            self._RECORD.pack_into(self._mmap, start, length, slot_idx, len(key_bytes))
+            start += self._RECORD.size
+            self._mmap[start:start + len(key_bytes)] = key_bytes
+            start += len(key_bytes)
+            self._mmap[start:start + len(value_bytes)] = value_bytes
+
+            self._SLOT.pack_into(self._mmap, slot, key_hash, offset, length, expires)
+
+            self._update_header(base, self._COUNT, 1)
+            self._update_header(base, self._USED, length)
+
+        finally:
+            lock.release()
+
+    def _delete_matching(self, predicate):
+        removed = 0
+
+        for base in self._iter_locked_stripes():
+            start = base + self._index_offset
+            index = self._mmap[start:start + self._slots * self._SLOT.size]
+
+            for slot_idx, (key_hash, offset, length, __) in enumerate(
+                self._SLOT.iter_unpack(index)
+            ):
+                if key_hash <= self._DELETED:
+                    continue
+
+                record = self._read_record(base, offset, length)
+                key_len = self._RECORD.unpack_from(record)[2]
+                key = _decode_key(record[self._RECORD.size:self._RECORD.size + key_len])
+
+                if predicate(key):
+                    self._remove(base, start + slot_idx * self._SLOT.size, evicted=False)
+
+                    # NOTE: Only count responses, not Vary records.
+                    if isinstance(key[0], tuple):
+                        removed += 1
+
+        return removed
+
+    def _iter_locked_stripes(self):
+        """Yield the offset of each stripe, while holding its lock.
+
+        Stripes whose lock cannot be acquired within the lock timeout are
+        skipped, rather than waiting indefinitely for a lock that may have
+        been orphaned by a killed worker.
+
+        Raises:
+            TimeoutError: One or more stripes were skipped; raised once all
+                of the other stripes have been yielded.
+        """
+
+        skipped = 0
+
+        for stripe in range(self._stripes):
+            lock = self._locks[stripe]
+            if not lock.acquire(timeout=self._lock_timeout):
+                skipped += 1
+                continue
+
+            try:
+                yield stripe * self._stripe_size
+            finally:
+                lock.release()
+
+        if skipped:
+            raise TimeoutError(
+                'Could not acquire the lock of {0} of {1} cache stripes within {2} '
+                'seconds; the entries stored in these stripes were left '
+                'untouched'.format(skipped, self._stripes, self._lock_timeout)
+            )
+
+    def _sum_header_field(self, field):
+        return sum(
+            self._HEADER.unpack_from(self._mmap, stripe * self._stripe_size)[field]
+            for stripe in range(self._stripes)
+        )
+
+    def _update_header(self, base, field, delta):
+        header = list(self._HEADER.unpack_from(self._mmap, base))
+        header[field] += delta
+        self._HEADER.pack_into(self._mmap, base, *header)
+
+    def _locate(self, key_bytes):
+        # NOTE: Python's hash() of str objects is salted per process, so a
+        #   stable hash is used instead.
+        key_hash = zlib.crc32(key_bytes) + self._DELETED + 1
+        return key_hash % self._stripes, key_hash
+
+    def _slot_offset(self, base, key_hash, probe):
+        slot_idx = (key_hash // self._stripes + probe) % self._slots
+        return base + self._index_offset + slot_idx * self._SLOT.size
+
+    def _read_record(self, base, offset, length):
+        start = base + self._log_offset + offset
+        return self._mmap[start:start + length]
+
+    def _find(self, base, key_hash, key_bytes):
+        for probe in range(self._MAX_PROBES):
+            slot = self._slot_offset(base, key_hash, probe)
+            slot_hash, offset, length, __ = self._SLOT.unpack_from(self._mmap, slot)
+
+            if slot_hash == self._EMPTY:
+                break
+
+            if slot_hash == key_hash:
+                record = self._read_record(base, offset, length)
+                key_start = self._RECORD.size
+
+                if record[key_start:key_start + len(key_bytes)] == key_bytes:
+                    return slot, record
+
+        return None, None
+
+    def _find_free_slot(self, base, key_hash):
+        now = time.monotonic()
+        victim = None
+
+        for probe in range(self._MAX_PROBES):
+            slot = self._slot_offset(base, key_hash, probe)
+            slot_hash, __, __, expires = self._SLOT.unpack_from(self._mmap, slot)
+
+            if slot_hash <= self._DELETED:
+                return slot
+
+            if expires <= now:
+                self._remove(base, slot, evicted=False)
+                return slot
+
+            if victim is None or expires < victim[1]:
+                victim = (slot, expires)
+
+        # NOTE: Evict the entry that would expire first.
+        slot = victim[0]
+        self._remove(base, slot, evicted=True)
+        return slot
+
+    def _allocate(self, base, length):
+        # NOTE: The log is a ring buffer. The entries of the current lap are
+        #   located before the write offset, while what is left of the
+        #   previous lap is located between the oldest offset and end.
+        header = self._HEADER.unpack_from(self._mmap, base)
+        write_offset = header[self._WRITE_OFFSET]
+        oldest_offset = header[self._OLDEST_OFFSET]
+        oldest_end = header[self._OLDEST_END]
+
+        if write_offset + length > self._log_size:
+            self._evict_records(base, oldest_offset, oldest_end)
+
+            oldest_offset = 0
+            oldest_end = write_offset
+            write_offset = 0
+
+        end = write_offset + length
+        if oldest_offset < end:
+            oldest_offset = self._evict_records(base, oldest_offset, min(end, oldest_end))
+
+        header = list(self._HEADER.unpack_from(self._mmap, base))
+        header[self._WRITE_OFFSET] = end
+        header[self._OLDEST_OFFSET] = max(oldest_offset, end)
+        header[self._OLDEST_END] = oldest_end
+        self._HEADER.pack_into(self._mmap, base, *header)
+
+        return write_offset
+
+    def _evict_records(self, base, offset, end):
+        """Evict the entries that start within the given range of the log."""
+
+        now = time.monotonic()
+
+        while offset < end:
+            length, slot_idx, __ = self._RECORD.unpack_from(self._mmap,
+                                                            base + self._log_offset + offset)
+
+            slot = base + self._index_offset + slot_idx * self._SLOT.size
+            slot_hash, slot_offset, __, expires = self._SLOT.unpack_from(self._mmap, slot)
+
+            # NOTE: The slot may have been reused by a different entry since.
+            if slot_hash > self._DELETED and slot_offset == offset:
+                self._remove(base, slot, evicted=expires > now)
+
+            offset += length
+
+        return offset
+
+    def _remove(self, base, slot, evicted):
+        __, __, length, __ = self._SLOT.unpack_from(self._mmap, slot)
+        self._SLOT.pack_into(self._mmap, slot, self._DELETED, 0, 0, 0.0)
+
+        header = list(self._HEADER.unpack_from(self._mmap, base))
+        if evicted:
+            header[self._EVICTIONS] += 1
+        header[self._COUNT] -= 1
+        header[self._USED] -= length
+        self._HEADER.pack_into(self._mmap, base, *header)
+
+
+def _encode_key(key):
+    # NOTE: Unlike that of marshal, the output of repr() is canonical for
+    #   the tuples of str and None that keys are made of.
+    return repr(key).encode()
+
+
+def _decode_key(key_bytes):
+    return ast.literal_eval(key_bytes.decode())
+
+
+def _get_freshness_lifetime(req, resp):
+    """Get the number of seconds for which a response may be cached.
+
+    Args:
+        req: The request that the response is for.
+        resp: The response to check.
+
+    Returns:
+        float: The freshness lifetime of the response, or ``None`` if the
+        response must not be cached.
+    """
+
+    # NOTE: Cookies are specific to the client.
+    if resp._cookies or any(
+        name == 'set-cookie' for name, __ in resp._extra_headers or ()
+    ):
+        return None
+
+    directives = {}
+    cache_control = resp.get_header('Cache-Control')
+    if cache_control:
+        for directive in cache_control.split(','):
+            name, __, value = directive.partition('=')
+            directives[name.strip().lower()] = value.strip().strip('"')
+
+    if 'no-store' in directives or 'no-cache' in directives or 'private' in directives:
+        return None
+
+    # NOTE: Responses to authorized requests may only be stored by shared
+    #   caches when explicitly allowed (RFC 7234, Section 3.2).
+    if req.get_header('Authorization') is not None and not (
+        'public' in directives or 's-maxage' in directives or
+        'must-revalidate' in directives
+    ):
+        return None
+
+    for name in ('s-maxage', 'max-age'):
+        if name in directives:
+            try:
+                return float(int(directives[name]))
+            except ValueError:
+                return None
+
+    expires = resp.get_header('Expires')
+    if expires:
+        try:
+            expires = http_date_to_dt(expires)
+        except ValueError:
+            return None
+
+        return (expires - datetime.utcnow()).total_seconds()
+
+    return None
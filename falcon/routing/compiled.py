@@ -15,16 +15,22 @@
 """Default routing engine."""
 
 from collections import UserDict
+from datetime import datetime
+import hashlib
 from inspect import iscoroutinefunction
 import keyword
+import marshal
 import re
+import sys
 import textwrap
 from threading import Lock
+import uuid
 
 from falcon.routing import converters
-from falcon.routing.util import map_http_methods, set_default_responders
+from falcon.routing.util import _unpack_route, map_http_methods, set_default_responders
 from falcon.util.misc import is_python_func
 from falcon.util.sync import _should_wrap_non_coroutines, wrap_sync_to_async
+from falcon.version import __version__
 
 
 _TAB_STR = ' ' * 4
@@ -40,6 +46,16 @@ _FIELD_PATTERN = re.compile(
 )
 _IDENTIFIER_PATTERN = re.compile('[A-Za-z_][A-Za-z0-9_]*$')
 
+# NOTE: Since Python 3.11, int() refuses to convert strings with more digits
+#   than allowed by sys.get_int_max_str_digits(), which may be configured
+#   down to 640. Longer values are left to IntConverter.convert(), which
+#   handles the resulting ValueError.
+_MAX_INLINE_INT_DIGITS = 640
+
+# NOTE: Increment whenever the layout of the data saved by
+#   CompiledRouter.save_compiled() changes.
+_PRECOMPILED_FORMAT = 2
+
 
 class CompiledRouter:
     """Fast URI router which compiles its routing logic to Python code.
@@ -66,25 +82,53 @@ class CompiledRouter:
         startup. Therefore, the framework employs a lock to ensure that only a
         single compilation of the decision tree is performed.
 
+    By default, sibling path segments are tested in the generated code in the
+    order in which they were added. When a small number of routes receive the
+    bulk of the traffic, the router can instead be told to test the most
+    frequently requested literal segments first, either by loading a
+    previously recorded profile (see :meth:`~.load_route_profile`), or by
+    letting the router count hits and periodically reorder itself (see
+    :attr:`~.CompiledRouterOptions.profile_route_hits` and
+    :attr:`~.CompiledRouterOptions.profile_recompile_interval`). Reordering
+    never changes which route a given path resolves to.
+
+    Applications with a large number of routes may also avoid most of the
+    work of building and compiling the routing logic upon startup by loading
+    a precompiled version of it that was previously saved to a file (see
+    :meth:`~.save_compiled` and :meth:`~.load_compiled`). Alternatively, the
+    cost of recompiling the routing logic after adding more routes at runtime
+    may be reduced by enabling the
+    :attr:`~.CompiledRouterOptions.incremental_compile` option.
+
     See also :meth:`.CompiledRouter.add_route`
     """
 
     __slots__ = (
         '_ast',
+        '_compiled_converter_map',
         '_converter_map',
         '_converters',
+        '_dirty_subtrees',
         '_find',
         '_finder_src',
+        '_hits_since_compile',
         '_options',
         '_patterns',
+        '_precompiled',
+        '_precompiled_templates',
+        '_previous_table_indices',
         '_return_values',
         '_roots',
+        '_route_hits',
+        '_route_weights',
+        '_subtree_finders',
+        '_table_indices',
+        '_unvalidated_templates',
         '_compile_lock',
     )
 
     def __init__(self):
         self._ast = None
-        self._converters = None
         self._finder_src = None
 
         self._options = CompiledRouterOptions()
@@ -93,10 +137,43 @@ class CompiledRouter:
         # here to reduce lookup time.
         self._converter_map = self._options.converters.data
 
-        self._patterns = None
-        self._return_values = None
+        # NOTE: The lookup tables referenced by the generated code are only
+        #   ever appended to, and each entry keeps its index across
+        #   compilations (see also: _get_table_index()). Therefore, a request
+        #   that is still being routed by a previous version of the finder
+        #   while the router is recompiled will resolve correctly.
+        self._converters = []
+        self._patterns = []
+        self._return_values = []
+
+        # NOTE: The index of the entries that are referenced by the current
+        #   routing logic is rebuilt with each compilation, so that entries
+        #   that are no longer referenced (e.g., instances of converters that
+        #   have since been replaced) are forgotten. Entries that are still
+        #   referenced keep the index that was allocated previously.
+        self._table_indices = {}
+        self._previous_table_indices = {}
+
         self._roots = []
 
+        # NOTE: Maps root nodes to the (fast_return, name, src, func) of the
+        #   function that was generated for their subtree, when the
+        #   incremental_compile option is enabled. Subtrees that were
+        #   modified since they were last compiled are tracked as dirty.
+        self._subtree_finders = {}
+        self._dirty_subtrees = set()
+
+        # NOTE: Snapshot of the converter map as of the last compilation.
+        self._compiled_converter_map = None
+
+        self._hits_since_compile = 0
+        self._route_hits = None
+        self._route_weights = None
+
+        self._precompiled = None
+        self._precompiled_templates = frozenset()
+        self._unvalidated_templates = []
+
         # NOTE(caselit): set _find to the delayed compile method to ensure that
         # compile is called when the router is first used
         self._find = self._compile_and_find
@@ -114,6 +191,183 @@ class CompiledRouter:
         self.find('/')
         return self._finder_src
 
+    @property
+    def route_hits(self):
+        """Number of routed requests per URI template.
+
+        Hits are only counted while the
+        :attr:`~.CompiledRouterOptions.profile_route_hits` option is enabled;
+        otherwise, this property returns an empty ``dict``. The returned
+        ``dict`` is a snapshot that may be serialized (e.g., as JSON) and
+        later passed to :meth:`~.load_route_profile`.
+
+        Note:
+            In multi-threaded deployments, counts are updated without
+            locking and should be treated as approximate.
+        """
+
+        return dict(self._route_hits or {})
+
+    def load_route_profile(self, profile, **kwargs):
+        """Order the routing logic according to a route traffic profile.
+
+        When compiling the routing tree, sibling literal segments are
+        tested in descending order of the total weight of the routes
+        below them, so that the most frequently requested routes are
+        matched with the fewest comparisons. Field expressions are always
+        tested after literal segments, as usual, so this ordering never
+        affects which route a given path resolves to.
+
+        Routes that are not included in the profile have a weight of zero,
+        and ties are broken by the order in which routes were added.
+
+        A profile is typically loaded at startup from a file that was
+        previously produced from :attr:`~.route_hits`::
+
+            router = falcon.routing.CompiledRouter()
+
+            with open('routes.profile.json') as profile_file:
+                router.load_route_profile(json.load(profile_file))
+
+            app = falcon.App(router=router)
+
+        Args:
+            profile (dict): A mapping of URI templates to their relative
+                weights (e.g., the number of requests routed to each
+                template), or ``None`` to revert to the default ordering.
+
+        Keyword Args:
+            compile (bool): Set to ``True`` to recompile the routing logic
+                immediately, rather than on the next routed request
+                (default ``False``).
+        """
+
+        self._route_weights = dict(profile) if profile else None
+        self._subtree_finders = {}
+        self._reset_find(compile=kwargs.get('compile', False))
+
+    def save_compiled(self, path):
+        """Save the compiled routing logic to a file.
+
+        The saved file contains the generated code (in the form of a
+        Python code object, as well as its source), together with enough
+        information to rebuild the tables of patterns, converters and
+        routes that it references. It is keyed by a hash of the route
+        table and of the registered converters, and it is tied to the
+        versions of both Falcon and the Python interpreter.
+
+        The ``falcon-compile-router`` CLI script may be used to save the
+        routing logic of an app instance from the command line.
+
+        See also: :meth:`~.load_compiled`
+
+        Args:
+            path (str): Path of the file to write.
+        """
+
+        # NOTE: Ensure that the routing logic has been compiled and is
+        #   up to date.
+        src = self.finder_src
+
+        paths = {node: node_path for node_path, node in self._iter_nodes()}
+
+        tables = {
+            'return': [None] * len(self._return_values),
+            'pattern': [None] * len(self._patterns),
+            'converter': [None] * len(self._converters),
+        }
+
+        # NOTE: Table slots that are no longer referenced are saved as None.
+        for key, idx in self._table_indices.items():
+            kind, node = key[0], key[1]
+            if kind == 'converter':
+                __, __, field_name, __, argstr = key
+                converter_name = next(
+                    cname for fname, cname, __ in node.var_converter_map
+                    if fname == field_name
+                )
+                tables[kind][idx] = (paths[node], field_name, converter_name, argstr)
+            else:
+                tables[kind][idx] = paths[node]
+
+        precompiled = {
+            'format': _PRECOMPILED_FORMAT,
+            'falcon': __version__,
+            'python': sys.implementation.cache_tag,
+            'key': self._route_table_key(),
+            'templates': [node.uri_template for node in paths if node.resource is not None],
+            'source': src,
+            'code': compile(src, '<string>', 'exec'),
+            'return_values': tables['return'],
+            'patterns': tables['pattern'],
+            'converters': tables['converter'],
+            'subtrees': [
+                (paths[node], fast_return, name, subtree_src)
+                for node, (fast_return, name, subtree_src, __) in self._subtree_finders.items()
+            ],
+        }
+
+        with open(path, 'wb') as precompiled_file:
+            marshal.dump(precompiled, precompiled_file)
+
+    def load_compiled(self, path):
+        """Load compiled routing logic previously saved to a file.
+
+        The loaded routing logic is used in lieu of compiling the routing
+        tree the first time that the router is compiled, as long as the
+        route table still matches the one from which the file was
+        produced. Otherwise, the file is ignored and the routing tree is
+        compiled as usual.
+
+        When this method is called before adding routes, the validation
+        of any URI templates that are included in the file is deferred
+        until the router is compiled, and is skipped altogether if the
+        precompiled routing logic can be used::
+
+            router = falcon.routing.CompiledRouter()
+            router.load_compiled('routes.precompiled')
+
+            app = falcon.App(router=router)
+            app.add_route('/things', things)
+            # ...
+
+        Warning:
+            The file is loaded using :mod:`marshal`, and it must therefore
+            originate from a trusted source (as is the case for ``.pyc``
+            files).
+
+        See also: :meth:`~.save_compiled`
+
+        Args:
+            path (str): Path of the file to load.
+
+        Returns:
+            bool: ``True`` if the file was produced by a compatible
+            version of both Falcon and the Python interpreter, ``False``
+            otherwise. Note that the route table is only checked upon
+            compilation.
+        """
+
+        with open(path, 'rb') as precompiled_file:
+            try:
+                precompiled = marshal.load(precompiled_file)
+            except (EOFError, TypeError, ValueError):
+                return False
+
+        if (
+            not isinstance(precompiled, dict) or
+            precompiled.get('format') != _PRECOMPILED_FORMAT or
+            precompiled.get('falcon') != __version__ or
+            precompiled.get('python') != sys.implementation.cache_tag
+        ):
+            return False
+
+        self._precompiled = precompiled
+        self._precompiled_templates = frozenset(precompiled['templates'])
+        self._find = self._compile_and_find
+
+        return True
+
     def map_http_methods(self, resource, **kwargs):
         """Map HTTP methods (e.g., GET, POST) to methods of a resource object.
 
@@ -180,6 +434,127 @@ class CompiledRouter:
                     adding the final route.
         """
 
+        method_map = self._map_route_responders(resource, kwargs)
+        self._check_template(uri_template)
+
+        changed = self._insert_route(uri_template, resource, method_map)
+        self._update_find(changed, kwargs.get('compile', False))
+
+    def add_routes(self, routes, **kwargs):
+        """Add multiple routes at once.
+
+        This method is equivalent to calling :meth:`~.add_route` for each
+        route, except that the responders of every route are mapped and
+        every URI template is validated before any route is added to the
+        routing tree, and the routing logic is only reset (or compiled)
+        once, after the last route has been added. Converters referenced
+        by several templates with the same arguments are instantiated only
+        once for the purpose of validation.
+
+        If any of the routes conflicts with another route, a
+        :class:`ValueError` is raised, and none of the routes are added.
+
+        Args:
+            routes (iterable): An iterable of ``(uri_template, resource)``
+                or ``(uri_template, resource, kwargs)`` tuples, where
+                `kwargs` is a ``dict`` of keyword arguments for that
+                particular route (e.g., ``{'suffix': 'collection'}``).
+
+        Keyword Args:
+            compile (bool): Set to ``True`` to compile the routing logic
+                once all of the routes have been added (default ``False``).
+                See also: :meth:`~.add_route`.
+
+        Note:
+            Any other keyword arguments are passed on to
+            :meth:`~.map_http_methods` for every route, unless overridden
+            by the `kwargs` of a given route.
+        """
+
+        should_compile = kwargs.pop('compile', False)
+        checked_converters = set()
+        num_unvalidated = len(self._unvalidated_templates)
+
+        prepared = []
+        for route in routes:
+            uri_template, resource, route_kwargs = _unpack_route(route, kwargs)
+
+            method_map = self._map_route_responders(resource, route_kwargs)
+            self._check_template(uri_template, checked_converters)
+
+            prepared.append((uri_template, resource, method_map))
+
+        # NOTE: A route may still conflict with another one that is already
+        #   in the routing tree, or with one that precedes it in this batch.
+        #   In that case, the routes that were inserted so far are rolled
+        #   back, so that either all of the routes are added, or none.
+        undo_log = []
+        changed = False
+        try:
+            for uri_template, resource, method_map in prepared:
+                # NOTE: Evaluate _insert_route() first so that it is always called.
+                changed = self._insert_route(
+                    uri_template, resource, method_map, undo_log) or changed
+        except ValueError:
+            self._undo_insert_routes(undo_log)
+            del self._unvalidated_templates[num_unvalidated:]
+            raise
+
+        self._update_find(changed, should_compile)
+
+    def find(self, uri, req=None):
+        """Search for a route that matches the given partial URI.
+
+        Args:
+            uri(str): The requested path to route.
+
+        Keyword Args:
+            req: The :class:`falcon.Request` or :class:`falcon.asgi.Request`
+                object that will be passed to the routed responder. Currently
+                the value of this argument is ignored by
+                :class:`~.CompiledRouter`. Routing is based solely on the path.
+
+        Returns:
+            tuple: A 4-member tuple composed of (resource, method_map,
+            params, uri_template), or ``None`` if no route matches
+            the requested path.
+        """
+
+        path = uri.lstrip('/').split('/')
+        params = {}
+        node = self._find(path, self._return_values, self._patterns,
+                          self._converters, params)
+
+        if node is not None:
+            if self._route_hits is not None:
+                self._record_hit(node.uri_template)
+
+            return node.resource, node.method_map, params, node.uri_template
+        else:
+            return None
+
+    # -----------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------
+
+    def _reset_find(self, compile=False):
+        # NOTE(caselit): when compile is True run the actual compile step, otherwise reset the
+        # _find, so that _compile will be called on the next find use
+        if compile:
+            with self._compile_lock:
+                self._find = self._compile()
+        else:
+            self._find = self._compile_and_find
+
+    def _update_find(self, changed, compile):
+        # PERF: Overriding the resource of an existing route does not
+        #   change the generated code, since the finder returns the node
+        #   itself (rather than the resource), so there is no need to
+        #   recompile in that case unless explicitly requested.
+        if changed or compile:
+            self._reset_find(compile=compile)
+
+    def _map_route_responders(self, resource, kwargs):
         # NOTE(kgriffs): falcon.asgi.App injects this private kwarg; it is
         #   only intended to be used internally.
         asgi = kwargs.get('_asgi', False)
@@ -193,47 +568,81 @@ class CompiledRouter:
         else:
             self._require_non_coroutine_responders(method_map)
 
-        # NOTE(kgriffs): Fields may have whitespace in them, so sub
-        # those before checking the rest of the URI template.
-        if re.search(r'\s', _FIELD_PATTERN.sub('{FIELD}', uri_template)):
-            raise ValueError('URI templates may not include whitespace.')
+        return method_map
 
-        path = uri_template.lstrip('/').split('/')
+    def _check_template(self, uri_template, checked_converters=None):
+        # PERF: Templates that are known to be part of the precompiled
+        #   routing logic do not need to be validated, unless it turns out
+        #   that the routing logic can not be used after all.
+        if uri_template in self._precompiled_templates:
+            self._unvalidated_templates.append(uri_template)
+        else:
+            self._validate_template(uri_template, checked_converters)
 
-        used_names = set()
-        for segment in path:
-            self._validate_template_segment(segment, used_names)
+    def _insert_route(self, uri_template, resource, method_map, undo_log=None):
+        """Insert a route into the routing tree.
+
+        Keyword Args:
+            undo_log (list): If specified, a record of every change made to
+                the routing tree is appended to this list, so that the
+                changes may be reverted with :meth:`~._undo_insert_routes`.
+
+        Returns:
+            bool: ``True`` if the routing logic must be regenerated as a
+            result, or ``False`` if the route merely replaced the resource
+            of an existing route.
+        """
+
+        path = uri_template.lstrip('/').split('/')
 
         def insert(nodes, path_index=0):
+            segment = path[path_index]
             for node in nodes:
-                segment = path[path_index]
                 if node.matches(segment):
                     path_index += 1
                     if path_index == len(path):
+                        changed = node.resource is None
+
+                        if undo_log is not None:
+                            undo_log.append((
+                                'replace', node,
+                                (node.method_map, node.resource, node.uri_template),
+                            ))
+
                         # NOTE(kgriffs): Override previous node
                         node.method_map = method_map
                         node.resource = resource
                         node.uri_template = uri_template
-                    else:
-                        insert(node.children, path_index)
-
-                    return
-
-                if node.conflicts_with(segment):
-                    msg = textwrap.dedent("""
-                        The URI template for this route is inconsistent or conflicts with another
-                        route's template. This is usually caused by configuring a field converter
-                        differently for the same field in two different routes, or by using
-                        different field names at the same level in the path (e.g.,
-                        '/parents/{id}' and '/parents/{parent_id}/children')
-                    """).strip().replace('\n', ' ')
-                    raise ValueError(msg)
+
+                        return changed
+
+                    return insert(node.children, path_index)
 
             # NOTE(richardolsson): If we got this far, the node doesn't already
             # exist and needs to be created. This builds a new branch of the
             # routing tree recursively until it reaches the new node leaf.
-            new_node = CompiledRouterNode(path[path_index])
+            new_node = CompiledRouterNode(segment)
+
+            # PERF: Only field expressions can conflict with other segments,
+            #   and only with other field expressions (see also:
+            #   CompiledRouterNode.conflicts_with()), so there is no need to
+            #   parse each sibling segment anew.
+            if new_node.is_var:
+                for node in nodes:
+                    if node.is_var and new_node._conflicts_with_node(node):
+                        msg = textwrap.dedent("""
+                            The URI template for this route is inconsistent or conflicts with
+                            another route's template. This is usually caused by configuring a
+                            field converter differently for the same field in two different
+                            routes, or by using different field names at the same level in the
+                            path (e.g., '/parents/{id}' and '/parents/{parent_id}/children')
+                        """).strip().replace('\n', ' ')
+                        raise ValueError(msg)
+
             nodes.append(new_node)
+            if undo_log is not None:
+                undo_log.append(('append', nodes, new_node))
+
             if path_index == len(path) - 1:
                 new_node.method_map = method_map
                 new_node.resource = resource
@@ -241,45 +650,165 @@ class CompiledRouter:
             else:
                 insert(new_node.children, path_index + 1)
 
-        insert(self._roots)
-        # NOTE(caselit): when compile is True run the actual compile step, otherwise reset the
-        # _find, so that _compile will be called on the next find use
-        if kwargs.get('compile', False):
-            self._find = self._compile()
-        else:
-            self._find = self._compile_and_find
+            return True
 
-    def find(self, uri, req=None):
-        """Search for a route that matches the given partial URI.
+        changed = insert(self._roots)
+        if changed:
+            root = next(node for node in self._roots if node.matches(path[0]))
+            if undo_log is not None and root not in self._dirty_subtrees:
+                undo_log.append(('dirty', root, None))
 
-        Args:
-            uri(str): The requested path to route.
+            self._dirty_subtrees.add(root)
 
-        Keyword Args:
-            req: The :class:`falcon.Request` or :class:`falcon.asgi.Request`
-                object that will be passed to the routed responder. Currently
-                the value of this argument is ignored by
-                :class:`~.CompiledRouter`. Routing is based solely on the path.
+        return changed
 
-        Returns:
-            tuple: A 4-member tuple composed of (resource, method_map,
-            params, uri_template), or ``None`` if no route matches
-            the requested path.
-        """
+    def _undo_insert_routes(self, undo_log):
+        """Revert the changes recorded by :meth:`~._insert_route`."""
 
-        path = uri.lstrip('/').split('/')
-        params = {}
-        node = self._find(path, self._return_values, self._patterns,
-                          self._converters, params)
+        for action, target, value in reversed(undo_log):
+            if action == 'replace':
+                target.method_map, target.resource, target.uri_template = value
+            elif action == 'append':
+                target.remove(value)
+            else:
+                self._dirty_subtrees.discard(target)
+
+    def _record_hit(self, uri_template):
+        hits = self._route_hits
+        hits[uri_template] = hits.get(uri_template, 0) + 1
+
+        interval = self._options.profile_recompile_interval
+        if interval:
+            self._hits_since_compile += 1
+            if self._hits_since_compile >= interval:
+                self._hits_since_compile = 0
+                self._route_weights = dict(hits)
+                self._subtree_finders = {}
+                self._find = self._compile_and_find
+
+    def _get_table_index(self, table, key, factory):
+        try:
+            return self._table_indices[key]
+        except KeyError:
+            idx = self._previous_table_indices.get(key)
+            if idx is None:
+                idx = len(table)
+                table.append(factory())
+
+            self._table_indices[key] = idx
+            return idx
+
+    def _reset_table_indices(self):
+        """Start a new index of table entries for the upcoming compilation."""
+
+        # NOTE: Entries referenced by subtree finders that may be retained
+        #   (see also: _get_subtree_finder()) are carried over as is.
+        retained = set()
+        for root in self._subtree_finders:
+            if root not in self._dirty_subtrees:
+                retained.update(node for __, node in self._iter_nodes(root.children))
+
+        self._previous_table_indices = self._table_indices
+        self._table_indices = {
+            key: idx for key, idx in self._table_indices.items() if key[1] in retained
+        }
+
+    def _get_converter_index(self, node, field_name, converter_name, converter_argstr):
+        converter_class = self._converter_map[converter_name]
+
+        # NOTE: Include the class and argstr in the key in case the converter
+        #   mapped to this name was changed after the route was added.
+        key = ('converter', node, field_name, converter_class, converter_argstr)
+
+        return self._get_table_index(
+            self._converters,
+            key,
+            lambda: self._instantiate_converter(converter_class, converter_argstr)
+        )
 
-        if node is not None:
-            return node.resource, node.method_map, params, node.uri_template
-        else:
+    def _iter_nodes(self, nodes=None, parent_path=()):
+        for node in self._roots if nodes is None else nodes:
+            node_path = parent_path + (node.raw_segment,)
+            yield node_path, node
+            yield from self._iter_nodes(node.children, node_path)
+
+    def _route_table_key(self):
+        hasher = hashlib.sha256()
+
+        for node_path, node in self._iter_nodes():
+            hasher.update(repr((node_path, node.uri_template)).encode())
+
+        for name, converter_class in sorted(self._converter_map.items()):
+            hasher.update(repr(
+                (name, converter_class.__module__, converter_class.__qualname__)
+            ).encode())
+
+        if self._route_weights:
+            hasher.update(repr(sorted(self._route_weights.items())).encode())
+
+        if self._options.incremental_compile:
+            hasher.update(b'incremental_compile')
+
+        return hasher.hexdigest()
+
+    def _load_precompiled(self, precompiled):
+        # NOTE: The precompiled tables reference the indices that were
+        #   allocated upon the first compilation, so they may only be
+        #   used when nothing has been compiled yet.
+        if self._table_indices:
             return None
 
-    # -----------------------------------------------------------------
-    # Private
-    # -----------------------------------------------------------------
+        if precompiled['key'] != self._route_table_key():
+            return None
+
+        nodes = dict(self._iter_nodes())
+
+        # NOTE: Slots that were not referenced by the saved routing logic are
+        #   filled with None in order to keep the indices aligned.
+        for node_path in precompiled['return_values']:
+            if node_path is None:
+                self._return_values.append(None)
+                continue
+
+            node = nodes[node_path]
+            self._get_table_index(self._return_values, ('return', node), lambda: node)
+
+        for node_path in precompiled['patterns']:
+            if node_path is None:
+                self._patterns.append(None)
+                continue
+
+            node = nodes[node_path]
+            self._get_table_index(self._patterns, ('pattern', node), lambda: node.var_pattern)
+
+        for entry in precompiled['converters']:
+            if entry is None:
+                self._converters.append(None)
+                continue
+
+            node_path, field_name, converter_name, argstr = entry
+            self._get_converter_index(nodes[node_path], field_name, converter_name, argstr)
+
+        self._ast = None
+        self._finder_src = precompiled['source']
+
+        scope = _new_finder_scope()
+        exec(precompiled['code'], scope)
+
+        for node_path, fast_return, name, src in precompiled['subtrees']:
+            self._subtree_finders[nodes[node_path]] = (fast_return, name, src, scope[name])
+
+        return scope['find']
+
+    def _subtree_weight(self, node):
+        weight = 0
+        if node.resource is not None:
+            weight += self._route_weights.get(node.uri_template, 0)
+
+        for child in node.children:
+            weight += self._subtree_weight(child)
+
+        return weight
 
     def _require_coroutine_responders(self, method_map):
         for method, responder in method_map.items():
@@ -320,7 +849,17 @@ class CompiledRouter:
                 msg = msg.format(responder)
                 raise TypeError(msg)
 
-    def _validate_template_segment(self, segment, used_names):
+    def _validate_template(self, uri_template, checked_converters=None):
+        # NOTE(kgriffs): Fields may have whitespace in them, so sub
+        # those before checking the rest of the URI template.
+        if re.search(r'\s', _FIELD_PATTERN.sub('{FIELD}', uri_template)):
+            raise ValueError('URI templates may not include whitespace.')
+
+        used_names = set()
+        for segment in uri_template.lstrip('/').split('/'):
+            self._validate_template_segment(segment, used_names, checked_converters)
+
+    def _validate_template_segment(self, segment, used_names, checked_converters=None):
         """Validate a single path segment of a URI template.
 
         1. Ensure field names are valid Python identifiers, since they
@@ -333,6 +872,10 @@ class CompiledRouter:
               b. For complex nodes, re.compile() raises a nasty error
         3. Check that when the converter syntax is used, the named
            converter exists.
+
+        When a set is passed as `checked_converters`, converters that were
+        already instantiated with the same name and arguments (as recorded
+        in that set) are not instantiated again.
         """
 
         for field in _FIELD_PATTERN.finditer(segment):
@@ -362,6 +905,11 @@ class CompiledRouter:
                 if name not in self._converter_map:
                     msg = 'Unknown converter: "{0}"'.format(name)
                     raise ValueError(msg)
+
+                key = (name, field.group('argstr'))
+                if checked_converters is not None and key in checked_converters:
+                    continue
+
                 try:
                     self._instantiate_converter(
                         self._converter_map[name], field.group('argstr'))
@@ -369,6 +917,9 @@ class CompiledRouter:
                     msg = 'Cannot instantiate converter "{}"'.format(name)
                     raise ValueError(msg) from e
 
+                if checked_converters is not None:
+                    checked_converters.add(key)
+
     def _generate_ast(self, nodes, parent, return_values, patterns, level=0, fast_return=True):
         """Generate a coarse AST for the router."""
 
@@ -382,12 +933,7 @@ class CompiledRouter:
 
         found_simple = False
 
-        # NOTE(kgriffs & philiptzou): Sort nodes in this sequence:
-        # static nodes(0), complex var nodes(1) and simple var nodes(2).
-        # so that none of them get masked.
-        nodes = sorted(
-            nodes, key=lambda node: node.is_var + (node.is_var and
-                                                   not node.is_complex))
+        nodes = self._sort_nodes(nodes)
 
         # NOTE(kgriffs): Down to this branch in the tree, we can do a
         # fast 'return None'. See if the nodes at this branch are
@@ -401,6 +947,11 @@ class CompiledRouter:
 
                 fast_return = not found_var_nodes
 
+        # NOTE: When compiling incrementally, the children of each literal
+        #   root segment are checked by a separate function that is only
+        #   regenerated when routes are added below that segment.
+        incremental = level == 0 and self._options.incremental_compile
+
         for node in nodes:
             if node.is_var:
                 if node.is_complex:
@@ -408,8 +959,8 @@ class CompiledRouter:
                     # contain anything more than a single literal or variable,
                     # and they need to be checked using a pre-compiled regular
                     # expression.
-                    pattern_idx = len(patterns)
-                    patterns.append(node.var_pattern)
+                    pattern_idx = self._get_table_index(
+                        patterns, ('pattern', node), lambda: node.var_pattern)
 
                     construct = _CxIfPathSegmentPattern(level, pattern_idx,
                                                         node.var_pattern.pattern)
@@ -435,18 +986,13 @@ class CompiledRouter:
 
                         field_name = node.var_name
                         __, converter_name, converter_argstr = node.var_converter_map[0]
-                        converter_class = self._converter_map[converter_name]
-
-                        converter_obj = self._instantiate_converter(
-                            converter_class,
-                            converter_argstr
-                        )
-                        converter_idx = len(self._converters)
-                        self._converters.append(converter_obj)
+                        converter_idx = self._get_converter_index(
+                            node, field_name, converter_name, converter_argstr)
 
                         construct = _CxIfConverterField(
                             field_name,
                             converter_idx,
+                            self._converters[converter_idx],
                         )
 
                         parent.append_child(construct)
@@ -473,17 +1019,21 @@ class CompiledRouter:
             if node.resource is not None:
                 # NOTE(kgriffs): This is a valid route, so we will want to
                 # return the relevant information.
-                resource_idx = len(return_values)
-                return_values.append(node)
+                resource_idx = self._get_table_index(
+                    return_values, ('return', node), lambda: node)
 
-            self._generate_ast(
-                node.children,
-                parent,
-                return_values,
-                patterns,
-                level + 1,
-                fast_return
-            )
+            if incremental and node.children and not node.is_var:
+                parent.append_child(
+                    self._get_subtree_finder(node, return_values, patterns, fast_return))
+            else:
+                self._generate_ast(
+                    node.children,
+                    parent,
+                    return_values,
+                    patterns,
+                    level + 1,
+                    fast_return
+                )
 
             if node.resource is None:
                 if fast_return:
@@ -504,24 +1054,70 @@ class CompiledRouter:
         if not found_simple and fast_return:
             parent.append_child(_CxReturnNone())
 
+    def _sort_nodes(self, nodes):
+        # NOTE(kgriffs & philiptzou): Sort nodes in this sequence:
+        # static nodes(0), complex var nodes(1) and simple var nodes(2).
+        # so that none of them get masked.
+        nodes = sorted(
+            nodes, key=lambda node: node.is_var + (node.is_var and
+                                                   not node.is_complex))
+
+        # NOTE: Static nodes at the same level can never match the same
+        #   segment, so it is safe to test the busiest ones first. Var nodes
+        #   keep their relative order, since patterns may overlap.
+        if self._route_weights:
+            nodes = sorted(
+                nodes,
+                key=lambda node: (
+                    0 if not node.is_var else 1 + (not node.is_complex),
+                    0 if node.is_var else -self._subtree_weight(node),
+                )
+            )
+
+        return nodes
+
+    def _get_subtree_finder(self, node, return_values, patterns, fast_return):
+        entry = self._subtree_finders.get(node)
+
+        if entry is None or entry[0] != fast_return or node in self._dirty_subtrees:
+            if entry is None:
+                name = 'find_{}'.format(len(self._subtree_finders))
+            else:
+                name = entry[1]
+
+            construct = _CxSubtreeFinder(name)
+            self._generate_ast(
+                node.children,
+                construct,
+                return_values,
+                patterns,
+                1,
+                fast_return
+            )
+
+            src = construct.src(0)
+            scope = _new_finder_scope()
+            exec(compile(src, '<string>', 'exec'), scope)
+
+            entry = (fast_return, name, src, scope[name])
+            self._subtree_finders[node] = entry
+            self._dirty_subtrees.discard(node)
+
+        return _CxCallSubtreeFinder(entry[1])
+
     def _generate_conversion_ast(self, parent, node):
         # NOTE(kgriffs): Unroll the converter loop into
         # a series of nested "if" constructs.
         for field_name, converter_name, converter_argstr in node.var_converter_map:
-            converter_class = self._converter_map[converter_name]
-
-            converter_obj = self._instantiate_converter(
-                converter_class,
-                converter_argstr
-            )
-            converter_idx = len(self._converters)
-            self._converters.append(converter_obj)
+            converter_idx = self._get_converter_index(
+                node, field_name, converter_name, converter_argstr)
 
             parent.append_child(_CxSetFragmentFromField(field_name))
 
             construct = _CxIfConverterField(
                 field_name,
                 converter_idx,
+                self._converters[converter_idx],
             )
 
             parent.append_child(construct)
@@ -546,9 +1142,40 @@ class CompiledRouter:
             _TAB_STR + 'path_len = len(path)',
         ]
 
-        self._return_values = []
-        self._patterns = []
-        self._converters = []
+        if self._options.profile_route_hits:
+            if self._route_hits is None:
+                self._route_hits = {}
+        else:
+            self._route_hits = None
+
+        if not self._options.incremental_compile:
+            self._subtree_finders = {}
+
+        # NOTE: Subtree finders use the converter classes that were
+        #   configured when they were generated, so none of them may be
+        #   retained once a converter has been added or replaced.
+        converter_map = dict(self._converter_map)
+        if converter_map != self._compiled_converter_map:
+            self._subtree_finders = {}
+            self._compiled_converter_map = converter_map
+
+        if self._precompiled is not None:
+            find = self._load_precompiled(self._precompiled)
+            self._precompiled = None
+            self._precompiled_templates = frozenset()
+
+            if find is not None:
+                self._unvalidated_templates = []
+                self._dirty_subtrees.clear()
+                return find
+
+        if self._unvalidated_templates:
+            for uri_template in self._unvalidated_templates:
+                self._validate_template(uri_template)
+
+            self._unvalidated_templates = []
+
+        self._reset_table_indices()
 
         self._ast = _CxParent()
         self._generate_ast(
@@ -565,10 +1192,22 @@ class CompiledRouter:
             _TAB_STR + 'return None'
         )
 
-        self._finder_src = '\n'.join(src_lines)
+        self._dirty_subtrees.clear()
+        self._previous_table_indices = {}
+
+        subtree_finders = list(self._subtree_finders.values())
+        src = '\n'.join(src_lines)
 
-        scope = {}
-        exec(compile(self._finder_src, '<string>', 'exec'), scope)
+        # NOTE: The source of the subtree functions (if any) is only
+        #   included for reference and so that it may be saved; they are
+        #   already compiled.
+        self._finder_src = '\n\n'.join(
+            [subtree_src for __, __, subtree_src, __ in subtree_finders] + [src]
+        )
+
+        scope = _new_finder_scope()
+        scope.update((name, func) for __, name, __, func in subtree_finders)
+        exec(compile(src, '<string>', 'exec'), scope)
 
         return scope['find']
 
@@ -593,13 +1232,22 @@ class CompiledRouter:
             if self._find == self._compile_and_find:
                 # NOTE(caselit): replace the find with the result of the router compilation
                 self._find = self._compile()
-        # NOTE(caselit): return_values, patterns, converters are reset by the _compile
-        # method, so the updated ones must be used
+        # NOTE(caselit): return_values, patterns, converters may be extended by the
+        # _compile method, so the updated ones must be used
         return self._find(
             path, self._return_values, self._patterns, self._converters, params
         )
 
 
+def _new_finder_scope():
+    # NOTE: Globals that may be referenced by the generated code in order to
+    #   convert field values inline (see also: _CxIfConverterField).
+    return {
+        'UUID': uuid.UUID,
+        'strptime': datetime.strptime,
+    }
+
+
 class CompiledRouterNode:
     """Represents a single URI segment in a URI."""
 
@@ -718,8 +1366,9 @@ class CompiledRouterNode:
         #   string, complex ==> False
         #   string, string ==> False
         #
-        other = CompiledRouterNode(segment)
+        return self._conflicts_with_node(CompiledRouterNode(segment))
 
+    def _conflicts_with_node(self, other):
         if self.is_var:
             # NOTE(kgriffs & philiptzou): Falcon does not accept multiple
             # simple var nodes exist at the same level as following:
@@ -742,7 +1391,7 @@ class CompiledRouterNode:
             if self.is_complex:
                 if other.is_complex:
                     return (_FIELD_PATTERN.sub('v', self.raw_segment) ==
-                            _FIELD_PATTERN.sub('v', segment))
+                            _FIELD_PATTERN.sub('v', other.raw_segment))
 
                 return False
             else:
@@ -819,15 +1468,47 @@ class CompiledRouterOptions:
                 manner.
 
             (See also: :ref:`Field Converters <routing_field_converters>`)
+
+        profile_route_hits (bool): Set to ``True`` to count the number of
+            requests routed to each URI template (default ``False``). The
+            counts are exposed via :attr:`.CompiledRouter.route_hits`.
+            Changing this option takes effect the next time the routing
+            logic is compiled.
+        profile_recompile_interval (int): When
+            :attr:`~.profile_route_hits` is enabled, the number of routed
+            requests after which the routing logic is recompiled so that
+            the most frequently requested routes are tested first (see also:
+            :meth:`.CompiledRouter.load_route_profile`). The default value of
+            ``0`` disables automatic recompilation.
+        incremental_compile (bool): Set to ``True`` to generate a separate
+            function for the routes below each literal segment at the root
+            of the routing tree, and to only regenerate the functions for
+            the segments below which routes were added since the routing
+            logic was last compiled (default ``False``). This reduces the
+            cost of recompiling the routing logic when routes are added
+            after the first request has been routed, at the expense of an
+            additional function call when routing a request. Note that
+            replacing the resource of an existing route never requires the
+            routing logic to be recompiled, whereas adding or replacing a
+            field converter causes every function to be regenerated.
     """
 
-    __slots__ = ('converters',)
+    __slots__ = (
+        'converters',
+        'incremental_compile',
+        'profile_route_hits',
+        'profile_recompile_interval',
+    )
 
     def __init__(self):
         self.converters = ConverterDict(
             (name, converter) for name, converter in converters.BUILTIN
         )
 
+        self.incremental_compile = False
+        self.profile_route_hits = False
+        self.profile_recompile_interval = 0
+
 
 # --------------------------------------------------------------------
 # AST Constructs
@@ -861,6 +1542,26 @@ class _CxParent:
         return '\n'.join(src_lines)
 
 
+class _CxSubtreeFinder(_CxParent):
+    def __init__(self, name):
+        super().__init__()
+        self._name = name
+
+    def src(self, indentation):
+        template = (
+            '{0}def {1}(path, path_len, return_values, patterns, converters, params):\n'
+            '{2}\n'
+            '{3}return None'
+        )
+
+        return template.format(
+            _TAB_STR * indentation,
+            self._name,
+            self._children_src(indentation + 1),
+            _TAB_STR * (indentation + 1),
+        )
+
+
 class _CxIfPathLength(_CxParent):
     def __init__(self, comparison, length):
         super(_CxIfPathLength, self).__init__()
@@ -916,17 +1617,15 @@ class _CxIfPathSegmentPattern(_CxParent):
 
 
 class _CxIfConverterField(_CxParent):
-    def __init__(self, field_name, converter_idx):
+    def __init__(self, field_name, converter_idx, converter=None):
         super(_CxIfConverterField, self).__init__()
         self._field_name = field_name
         self._converter_idx = converter_idx
+        self._converter = converter
 
     def src(self, indentation):
         lines = [
-            '{0}field_value = converters[{1}].convert(fragment)'.format(
-                _TAB_STR * indentation,
-                self._converter_idx,
-            ),
+            self._conversion_src(indentation),
             '{0}if field_value is not None:'.format(_TAB_STR * indentation),
             "{0}params['{1}'] = field_value".format(
                 _TAB_STR * (indentation + 1),
@@ -937,6 +1636,83 @@ class _CxIfConverterField(_CxParent):
 
         return '\n'.join(lines)
 
+    def _conversion_src(self, indentation):
+        # PERF: Inline the conversion logic of the built-in converters in
+        #   order to avoid the overhead of a method call. Subclasses may
+        #   override convert(), so they always go through the call path.
+        converter_type = type(self._converter)
+
+        if converter_type is converters.IntConverter:
+            lines = self._int_conversion_lines()
+        elif converter_type is converters.UUIDConverter:
+            lines = self._call_conversion_lines('UUID(fragment)')
+        elif (converter_type is converters.DateTimeConverter and
+                isinstance(self._converter._format_string, str)):
+            lines = self._call_conversion_lines(
+                'strptime(fragment, {0!r})'.format(self._converter._format_string))
+        else:
+            lines = None
+
+        if lines is None:
+            lines = [
+                'field_value = converters[{0}].convert(fragment)'.format(self._converter_idx),
+            ]
+
+        return '\n'.join(_TAB_STR * indentation + line for line in lines)
+
+    def _int_conversion_lines(self):
+        num_digits = self._converter._num_digits
+        min_value = self._converter._min
+        max_value = self._converter._max
+
+        if not all(value is None or type(value) is int
+                   for value in (num_digits, min_value, max_value)):
+            return None
+
+        # NOTE: Unicode decimal strings are exactly those that int() accepts
+        #   without any sign, whitespace or underscores; IntConverter
+        #   handles any other values.
+        if num_digits is not None and num_digits <= _MAX_INLINE_INT_DIGITS:
+            condition = 'len(fragment) == {0} and fragment.isdecimal()'.format(num_digits)
+        else:
+            condition = 'len(fragment) <= {0} and fragment.isdecimal()'.format(
+                _MAX_INLINE_INT_DIGITS)
+
+        checks = []
+        if num_digits is not None and num_digits > _MAX_INLINE_INT_DIGITS:
+            checks.append('len(fragment) != {0}'.format(num_digits))
+        if min_value is not None:
+            checks.append('field_value < {0!r}'.format(min_value))
+        if max_value is not None:
+            checks.append('field_value > {0!r}'.format(max_value))
+
+        lines = [
+            'if {0}:'.format(condition),
+            _TAB_STR + 'field_value = int(fragment)',
+        ]
+
+        if checks:
+            lines += [
+                _TAB_STR + 'if {0}:'.format(' or '.join(checks)),
+                _TAB_STR * 2 + 'field_value = None',
+            ]
+
+        lines += [
+            'else:',
+            _TAB_STR + 'field_value = converters[{0}].convert(fragment)'.format(
+                self._converter_idx),
+        ]
+
+        return lines
+
+    def _call_conversion_lines(self, expression):
+        return [
+            'try:',
+            _TAB_STR + 'field_value = ' + expression,
+            'except ValueError:',
+            _TAB_STR + 'field_value = None',
+        ]
+
 
 class _CxSetFragmentFromField:
     def __init__(self, field_name):
@@ -986,6 +1762,20 @@ class _CxReturnNone:
         return '{0}return None'.format(_TAB_STR * indentation)
 
 
+class _CxCallSubtreeFinder:
+    def __init__(self, name):
+        self._name = name
+
+    def src(self, indentation):
+        lines = [
+            '{0}return_value = {1}(path, path_len, return_values, patterns, converters, params)',
+            '{0}if return_value is not None:',
+            '{0}{2}return return_value',
+        ]
+
+        return '\n'.join(lines).format(_TAB_STR * indentation, self._name, _TAB_STR)
+
+
 class _CxReturnValue:
     def __init__(self, value_idx):
         self._value_idx = value_idx
@@ -1,12 +1,36 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from functools import partial
 import io
 import os
 import re
+import stat
+from threading import Lock
+import time
 
 import falcon
+from falcon.util.misc import _negotiate_content_codings
 from falcon.util.sync import get_running_loop
 
 
+# NOTE: Content codings of precompressed files, in order of preference.
+_PRECOMPRESSED_ENCODINGS = ('br', 'gzip')
+
+_PRECOMPRESSED_SUFFIXES = {
+    'br': '.br',
+    'gzip': '.gz',
+}
+
+# NOTE: File I/O for ASGI static routes is run on a dedicated executor, so
+#   that large downloads neither starve nor are starved by other work that
+#   is offloaded to the event loop's default executor.
+_FILE_IO_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_file_io_executor = None
+_file_io_executor_lock = Lock()
+
+
 class StaticRoute:
     """Represents a static route.
 
@@ -36,6 +60,35 @@ class StaticRoute:
                 Content-Disposition header (provided it was requested with the
                 `downloadable` parameter described above), are derived from the
                 fallback filename, as opposed to the requested filename.
+
+        cache_control (dict): A mapping of file suffixes (e.g., ``'.css'``)
+            to the value of the Cache-Control header that should be set when
+            serving files with that suffix. The value may be either a string
+            (e.g., ``'max-age=3600'``), or a list of directives that will be
+            joined with ``', '``. The value mapped to the special key
+            ``'*'``, if any, is used for any other suffix.
+        stat_cache_ttl (float): Number of seconds for which the results of
+            ``os.stat()`` are cached for each file (default ``1.0``). The ETag
+            and Last-Modified headers, which are derived from the size and
+            modification time of the file, may therefore be out of date for up
+            to that long after a file is modified. Set to ``0`` to disable
+            caching.
+        file_cache (StaticFileCache): Cache from which to serve the contents
+            of small files, rather than reading them from disk for each
+            request (default ``None``). The same cache may be shared by
+            several routes.
+        precompressed (bool): Set to ``True`` to serve a precompressed
+            sibling of the requested file (i.e., the same filename with a
+            ``.br`` or ``.gz`` suffix appended), if one exists and the
+            client accepts its content coding, as indicated by the
+            Accept-Encoding request header (default ``False``). When both
+            are available and equally acceptable, Brotli is preferred over
+            gzip.
+
+    The ETag and Last-Modified headers are set for each file that is served.
+    When a GET or HEAD request includes either an If-None-Match or an
+    If-Modified-Since header, and the file has not been modified, a
+    ``304 Not Modified`` response is returned instead of the file.
     """
 
     # NOTE(kgriffs): Don't allow control characters and reserved chars
@@ -46,7 +99,12 @@ class StaticRoute:
     # minimizes how much can be included in the payload.
     _MAX_NON_PREFIXED_LEN = 512
 
-    def __init__(self, prefix, directory, downloadable=False, fallback_filename=None):
+    # NOTE: Maximum number of paths for which os.stat() results are cached.
+    _STAT_CACHE_MAX_SIZE = 4096
+
+    def __init__(self, prefix, directory, downloadable=False, fallback_filename=None,
+                 cache_control=None, stat_cache_ttl=1.0, file_cache=None,
+                 precompressed=False):
         if not prefix.startswith('/'):
             raise ValueError("prefix must start with '/'")
 
@@ -72,6 +130,16 @@ class StaticRoute:
         self._prefix = prefix
         self._downloadable = downloadable
 
+        self._cache_control = {
+            suffix: value if isinstance(value, str) else ', '.join(value)
+            for suffix, value in (cache_control or {}).items()
+        }
+        self._default_cache_control = self._cache_control.pop('*', None)
+
+        self._stat_cache = _StatCache(stat_cache_ttl, self._STAT_CACHE_MAX_SIZE)
+        self._file_cache = file_cache
+        self._precompressed = precompressed
+
     def match(self, path):
         """Check whether the given path matches this route."""
         if self._fallback_filename is None:
@@ -81,6 +149,104 @@ class StaticRoute:
     def __call__(self, req, resp):
         """Resource responder for this route."""
 
+        file_path = self._get_file_path(req)
+
+        # NOTE: The path of the file that is actually served, which is
+        #   different from file_path when serving a precompressed file.
+        content_path = file_path
+        encoding = None
+        stat_result = None
+
+        if self._precompressed:
+            # NOTE: The response varies by Accept-Encoding, regardless of
+            #   whether a precompressed file ends up being served.
+            resp.append_header('Vary', 'Accept-Encoding')
+
+            precompressed = self._find_precompressed(req, file_path)
+            if precompressed is not None:
+                content_path, encoding, stat_result = precompressed
+
+        # PERF: Avoid opening the file at all when the client already has
+        #   an up-to-date copy of it.
+        if stat_result is None:
+            stat_result = self._stat_cache.stat(file_path)
+
+        if stat_result is None:
+            stream, file_path = self._open(file_path)
+            content_path = file_path
+            stat_result = self._stat_cache.stat(file_path)
+        else:
+            stream = None
+
+        data = None
+        suffix = os.path.splitext(file_path)[1]
+
+        etag, last_modified = self._set_cache_headers(resp, suffix, stat_result)
+
+        if stat_result is not None:
+            if self._is_not_modified(req, etag, last_modified):
+                if stream is not None:
+                    stream.close()
+
+                resp.status = falcon.HTTP_304
+                return
+
+            # PERF: Serve small files from memory, when possible.
+            if stream is None and self._file_cache is not None:
+                data = self._file_cache.get(content_path, stat_result)
+
+        if data is not None:
+            resp.data = data
+        else:
+            if stream is None:
+                stream, opened_path = self._open(content_path)
+
+                # NOTE: The file was removed since it was stat'ed, and the
+                #   fallback file was opened instead.
+                #   Since the validators and Cache-Control header set above
+                #   describe the removed file, they are replaced with those
+                #   of the fallback file.
+                if opened_path != content_path:
+                    file_path = opened_path
+                    encoding = None
+                    suffix = os.path.splitext(file_path)[1]
+
+                    self._set_cache_headers(
+                        resp, suffix, self._stat_cache.stat(opened_path))
+
+            resp.stream = stream
+
+        if encoding is not None:
+            resp.set_header('Content-Encoding', encoding)
+
+        resp.content_type = resp.options.static_media_types.get(
+            suffix,
+            'application/octet-stream'
+        )
+
+        if self._downloadable:
+            resp.downloadable_as = os.path.basename(file_path)
+
+    def _set_cache_headers(self, resp, suffix, stat_result):
+        cache_control = self._cache_control.get(suffix, self._default_cache_control)
+        if cache_control is None:
+            resp.delete_header('Cache-Control')
+        else:
+            resp.set_header('Cache-Control', cache_control)
+
+        if stat_result is None:
+            etag = last_modified = None
+        else:
+            etag = '{0:x}-{1:x}'.format(stat_result.st_mtime_ns, stat_result.st_size)
+            last_modified = datetime.utcfromtimestamp(int(stat_result.st_mtime))
+
+        # NOTE: Setting either header to None removes it.
+        resp.etag = etag
+        resp.last_modified = last_modified
+
+        return etag, last_modified
+
+    def _get_file_path(self, req):
         without_prefix = req.path[len(self._prefix):]
 
         # NOTE(kgriffs): Check surrounding whitespace and strip trailing
@@ -108,43 +274,279 @@ class StaticRoute:
         if '..' in file_path or not file_path.startswith(self._directory):
             raise falcon.HTTPNotFound()
 
+        return file_path
+
+    def _open(self, file_path):
         try:
-            resp.stream = io.open(file_path, 'rb')
+            return io.open(file_path, 'rb'), file_path
         except IOError:
             if self._fallback_filename is None:
                 raise falcon.HTTPNotFound()
             try:
-                resp.stream = io.open(self._fallback_filename, 'rb')
-                file_path = self._fallback_filename
+                return io.open(self._fallback_filename, 'rb'), self._fallback_filename
             except IOError:
                 raise falcon.HTTPNotFound()
 
-        suffix = os.path.splitext(file_path)[1]
-        resp.content_type = resp.options.static_media_types.get(
-            suffix,
-            'application/octet-stream'
-        )
+    def _find_precompressed(self, req, file_path):
+        accept_encoding = req.get_header('Accept-Encoding')
+        if not accept_encoding:
+            return None
 
-        if self._downloadable:
-            resp.downloadable_as = os.path.basename(file_path)
+        for encoding in _negotiate_content_codings(accept_encoding, _PRECOMPRESSED_ENCODINGS):
+            compressed_path = file_path + _PRECOMPRESSED_SUFFIXES[encoding]
+            stat_result = self._stat_cache.stat(compressed_path)
+
+            if stat_result is not None:
+                return compressed_path, encoding, stat_result
+
+        return None
+
+    def _is_not_modified(self, req, etag, last_modified):
+        # NOTE: See also RFC 7232, Section 6. Since static routes serve any
+        #   method, only evaluate these preconditions for GET and HEAD.
+        if req.method not in ('GET', 'HEAD'):
+            return False
+
+        if_none_match = req.if_none_match
+        if if_none_match is not None:
+            # NOTE: The weak comparison function is used, so the is_weak
+            #   flag of each ETag (which is a str) is ignored.
+            return if_none_match == ['*'] or etag in if_none_match
+
+        try:
+            if_modified_since = req.if_modified_since
+        except falcon.HTTPInvalidHeader:
+            # NOTE: An invalid date must be ignored (RFC 7232, Section 3.3)
+            return False
+
+        if if_modified_since is None:
+            return False
+
+        return last_modified <= if_modified_since
 
 
 class StaticRouteAsync(StaticRoute):
-    """Subclass of StaticRoute with modifications to support ASGI apps."""
+    """Subclass of StaticRoute with modifications to support ASGI apps.
+
+    When the ASGI server advertises support for either the
+    ``http.response.pathsend`` or the ``http.response.zerocopysend``
+    extension, files are handed off to the server to be sent directly.
+    Otherwise, files are read on a dedicated, bounded thread pool using
+    progressively larger blocks.
+    """
 
     async def __call__(self, req, resp):
         super().__call__(req, resp)
 
         # NOTE(kgriffs): Fixup resp.stream so that it is non-blocking
-        resp.stream = _AsyncFileReader(resp.stream)
+        if resp.stream is not None:
+            resp.stream = _AsyncFileReader(resp.stream)
+
+
+class StaticFileCache:
+    """Size-bounded, in-memory LRU cache of the contents of static files.
+
+    A cache may be passed to :meth:`falcon.App.add_static_route` (or
+    :meth:`falcon.asgi.App.add_static_route`) in order to serve small,
+    frequently requested files as a single buffer, rather than opening
+    and streaming them for each request::
+
+        file_cache = falcon.routing.StaticFileCache(max_size=64 * 1024 * 1024)
+        app.add_static_route('/assets', assets_path, file_cache=file_cache)
+
+    Cached contents are keyed by the path of the file, and are discarded
+    as soon as the size or modification time of the file are found to
+    have changed (see also the `stat_cache_ttl` argument of
+    :meth:`~falcon.App.add_static_route`).
+
+    Keyword Args:
+        max_size (int): Maximum total size, in bytes, of the cached contents
+            (default 16 MiB). The least recently used files are evicted
+            once this size is exceeded.
+        max_file_size (int): Maximum size, in bytes, of a file for it to be
+            cached (default 256 KiB). Larger files are always streamed.
+
+    Attributes:
+        hits (int): Number of lookups that were served from the cache.
+        misses (int): Number of lookups that were not served from the
+            cache, including lookups of files that were too large to be
+            cached.
+    """
+
+    def __init__(self, max_size=16 * 1024 * 1024, max_file_size=256 * 1024):
+        self.hits = 0
+        self.misses = 0
+
+        self._max_size = max_size
+        self._max_file_size = max_file_size
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    @property
+    def size(self):
+        """Total size, in bytes, of the cached contents."""
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all the cached contents, and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, path, stat_result):
+        """Get the contents of a file, reading and caching them as needed.
+
+        Args:
+            path (str): Path of the file.
+            stat_result (os.stat_result): Current status of the file, used to
+                determine whether the cached contents are still up to date.
+
+        Returns:
+            bytes: Contents of the file, or ``None`` if the file is too large
+            to be cached, or if it could not be read.
+        """
+
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+
+        if stat_result.st_size > self._max_file_size or stat_result.st_size > self._max_size:
+            return None
+
+        try:
+            with io.open(path, 'rb') as cached_file:
+                data = cached_file.read(self._max_file_size + 1)
+        except IOError:
+            return None
+
+        # NOTE: The file was modified since it was stat'ed.
+        if len(data) != stat_result.st_size:
+            return None
+
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+
+            self._entries[path] = (version, data)
+            self._size += len(data)
+
+            while self._size > self._max_size:
+                __, (__, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+        return data
+
+
+class _StatCache:
+    """Bounded cache of os.stat() results for regular files.
+
+    Results (including the absence of a regular file at the given path) are
+    cached for `ttl` seconds. Once the cache holds `max_size` entries, the
+    oldest entry is evicted to make room for a new one.
+    """
+
+    def __init__(self, ttl, max_size):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries = {}
+        self._lock = Lock()
+
+    def stat(self, path):
+        now = time.monotonic()
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        try:
+            stat_result = os.stat(path)
+        except (OSError, ValueError):
+            stat_result = None
+        else:
+            if not stat.S_ISREG(stat_result.st_mode):
+                stat_result = None
+
+        if self._ttl > 0:
+            with self._lock:
+                self._entries.pop(path, None)
+                if len(self._entries) >= self._max_size:
+                    del self._entries[next(iter(self._entries))]
+
+                self._entries[path] = (now + self._ttl, stat_result)
+
+        return stat_result
+
+
+def _get_file_io_executor():
+    global _file_io_executor
+
+    if _file_io_executor is None:
+        with _file_io_executor_lock:
+            if _file_io_executor is None:
+                _file_io_executor = ThreadPoolExecutor(
+                    max_workers=_FILE_IO_MAX_WORKERS,
+                    thread_name_prefix='falcon-file-io',
+                )
+
+    return _file_io_executor
 
 
 class _AsyncFileReader:
     """Adapts a standard file I/O object so that reads are non-blocking."""
 
+    # PERF: Start with a block size that lets most files be read with a
+    #   single trip to the executor, and then double it with each full
+    #   read in order to cut down on thread hops for large files.
+    _MIN_BLOCK_SIZE = 64 * 1024
+    _MAX_BLOCK_SIZE = 1024 * 1024
+
     def __init__(self, file):
         self._file = file
         self._loop = get_running_loop()
+        self._executor = _get_file_io_executor()
+        self._block_size = self._MIN_BLOCK_SIZE
+
+    @property
+    def file(self):
+        return self._file
+
+    @property
+    def path(self):
+        name = getattr(self._file, 'name', None)
+        return os.path.abspath(name) if isinstance(name, str) else None
 
     async def read(self, size=-1):
-        return await self._loop.run_in_executor(None, partial(self._file.read, size))
+        return await self._loop.run_in_executor(self._executor, partial(self._file.read, size))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        block_size = self._block_size
+
+        data = await self.read(block_size)
+        if not data:
+            raise StopAsyncIteration
+
+        if len(data) == block_size and block_size < self._MAX_BLOCK_SIZE:
+            self._block_size = block_size * 2
+
+        return data
+
+    async def close(self):
+        self._file.close()
@@ -157,3 +157,24 @@ def set_default_responders(method_map, asgi=False):
     for method in constants.COMBINED_METHODS:
         if method not in allowed_methods:
             method_map[method] = na_responder
+
+
+def _unpack_route(route, kwargs):
+    """Unpack a route passed to ``add_routes()`` into its components.
+
+    Args:
+        route (tuple): A ``(uri_template, resource)`` or
+            ``(uri_template, resource, kwargs)`` tuple.
+        kwargs (dict): Keyword arguments that apply to every route, unless
+            overridden by the `kwargs` of the route itself.
+
+    Returns:
+        tuple: A ``(uri_template, resource, kwargs)`` tuple.
+    """
+
+    if len(route) == 3:
+        uri_template, resource, route_kwargs = route
+        return uri_template, resource, dict(kwargs, **route_kwargs)
+
+    uri_template, resource = route
+    return uri_template, resource, kwargs
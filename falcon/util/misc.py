@@ -465,6 +465,53 @@ def code_to_http_status(status):
         return '{} {}'.format(code, _DEFAULT_HTTP_REASON)
 
 
+@_lru_cache_safe(maxsize=64)
+def _negotiate_content_codings(accept_encoding, codings):
+    """Select the content codings that are acceptable to the client.
+
+    Args:
+        accept_encoding (str): Value of the Accept-Encoding header.
+        codings (tuple): Content codings supported by the server, in order
+            of preference.
+
+    Returns:
+        tuple: The subset of `codings` that is acceptable to the client,
+        sorted by the client's preference, and then by the server's.
+    """
+
+    qvalues = {}
+    for coding in accept_encoding.split(','):
+        coding, __, params = coding.partition(';')
+        coding = coding.strip().lower()
+
+        qvalue = 1.0
+        params = params.strip().lower()
+        if params.startswith('q='):
+            try:
+                qvalue = float(params[2:])
+            except ValueError:
+                qvalue = 0.0
+
+        if coding:
+            qvalues[coding] = qvalue
+
+    # NOTE: Only defer to the identity encoding when the client explicitly
+    #   states its preference for it, since it is always acceptable otherwise.
+    default = qvalues.get('*', 0.0)
+    identity = qvalues.get('identity', default)
+
+    acceptable = [
+        (qvalues.get(coding, default), idx, coding)
+        for idx, coding in enumerate(codings)
+    ]
+
+    return tuple(
+        coding
+        for qvalue, __, coding in sorted(acceptable, key=lambda a: (-a[0], a[1]))
+        if qvalue > 0 and qvalue >= identity
+    )
+
+
 def _isascii(string):
     """Return ``True`` if all characters in the string are ASCII.
 
@@ -182,6 +182,7 @@ setup(
     entry_points={
         'console_scripts': [
             'falcon-bench = falcon.cmd.bench:main',
+            'falcon-compile-router = falcon.cmd.compile_router:main',
             'falcon-inspect-app = falcon.cmd.inspect_app:main',
             'falcon-print-routes = falcon.cmd.inspect_app:route_main',
         ]
@@ -0,0 +1,20 @@
+# NOTE: These models are defined in a separate module, since variable
+#   annotations are not supported by Python 3.5.
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: float = 1.0
+
+
+@dataclass
+class Order:
+    id: int
+    tags: List[Tag]
+    parent: Optional['Order'] = None
+    totals: Dict[str, Tag] = field(default_factory=dict)
+    notes: str = field(default='', init=False)
@@ -0,0 +1,245 @@
+import asyncio
+import io
+import threading
+
+import pytest
+
+import falcon
+from falcon import media, testing
+import falcon.asgi
+from falcon.asgi import offload
+
+
+class MediaResource:
+
+    def __init__(self, document=None):
+        self._document = document
+        self.received = None
+
+    async def on_get(self, req, resp):
+        resp.media = self._document
+
+    async def on_post(self, req, resp):
+        self.received = await req.get_media()
+        resp.status = falcon.HTTP_NO_CONTENT
+
+
+class RecordingHandler(media.JSONHandler):
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def deserialize(self, stream, content_type, content_length):
+        self.threads.append(threading.current_thread().name)
+        return super().deserialize(stream, content_type, content_length)
+
+    def serialize(self, media, content_type):
+        self.threads.append(threading.current_thread().name)
+        return super().serialize(media, content_type)
+
+
+@pytest.fixture
+def pool():
+    pool = falcon.asgi.MediaOffloadPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def handler():
+    return RecordingHandler()
+
+
+def create_client(resource, handler, pool, threshold=100, media_type=falcon.MEDIA_JSON):
+    app = falcon.asgi.App()
+    app.add_route('/', resource)
+    app.resp_options.default_media_type = media_type
+
+    app.req_options.media_offload_threshold = threshold
+    app.resp_options.media_offload_min_items = threshold
+
+    for options in (app.req_options, app.resp_options):
+        options.media_handlers[media_type] = handler
+        options.media_offload_pool = pool
+
+    return testing.TestClient(app)
+
+
+def test_options_defaults():
+    app = falcon.asgi.App()
+
+    assert app.req_options.media_offload_threshold is None
+    assert app.resp_options.media_offload_min_items is None
+
+    for options in (app.req_options, app.resp_options):
+        assert options.media_offload_pool is None
+
+
+@pytest.mark.parametrize('count,offloaded', [
+    (10, False),
+    (1000, True),
+])
+def test_serialize(handler, pool, count, offloaded):
+    document = [{'id': i, 'name': 'item {0}'.format(i)} for i in range(count)]
+    client = create_client(MediaResource(document), handler, pool)
+
+    result = client.simulate_get()
+    assert result.status_code == 200
+    assert result.json == document
+    assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+
+    assert pool.submitted == pool.completed == int(offloaded)
+    if offloaded:
+        assert handler.threads[0].startswith('falcon-media')
+    else:
+        # NOTE: serialize_async() is awaited on the event loop instead.
+        assert handler.threads == []
+
+
+@pytest.mark.parametrize('count,offloaded', [
+    (10, False),
+    (1000, True),
+])
+def test_deserialize(handler, pool, count, offloaded):
+    document = list(range(count))
+    resource = MediaResource()
+    client = create_client(resource, handler, pool)
+
+    result = client.simulate_post(json=document)
+    assert result.status_code == 204
+    assert resource.received == document
+
+    assert pool.submitted == pool.completed == int(offloaded)
+    if offloaded:
+        assert handler.threads[0].startswith('falcon-media')
+    else:
+        assert handler.threads == []
+
+
+def test_deserialize_unknown_length(handler, pool):
+    body = b'[' + b', '.join(b'1' for _ in range(100)) + b']'
+    scope = testing.create_scope(
+        method='POST', headers={'Content-Type': falcon.MEDIA_JSON})
+
+    options = falcon.RequestOptions()
+    options.media_handlers[falcon.MEDIA_JSON] = handler
+    options.media_offload_threshold = 10
+    options.media_offload_pool = pool
+
+    req = falcon.asgi.Request(scope, testing.ASGIRequestEventEmitter(body), options=options)
+    assert req.content_length is None
+
+    assert falcon.invoke_coroutine_sync(req.get_media) == [1] * 100
+    assert pool.submitted == 0
+
+
+def test_handler_not_offloadable(pool):
+    handler = media.MessagePackHandler(sequence=True)
+    assert not handler.offloadable
+    assert media.MessagePackHandler().offloadable
+    assert not media.URLEncodedFormHandler().offloadable
+
+    resource = MediaResource()
+    client = create_client(resource, media.JSONHandler(), pool)
+    client.app.req_options.media_handlers['application/x-msgpack-seq'] = handler
+
+    result = client.simulate_post(
+        body=handler.serialize(list(range(1000)), None),
+        content_type='application/x-msgpack-seq')
+    assert result.status_code == 204
+    assert hasattr(resource.received, '__aiter__')
+    assert pool.submitted == 0
+
+
+def test_default_pool(handler):
+    document = list(range(1000))
+    client = create_client(MediaResource(document), handler, None)
+
+    default_pool = offload.get_default_pool()
+    assert offload.get_default_pool() is default_pool
+    submitted = default_pool.submitted
+
+    assert client.simulate_get().json == document
+    assert default_pool.submitted == submitted + 1
+
+
+def test_error_propagates(pool):
+    client = create_client(MediaResource(), media.JSONHandler(), pool, threshold=1)
+
+    result = client.simulate_post(
+        body=b'{"invalid": ', content_type=falcon.MEDIA_JSON)
+    assert result.status_code == 400
+    assert result.json['title'] == 'Invalid JSON'
+    assert pool.submitted == pool.completed == 1
+    assert pool.in_flight == 0
+
+
+def test_queue_depth_metrics(pool):
+    release = threading.Event()
+    observed = []
+
+    async def run_jobs():
+        jobs = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        observed.append((pool.in_flight, pool.queue_depth))
+        release.set()
+        await asyncio.gather(*jobs)
+
+    falcon.invoke_coroutine_sync(run_jobs)
+
+    assert pool.max_workers == 2
+    assert observed == [(5, 3)]
+    assert pool.peak_queue_depth == 3
+    assert pool.submitted == pool.completed == 5
+    assert pool.in_flight == pool.queue_depth == 0
+
+
+@pytest.mark.parametrize('media_type,handler_class', [
+    (falcon.MEDIA_JSON, media.JSONHandler),
+    (falcon.MEDIA_MSGPACK, media.MessagePackHandler),
+])
+def test_process_pool(media_type, handler_class):
+    if handler_class is media.MessagePackHandler:
+        pytest.importorskip('msgpack')
+
+    pool = falcon.asgi.MediaOffloadPool(max_workers=1, use_processes=True)
+    handler = handler_class()
+    document = [{'id': i} for i in range(1000)]
+
+    try:
+        resource = MediaResource(document)
+        client = create_client(resource, handler, pool, media_type=media_type)
+
+        result = client.simulate_get()
+        assert result.status_code == 200
+        assert result.headers['Content-Type'] == media_type
+        assert handler.deserialize(io.BytesIO(result.content), media_type, None) == document
+
+        result = client.simulate_post(
+            body=handler.serialize(document, media_type), content_type=media_type)
+        assert result.status_code == 204
+        assert resource.received == document
+    finally:
+        pool.shutdown()
+
+    assert pool.submitted == pool.completed == 2
+
+
+@pytest.mark.parametrize('media,expected', [
+    (None, 0),
+    ('string', 0),
+    ([1, 2, 3], 3),
+    ({'a': [1, 2], 'b': {'c': 1}, 'd': 'e'}, 6),
+    ([{'a': 1, 'b': 2}] * 3, 9),
+    ([[[1, 2, 3]]], 2),
+])
+def test_estimate_media_size(media, expected):
+    assert offload.estimate_media_size(media, 100) == expected
+
+
+def test_estimate_media_size_stops_early():
+    document = [list(range(10))] * 20
+    assert offload.estimate_media_size(document, 50) == 60
+    assert offload.estimate_media_size(list(range(1000)), 50) == 1000
@@ -13,3 +13,20 @@ def test_log_error_not_supported():
     req = testing.create_asgi_req()
     with pytest.raises(NotImplementedError):
         req.log_error('Boink')
+
+
+def test_headers_decoded_lazily():
+    req = testing.create_asgi_req(headers={'X-Things': 'cookies', 'Content-Type': 'text/plain'})
+    req.scope['headers'] = list(req.scope['headers']) + [(b'x-things', b'cream')]
+
+    assert req.get_header('X-Things') == 'cookies,cream'
+    assert req.headers['x-things'] == 'cookies,cream'
+    assert req.content_type == 'text/plain'
+
+
+def test_content_type_override():
+    req = testing.create_asgi_req(headers={'Content-Type': 'text/plain'})
+    req.content_type = 'application/json'
+
+    assert req.content_type == 'application/json'
+    assert req.get_header('Content-Type') == 'text/plain'
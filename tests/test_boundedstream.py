@@ -15,3 +15,26 @@ def test_not_writable(bounded_stream):
 
     with pytest.raises(IOError):
         bounded_stream.write(b'something something')
+
+
+class _ReadOnlyStream:
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
+@pytest.mark.parametrize('stream_type', [io.BytesIO, _ReadOnlyStream])
+def test_readinto(stream_type):
+    stream = BoundedStream(stream_type(b'0123456789'), 6)
+    buffer = bytearray(4)
+
+    assert stream.readinto(buffer) == 4
+    assert buffer == b'0123'
+
+    assert stream.readinto(buffer) == 2
+    assert buffer == b'4523'
+
+    assert stream.readinto(buffer) == 0
+    assert stream.eof
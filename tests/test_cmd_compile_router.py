@@ -0,0 +1,74 @@
+import sys
+
+import pytest
+
+from falcon.cmd import compile_router
+from falcon.routing import CompiledRouter
+
+from _util import create_app  # NOQA
+
+_MODULE = 'tests.test_cmd_compile_router'
+
+
+class DummyResource:
+
+    def on_get(self, req, resp):
+        resp.body = 'Test\n'
+
+
+class DummyRouter:
+
+    def add_route(self, uri_template, resource, **kwargs):
+        pass
+
+    def find(self, uri, req=None):
+        return None
+
+
+def make_app():
+    app = create_app(False)
+    app.add_route('/test/{id:int}', DummyResource())
+
+    return app
+
+
+def make_app_custom_router():
+    return create_app(False, router=DummyRouter())
+
+
+def test_make_parser():
+    parser = compile_router.make_parser()
+
+    args = parser.parse_args(['foo:app'])
+    assert args.app_module == 'foo:app'
+    assert args.output == 'routes.precompiled'
+
+    args = parser.parse_args(['foo:app', '-o', 'bar.bin'])
+    assert args.output == 'bar.bin'
+
+
+def test_main(tmpdir, monkeypatch):
+    output = str(tmpdir.join('routes.precompiled'))
+    monkeypatch.setattr(
+        sys, 'argv', ['falcon-compile-router', _MODULE + ':make_app', '-o', output])
+
+    compile_router.main()
+
+    router = CompiledRouter()
+    assert router.load_compiled(output)
+
+    router.add_route('/test/{id:int}', DummyResource())
+    resource, __, params, __ = router.find('/test/42')
+    assert isinstance(resource, DummyResource)
+    assert params == {'id': 42}
+
+
+def test_main_custom_router(tmpdir, monkeypatch):
+    output = str(tmpdir.join('routes.precompiled'))
+    monkeypatch.setattr(
+        sys, 'argv', ['falcon-compile-router', _MODULE + ':make_app_custom_router', '-o', output])
+
+    with pytest.raises(SystemExit):
+        compile_router.main()
+
+    assert not tmpdir.join('routes.precompiled').exists()
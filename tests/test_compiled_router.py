@@ -1,10 +1,11 @@
+import marshal
 from threading import Barrier, Thread
 from time import sleep
 from unittest.mock import MagicMock
 
 import pytest
 
-from falcon.routing import CompiledRouter
+from falcon.routing import CompiledRouter, converters
 
 
 def test_find_src(monkeypatch):
@@ -108,6 +109,426 @@ def test_multithread_compile(monkeypatch):
     mock.assert_called_once_with()
 
 
+@pytest.fixture
+def profiled_router():
+    router = CompiledRouter()
+
+    for template in ('/cold', '/warm/{id:int}', '/things/{id}', '/hot/stuff', '/{x}.{y}'):
+        router.add_route(template, MockResource())
+
+    return router
+
+
+def _branch_order(router):
+    src = router.finder_src
+    return [src.index("path[0] == '{}'".format(name)) for name in ('cold', 'warm', 'hot')]
+
+
+def test_load_route_profile(profiled_router):
+    paths = ['/cold', '/warm/42', '/things/1', '/hot/stuff', '/a.b', '/hot/other', '/nope']
+    expected = [profiled_router.find(path) for path in paths]
+
+    cold, warm, hot = _branch_order(profiled_router)
+    assert cold < warm < hot
+
+    profiled_router.load_route_profile({'/hot/stuff': 100, '/warm/{id:int}': 10})
+    assert profiled_router._find == profiled_router._compile_and_find
+
+    cold, warm, hot = _branch_order(profiled_router)
+    assert hot < warm < cold
+    assert [profiled_router.find(path) for path in paths] == expected
+
+    profiled_router.load_route_profile(None, compile=True)
+    assert profiled_router._find != profiled_router._compile_and_find
+
+    cold, warm, hot = _branch_order(profiled_router)
+    assert cold < warm < hot
+
+
+def test_route_hits(profiled_router):
+    profiled_router.find('/hot/stuff')
+    assert profiled_router.route_hits == {}
+
+    profiled_router.options.profile_route_hits = True
+    profiled_router.add_route('/hot/stuff', MockResource(), compile=True)
+
+    for __ in range(3):
+        profiled_router.find('/hot/stuff')
+    profiled_router.find('/warm/42')
+    profiled_router.find('/nope')
+
+    assert profiled_router.route_hits == {'/hot/stuff': 3, '/warm/{id:int}': 1}
+
+    cold, warm, hot = _branch_order(profiled_router)
+    assert cold < warm < hot
+
+
+def test_profile_recompile_interval(profiled_router):
+    profiled_router.options.profile_route_hits = True
+    profiled_router.options.profile_recompile_interval = 5
+
+    profiled_router.find('/warm/1')
+    stale_find = profiled_router._find
+
+    for __ in range(4):
+        profiled_router.find('/hot/stuff')
+
+    assert profiled_router._find == profiled_router._compile_and_find
+
+    cold, warm, hot = _branch_order(profiled_router)
+    assert hot < warm < cold
+
+    # NOTE: The lookup tables must remain compatible with the previous
+    #   version of the finder, which may still be in use by another thread.
+    params = {}
+    node = stale_find(['warm', '7'], profiled_router._return_values,
+                      profiled_router._patterns, profiled_router._converters, params)
+    assert node.uri_template == '/warm/{id:int}'
+    assert params == {'id': 7}
+
+
+def test_profile_reload_table_size(profiled_router):
+    profiled_router.find('/')
+    sizes = [len(table) for table in (
+        profiled_router._return_values, profiled_router._patterns, profiled_router._converters)]
+
+    for __ in range(3):
+        profiled_router.load_route_profile({'/hot/stuff': 100}, compile=True)
+        profiled_router.load_route_profile(None, compile=True)
+
+    assert [len(table) for table in (
+        profiled_router._return_values, profiled_router._patterns,
+        profiled_router._converters)] == sizes
+    assert len(profiled_router._table_indices) == sum(sizes)
+
+
+class _HexIntConverter(converters.IntConverter):
+
+    def convert(self, value):
+        try:
+            return int(value, 16)
+        except ValueError:
+            return None
+
+
+def test_replaced_converter_pruned(profiled_router, tmpdir):
+    assert profiled_router.find('/warm/2a') is None
+
+    profiled_router.options.converters['int'] = _HexIntConverter
+    profiled_router.add_route('/warm/{id:int}', MockResource(), compile=True)
+    assert profiled_router.find('/warm/2a')[2] == {'id': 42}
+
+    converter_classes = [
+        key[3] for key in profiled_router._table_indices if key[0] == 'converter']
+    assert converter_classes == [_HexIntConverter]
+
+    path = str(tmpdir.join('routes.precompiled'))
+    profiled_router.save_compiled(path)
+
+    router = CompiledRouter()
+    router.options.converters['int'] = _HexIntConverter
+    assert router.load_compiled(path)
+    for template in ('/cold', '/warm/{id:int}', '/things/{id}', '/hot/stuff', '/{x}.{y}'):
+        router.add_route(template, MockResource())
+
+    assert router.find('/warm/2a')[2] == {'id': 42}
+    assert router.finder_src == profiled_router.finder_src
+
+
+@pytest.fixture
+def precompiled(tmpdir):
+    path = str(tmpdir.join('routes.precompiled'))
+
+    router = CompiledRouter()
+    for template in _PRECOMPILED_TEMPLATES:
+        router.add_route(template, MockResource())
+    router.save_compiled(path)
+
+    return path
+
+
+_PRECOMPILED_TEMPLATES = (
+    '/cold',
+    '/warm/{id:int}',
+    '/warm/{id:int}/files/{name}.{ext}',
+    '/things/{id}',
+    '/{x}.{y:int(2)}',
+    '/stamps/{ts:dt("%Y%m%d")}...{other:uuid}',
+)
+
+_PRECOMPILED_PATHS = (
+    '/cold', '/warm/42', '/warm/x', '/warm/42/files/a.txt', '/things/1', '/a.12', '/a.1',
+    '/stamps/20200101...8b1b2c4a-71e3-4f4b-8ec0-2f6a1e0b9b6d', '/nope',
+)
+
+
+def test_load_compiled(precompiled, monkeypatch):
+    reference = CompiledRouter()
+    router = CompiledRouter()
+    assert router.load_compiled(precompiled)
+
+    for template in _PRECOMPILED_TEMPLATES:
+        reference.add_route(template, MockResource())
+
+    validate = MagicMock()
+    monkeypatch.setattr(CompiledRouter, '_validate_template_segment', validate)
+    generate = MagicMock()
+    monkeypatch.setattr(CompiledRouter, '_generate_ast', generate)
+
+    for template in _PRECOMPILED_TEMPLATES:
+        router.add_route(template, MockResource())
+    router.find('/')
+    monkeypatch.undo()
+
+    for path in _PRECOMPILED_PATHS:
+        expected = reference.find(path)
+        actual = router.find(path)
+
+        if expected is None:
+            assert actual is None
+        else:
+            assert actual[2:] == expected[2:]
+
+    assert router.finder_src == reference.finder_src
+    assert validate.call_count == 0
+    assert generate.call_count == 0
+
+
+def test_load_compiled_stale(precompiled):
+    router = CompiledRouter()
+    assert router.load_compiled(precompiled)
+
+    for template in _PRECOMPILED_TEMPLATES[:-1]:
+        router.add_route(template, MockResource())
+    router.add_route('/other', MockResource())
+
+    assert router.find('/other') is not None
+    assert router.find('/warm/42')[2] == {'id': 42}
+    assert "path[0] == 'other'" in router.finder_src
+
+
+def test_load_compiled_stale_validation(precompiled):
+    router = CompiledRouter()
+    assert router.load_compiled(precompiled)
+
+    router.options.converters.clear()
+    for template in _PRECOMPILED_TEMPLATES:
+        router.add_route(template, MockResource())
+
+    with pytest.raises(ValueError):
+        router.find('/cold')
+
+
+@pytest.mark.parametrize('content', [b'', b'garbage', marshal.dumps({'format': -1})])
+def test_load_compiled_incompatible(tmpdir, content):
+    path = tmpdir.join('routes.precompiled')
+    path.write_binary(content)
+
+    router = CompiledRouter()
+    assert not router.load_compiled(str(path))
+
+    router.add_route('/cold', MockResource())
+    assert router.find('/cold') is not None
+
+
+def test_add_routes(monkeypatch):
+    instantiate = CompiledRouter._instantiate_converter
+    calls = []
+
+    def mock(self, klass, argstr=None):
+        calls.append((klass, argstr))
+        return instantiate(self, klass, argstr)
+
+    monkeypatch.setattr(CompiledRouter, '_instantiate_converter', mock)
+
+    router = CompiledRouter()
+    router.add_routes(
+        [
+            ('/warm/{id:int}', MockResource()),
+            ('/warm/{id:int}/other', MockResource(), {'suffix': 'other'}),
+            ('/hot/{id:int}', MockResource()),
+            ('/cold/{id:int(3)}', MockResource()),
+        ],
+        suffix=None,
+    )
+    assert router._find == router._compile_and_find
+    assert len(calls) == 2
+
+    assert router.find('/warm/1/other')[1]['GET'].__name__ == 'on_get_other'
+    assert router.find('/hot/1')[1]['GET'].__name__ == 'on_get'
+    assert router.find('/cold/123')[2] == {'id': 123}
+
+
+def test_add_routes_compile():
+    router = CompiledRouter()
+    router.add_routes((('/cold', MockResource()), ('/hot', MockResource())), compile=True)
+    assert router._find != router._compile_and_find
+
+    router.add_routes([])
+    assert router._find != router._compile_and_find
+
+
+def test_add_routes_conflict():
+    cold = MockResource()
+    router = CompiledRouter()
+    router.add_routes([('/cold', cold), ('/things/{id}', MockResource())], compile=True)
+    find = router._find
+    src = router.finder_src
+
+    with pytest.raises(ValueError):
+        router.add_routes([
+            ('/cold', MockResource()),
+            ('/hot', MockResource()),
+            ('/things/{id}/stuff', MockResource()),
+            ('/things/{thing_id}/other', MockResource()),
+        ])
+
+    assert router._find is find
+    assert not router._dirty_subtrees
+    assert [node.raw_segment for node in router._roots] == ['cold', 'things']
+    assert router.find('/cold')[0] is cold
+    assert router.find('/hot') is None
+    assert router.find('/things/1/stuff') is None
+
+    router.add_route('/hot', MockResource())
+    assert router.find('/hot') is not None
+    assert router.finder_src != src
+
+
+@pytest.fixture
+def incremental_router():
+    router = CompiledRouter()
+    router.options.incremental_compile = True
+
+    for template in _PRECOMPILED_TEMPLATES:
+        router.add_route(template, MockResource())
+
+    return router
+
+
+def test_incremental_compile(incremental_router):
+    reference = CompiledRouter()
+    for template in _PRECOMPILED_TEMPLATES:
+        reference.add_route(template, MockResource())
+
+    for path in _PRECOMPILED_PATHS:
+        expected = reference.find(path)
+        actual = incremental_router.find(path)
+
+        if expected is None:
+            assert actual is None
+        else:
+            assert actual[2:] == expected[2:]
+
+    subtree_finders = dict(incremental_router._subtree_finders)
+    assert sorted(node.raw_segment for node in subtree_finders) == ['stamps', 'things', 'warm']
+
+    incremental_router.add_route('/warm/{id:int}/other', MockResource())
+    incremental_router.add_route('/spam/eggs', MockResource())
+    assert incremental_router.find('/warm/42/other')[2] == {'id': 42}
+    assert incremental_router.find('/spam/eggs') is not None
+
+    regenerated = sorted(
+        node.raw_segment for node, entry in incremental_router._subtree_finders.items()
+        if subtree_finders.get(node) is not entry
+    )
+    assert regenerated == ['spam', 'warm']
+
+
+def test_incremental_compile_converters_changed(incremental_router):
+    assert incremental_router.find('/warm/2a') is None
+    subtree_finders = dict(incremental_router._subtree_finders)
+
+    incremental_router.options.converters['int'] = _HexIntConverter
+    incremental_router.add_route('/spam/{id:int}', MockResource())
+
+    # NOTE: The existing subtrees must use the new converter, too.
+    assert incremental_router.find('/warm/2a')[2] == {'id': 42}
+    assert incremental_router.find('/spam/2a')[2] == {'id': 42}
+    assert not any(
+        subtree_finders.get(node) is entry
+        for node, entry in incremental_router._subtree_finders.items()
+    )
+
+
+def test_incremental_compile_precompiled(incremental_router, tmpdir):
+    path = str(tmpdir.join('routes.precompiled'))
+    incremental_router.save_compiled(path)
+
+    router = CompiledRouter()
+    router.options.incremental_compile = True
+    assert router.load_compiled(path)
+    for template in _PRECOMPILED_TEMPLATES:
+        router.add_route(template, MockResource())
+
+    assert router.finder_src == incremental_router.finder_src
+    assert router.find('/warm/42')[2] == {'id': 42}
+
+    subtree_finders = dict(router._subtree_finders)
+    assert len(subtree_finders) == 3
+
+    router.add_route('/things/{id}/stuff', MockResource())
+    assert router.find('/things/1/stuff')[2] == {'id': '1'}
+    assert [
+        node.raw_segment for node, entry in router._subtree_finders.items()
+        if subtree_finders[node] is not entry
+    ] == ['things']
+
+    # NOTE: The precompiled logic may not be used when the option differs.
+    router = CompiledRouter()
+    assert router.load_compiled(path)
+    for template in _PRECOMPILED_TEMPLATES:
+        router.add_route(template, MockResource())
+
+    assert 'def find_' not in router.finder_src
+
+
+@pytest.mark.parametrize('template, converter', [
+    ('{x:int}', converters.IntConverter()),
+    ('{x:int(3)}', converters.IntConverter(3)),
+    ('{x:int(min=10, max=300)}', converters.IntConverter(min=10, max=300)),
+    ('{x:int(700)}', converters.IntConverter(700)),
+    ('{x:uuid}', converters.UUIDConverter()),
+    ('{x:dt}', converters.DateTimeConverter()),
+    ('{x:dt("%Y-%m-%d")}', converters.DateTimeConverter('%Y-%m-%d')),
+])
+@pytest.mark.parametrize('value', [
+    '', '7', '42', '042', '123', '1234', '-5', '+5', ' 5', '5 ', '1_0', '\u0663', '\u00b2',
+    '1' * 700, '1' * 701,
+    '8b1b2c4a-71e3-4f4b-8ec0-2f6a1e0b9b6d', '8b1b2c4a71e34f4b8ec02f6a1e0b9b6d',
+    '2020-02-20', '2020-02-20T20:20:20Z', 'x',
+])
+def test_inline_converters(template, converter, value):
+    router = CompiledRouter()
+    router.add_route('/things/' + template, MockResource())
+    router.add_route('/other/' + template + '.txt', MockResource())
+
+    assert any(src in router.finder_src for src in ('isdecimal()', 'UUID(', 'strptime('))
+
+    expected = converter.convert(value)
+    for path in ('/things/' + value, '/other/' + value + '.txt'):
+        route = router.find(path)
+
+        if expected is None:
+            assert route is None
+        else:
+            assert route[2]['x'] == expected
+
+
+def test_inline_converters_subclass():
+    class IntConverter(converters.IntConverter):
+        def convert(self, value):
+            return 42
+
+    router = CompiledRouter()
+    router.options.converters['int'] = IntConverter
+    router.add_route('/things/{x:int}', MockResource())
+
+    assert router.find('/things/7')[2] == {'x': 42}
+    assert 'converters[0].convert(fragment)' in router.finder_src
+    assert 'isdecimal' not in router.finder_src
+
+
 class MockResource:
     def on_get(self, req, res):
         pass
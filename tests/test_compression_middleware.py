@@ -0,0 +1,226 @@
+import gzip
+import io
+import zlib
+
+import pytest
+
+import falcon
+from falcon import testing
+
+from _util import create_app, disable_asgi_non_coroutine_wrapping  # NOQA
+
+
+LARGE_TEXT = 'Hello, World! ' * 200
+
+
+@pytest.fixture
+def client(asgi):
+    # NOTE: Disable wrapping to test that built-in middleware does not
+    #   require it (since this will be the case for non-test apps).
+    with disable_asgi_non_coroutine_wrapping():
+        app = create_app(asgi, middleware=falcon.CompressionMiddleware(encodings=['gzip',
+                                                                                  'deflate']))
+
+    app.add_route('/text', TextResource())
+    app.add_route('/media', MediaResource())
+    app.add_route('/image', ImageResource())
+    app.add_route('/stream', StreamResource(asgi))
+    app.add_route('/encoded', EncodedResource())
+    return testing.TestClient(app)
+
+
+class TextResource:
+
+    def on_get(self, req, resp):
+        resp.body = req.get_param('text', default=LARGE_TEXT)
+        resp.content_type = falcon.MEDIA_TEXT
+        resp.etag = 'abc123'
+
+    on_head = on_get
+
+
+class MediaResource:
+
+    def on_get(self, req, resp):
+        resp.media = [{'id': i, 'name': 'Thing {}'.format(i)} for i in range(100)]
+
+    def on_delete(self, req, resp):
+        resp.status = falcon.HTTP_204
+
+
+class ImageResource:
+
+    def on_get(self, req, resp):
+        resp.data = b'\x89PNG' + b'\x00' * 2000
+        resp.content_type = falcon.MEDIA_PNG
+
+
+class EncodedResource:
+
+    def on_get(self, req, resp):
+        resp.data = gzip.compress(LARGE_TEXT.encode())
+        resp.set_header('Content-Encoding', 'gzip')
+
+
+class StreamResource:
+
+    def __init__(self, asgi):
+        self._asgi = asgi
+
+    def on_get(self, req, resp):
+        chunks = [LARGE_TEXT.encode()] * 10
+
+        if req.get_param_as_bool('filelike'):
+            if self._asgi:
+                resp.stream = _AsyncBytesIO(b''.join(chunks))
+            else:
+                resp.stream = io.BytesIO(b''.join(chunks))
+        elif self._asgi:
+            async def emitter():
+                for chunk in chunks:
+                    yield chunk
+
+            resp.stream = emitter()
+        else:
+            resp.stream = iter(chunks)
+
+        resp.content_type = falcon.MEDIA_TEXT
+
+
+class _AsyncBytesIO:
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+        self.closed = False
+
+    async def read(self, size=-1):
+        return self._stream.read(size)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize('accept_encoding,encoding', [
+    ('gzip', 'gzip'),
+    ('gzip, deflate, br', 'gzip'),
+    ('deflate', 'deflate'),
+    ('gzip;q=0.5, deflate', 'deflate'),
+    ('*', 'gzip'),
+    ('br', None),
+    ('identity', None),
+    ('gzip;q=0', None),
+    (None, None),
+])
+def test_negotiation(client, accept_encoding, encoding):
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding else None
+    result = client.simulate_get('/text', headers=headers)
+
+    assert result.status_code == 200
+    assert result.headers['Vary'] == 'Accept-Encoding'
+    assert result.headers.get('Content-Encoding') == encoding
+    assert int(result.headers['Content-Length']) == len(result.content)
+
+    if encoding == 'gzip':
+        assert gzip.decompress(result.content).decode() == LARGE_TEXT
+        assert result.headers['ETag'] == 'W/"abc123"'
+    elif encoding == 'deflate':
+        assert zlib.decompress(result.content).decode() == LARGE_TEXT
+    else:
+        assert result.text == LARGE_TEXT
+        assert result.headers['ETag'] == '"abc123"'
+
+
+def test_media(client):
+    result = client.simulate_get('/media', headers={'Accept-Encoding': 'gzip'})
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+
+    decompressed = gzip.decompress(result.content)
+    assert len(result.content) < len(decompressed) / 4
+    assert testing.Result([decompressed], '200 OK', []).json[99]['name'] == 'Thing 99'
+
+
+@pytest.mark.parametrize('filelike', [True, False])
+def test_stream(client, filelike):
+    result = client.simulate_get('/stream', params={'filelike': filelike},
+                                 headers={'Accept-Encoding': 'gzip'})
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert result.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(result.content).decode() == LARGE_TEXT * 10
+
+
+@pytest.mark.parametrize('path,params', [
+    ('/text', {'text': 'Too short'}),
+    ('/image', None),
+    ('/encoded', None),
+])
+def test_not_compressed(client, path, params):
+    result = client.simulate_get(path, params=params,
+                                 headers={'Accept-Encoding': 'gzip'})
+
+    if path == '/encoded':
+        assert gzip.decompress(result.content).decode() == LARGE_TEXT
+        assert 'Vary' not in result.headers
+    elif path == '/image':
+        assert result.content.startswith(b'\x89PNG')
+        assert 'Content-Encoding' not in result.headers
+        assert 'Vary' not in result.headers
+    else:
+        assert result.text == 'Too short'
+        assert 'Content-Encoding' not in result.headers
+        assert result.headers['Vary'] == 'Accept-Encoding'
+
+
+def test_bodiless(client):
+    result = client.simulate_delete('/media', headers={'Accept-Encoding': 'gzip'})
+    assert result.status_code == 204
+    assert 'Content-Encoding' not in result.headers
+
+    result = client.simulate_head('/text', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in result.headers
+    assert result.headers['Vary'] == 'Accept-Encoding'
+
+
+def test_existing_vary(client):
+    class VaryResource:
+        def on_get(self, req, resp):
+            resp.vary = ['Accept']
+            resp.body = LARGE_TEXT
+
+    client.app.add_route('/vary', VaryResource())
+    result = client.simulate_get('/vary', headers={'Accept-Encoding': 'gzip'})
+    assert result.headers['Vary'] == 'Accept, Accept-Encoding'
+
+
+def test_options():
+    middleware = falcon.CompressionMiddleware()
+    assert middleware.encodings[-2:] == ('gzip', 'deflate')
+
+    middleware = falcon.CompressionMiddleware(encodings=['deflate'], levels={'deflate': 1},
+                                              excluded_media_types=['text/*'])
+    assert middleware.encodings == ('deflate',)
+    assert middleware._excluded_media_ranges == ('text/',)
+
+    with pytest.raises(ValueError):
+        falcon.CompressionMiddleware(encodings=['lzma'])
+
+
+@pytest.mark.parametrize('encoding,module_name', [
+    ('br', 'brotli'),
+    ('zstd', 'zstandard'),
+])
+def test_optional_encodings(asgi, encoding, module_name):
+    module = pytest.importorskip(module_name)
+
+    app = create_app(asgi, middleware=falcon.CompressionMiddleware())
+    app.add_route('/text', TextResource())
+
+    result = testing.simulate_get(app, '/text', headers={'Accept-Encoding': encoding})
+    assert result.headers['Content-Encoding'] == encoding
+
+    if encoding == 'br':
+        decompressed = module.decompress(result.content)
+    else:
+        decompressed = module.ZstdDecompressor().decompressobj().decompress(result.content)
+
+    assert decompressed.decode() == LARGE_TEXT
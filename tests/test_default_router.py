@@ -263,6 +263,62 @@ def test_not_str(asgi, uri_template):
         app.add_route(uri_template, ResourceWithId(-1))
 
 
+@pytest.mark.parametrize('asgi', [True, False])
+def test_add_routes(asgi):
+    app = create_app(asgi)
+    app.add_routes([
+        ('/repos', ResourceWithId(1)),
+        ('/repos/{org}', ResourceWithId(2), {'suffix': None}),
+        ('/teams/{id:int}', ResourceWithId(3)),
+    ], compile=True)
+
+    assert app._router._find != app._router._compile_and_find
+
+    for path, expected_id in (('/repos', 1), ('/repos/falconry', 2), ('/teams/42', 3)):
+        resource, __, __, __ = app._router.find(path)
+        assert resource.resource_id == expected_id
+
+    assert app._router.find('/teams/x') is None
+
+
+@pytest.mark.parametrize('asgi', [True, False])
+@pytest.mark.parametrize('routes', [
+    [('/repos', ResourceWithId(1)), ('repos/{org}', ResourceWithId(2))],
+    [('/repos', ResourceWithId(1)), ('/repos/{org}/{org}', ResourceWithId(2))],
+    [('/repos', ResourceWithId(1)), ('/repos/{org:spam}', ResourceWithId(2))],
+])
+def test_add_routes_invalid(asgi, routes):
+    app = create_app(asgi)
+
+    with pytest.raises(ValueError):
+        app.add_routes(routes)
+
+    # NOTE: None of the routes should have been added.
+    assert app._router.find('/repos') is None
+
+
+def test_add_routes_custom_router():
+    class CustomRouter:
+        def __init__(self):
+            self.routes = []
+
+        def add_route(self, uri_template, resource, **kwargs):
+            self.routes.append((uri_template, resource, kwargs))
+
+        def find(self, uri, req=None):
+            return None
+
+    router = CustomRouter()
+    app = create_app(asgi=False, router=router)
+    resource = ResourceWithId(1)
+    app.add_routes([('/a', resource), ('/b', resource, {'suffix': 'b'})], compile=True)
+
+    assert router.routes == [
+        ('/a', resource, {}),
+        ('/b', resource, {'suffix': 'b', 'compile': True}),
+    ]
+
+
 def test_root_path():
     router = DefaultRouter()
     router.add_route('/', ResourceWithId(42))
@@ -387,6 +443,23 @@ def test_override(router):
     assert resource.resource_id == -1
 
 
+def test_override_compiled(router):
+    router.find('/')
+    find = router._find
+
+    router.add_route('/emojis/signs/0', ResourceWithId(-1))
+    assert router._find is find
+
+    resource, __, __, __ = router.find('/emojis/signs/0')
+    assert resource.resource_id == -1
+
+    router.add_route('/emojis/signs', ResourceWithId(-2))
+    assert router._find == router._compile_and_find
+
+    resource, __, __, __ = router.find('/emojis/signs')
+    assert resource.resource_id == -2
+
+
 def test_literal_segment(router):
     resource, __, __, __ = router.find('/emojis/signs/0')
     assert resource.resource_id == 12
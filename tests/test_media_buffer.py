@@ -0,0 +1,193 @@
+import array
+import io
+import sys
+
+import pytest
+
+import falcon
+from falcon import media
+from falcon import testing
+
+from _util import create_app  # NOQA
+
+
+MEDIA_ARRAY = 'application/x-array'
+
+NATIVE = '<' if sys.byteorder == 'little' else '>'
+SWAPPED = '>' if sys.byteorder == 'little' else '<'
+
+
+@pytest.fixture
+def handler():
+    return media.BufferHandler()
+
+
+@pytest.mark.parametrize('media,expected_content_type', [
+    (b'abc', MEDIA_ARRAY + '; dtype="|u1"; shape="3"'),
+    (array.array('d', [1.0, 2.0]), MEDIA_ARRAY + '; dtype="{0}f8"; shape="2"'.format(NATIVE)),
+    (
+        memoryview(array.array('i', range(6))).cast('B').cast('i', (2, 3)),
+        MEDIA_ARRAY + '; dtype="{0}i4"; shape="2,3"'.format(NATIVE),
+    ),
+])
+def test_serialize(handler, media, expected_content_type):
+    assert handler.serialize(media, MEDIA_ARRAY) == bytes(memoryview(media))
+    assert handler._get_content_type(media, MEDIA_ARRAY) == expected_content_type
+
+
+@pytest.mark.parametrize('value', [
+    {'not': 'a buffer'},
+    memoryview(b'ab').cast('c'),
+])
+def test_serialize_unsupported(handler, value):
+    with pytest.raises(TypeError):
+        handler._get_content_type(value, MEDIA_ARRAY)
+
+
+@pytest.mark.parametrize('content_length', [24, None])
+def test_deserialize(handler, content_length):
+    data = array.array('d', [0.5, 1.5, 2.5])
+    content_type = MEDIA_ARRAY + '; dtype="{0}f8"'.format(NATIVE)
+
+    result = handler.deserialize(
+        io.BytesIO(data.tobytes()), content_type, content_length)
+
+    assert isinstance(result, array.array)
+    assert result == data
+
+
+def test_deserialize_default_dtype(handler):
+    result = handler.deserialize(io.BytesIO(b'\x01\x02'), MEDIA_ARRAY, 2)
+    assert result == array.array('B', [1, 2])
+
+
+def test_deserialize_swapped_byte_order(handler):
+    data = array.array('H', [1, 2, 256])
+    data.byteswap()
+    content_type = MEDIA_ARRAY + '; dtype="{0}u2"; shape="3"'.format(SWAPPED)
+
+    result = handler.deserialize(io.BytesIO(data.tobytes()), content_type, 6)
+    assert result == array.array('H', [1, 2, 256])
+
+
+@pytest.mark.parametrize('content_type,data', [
+    (MEDIA_ARRAY + '; dtype="<f8"', b'\x00' * 12),
+    (MEDIA_ARRAY + '; dtype="<f8"; shape="2,2"', b'\x00' * 16),
+    (MEDIA_ARRAY + '; dtype="<f8"; shape="x"', b'\x00' * 16),
+    (MEDIA_ARRAY + '; dtype="f8"', b'\x00' * 16),
+    (MEDIA_ARRAY + '; dtype="<c8"', b'\x00' * 16),
+    (MEDIA_ARRAY + '; dtype="|b1"', b'\x00' * 16),
+])
+def test_deserialize_invalid(handler, content_type, data):
+    with pytest.raises(falcon.HTTPBadRequest):
+        handler.deserialize(io.BytesIO(data), content_type, len(data))
+
+
+def test_deserialize_incomplete(handler):
+    with pytest.raises(falcon.HTTPBadRequest):
+        handler.deserialize(io.BytesIO(b'\x00' * 8), MEDIA_ARRAY, 16)
+
+
+def test_deserialize_max_size():
+    handler = media.BufferHandler(max_size=8)
+
+    with pytest.raises(falcon.HTTPPayloadTooLarge):
+        handler.deserialize(io.BytesIO(b'\x00' * 16), MEDIA_ARRAY, 16)
+
+
+class TrickleStream(io.BytesIO):
+
+    def read(self, size=-1):
+        return super().read(min(size, 3))
+
+
+class AsyncStream:
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    async def read(self, size=None):
+        return self.stream.read(size)
+
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_deserialize_max_size_unknown_length(use_async):
+    handler = media.BufferHandler(max_size=8)
+
+    def deserialize(stream):
+        if use_async:
+            return falcon.invoke_coroutine_sync(
+                handler.deserialize_async, AsyncStream(stream), MEDIA_ARRAY, None)
+
+        return handler.deserialize(stream, MEDIA_ARRAY, None)
+
+    assert deserialize(TrickleStream(b'\x01' * 8)) == array.array('B', [1] * 8)
+
+    stream = TrickleStream(b'\x00' * 1024)
+    with pytest.raises(falcon.HTTPPayloadTooLarge):
+        deserialize(stream)
+
+    # NOTE: Only one byte past the limit is read before giving up.
+    assert stream.tell() == 9
+
+
+def test_deserialize_numpy():
+    numpy = pytest.importorskip('numpy')
+
+    handler = media.BufferHandler(use_numpy=True)
+    expected = numpy.arange(12, dtype='>i4').reshape(3, 4)
+    content_type = handler._get_content_type(expected, MEDIA_ARRAY)
+    data = handler.serialize(expected, MEDIA_ARRAY)
+
+    result = handler.deserialize(io.BytesIO(data), content_type, len(data))
+    assert result.dtype == expected.dtype
+    assert (result == expected).all()
+
+
+class SeriesResource:
+
+    def on_get(self, req, resp):
+        resp.content_type = MEDIA_ARRAY
+        resp.media = array.array('d', [0.5, 1.5, 2.5])
+
+    def on_post(self, req, resp):
+        resp.media = {'sum': sum(req.get_media())}
+
+
+class SeriesResourceAsync(SeriesResource):
+
+    async def on_get(self, req, resp):
+        super().on_get(req, resp)
+
+    async def on_post(self, req, resp):
+        resp.media = {'sum': sum(await req.get_media())}
+
+
+@pytest.fixture
+def client(asgi):
+    app = create_app(asgi)
+
+    handler = media.BufferHandler()
+    app.req_options.media_handlers[MEDIA_ARRAY] = handler
+    app.resp_options.media_handlers[MEDIA_ARRAY] = handler
+
+    app.add_route('/series', SeriesResourceAsync() if asgi else SeriesResource())
+    return testing.TestClient(app)
+
+
+def test_get_array(client):
+    result = client.simulate_get('/series')
+
+    assert result.status_code == 200
+    assert result.headers['Content-Type'] == (
+        MEDIA_ARRAY + '; dtype="{0}f8"; shape="3"'.format(NATIVE))
+    assert array.array('d', result.content) == array.array('d', [0.5, 1.5, 2.5])
+
+
+def test_post_array(client):
+    body = array.array('q', range(100000)).tobytes()
+    headers = {'Content-Type': MEDIA_ARRAY + '; dtype="{0}i8"'.format(NATIVE)}
+    result = client.simulate_post('/series', body=body, headers=headers)
+
+    assert result.status_code == 200
+    assert result.json == {'sum': sum(range(100000))}
@@ -1,3 +1,4 @@
+import copy
 from functools import partial
 import io
 import json
@@ -263,3 +264,180 @@ def test_async_handler_returning_none():
     result = testing.simulate_post(app, '/', json=doc)
     assert result.status_code == 200
     assert result.json == [None]
+
+
+def test_find_by_media_type_cache(monkeypatch):
+    handlers = media.Handlers()
+    json_handler = handlers['application/json']
+
+    calls = []
+    resolve = handlers._resolve_media_type
+
+    def resolve_media_type(media_type, all_media_types):
+        calls.append(media_type)
+        return resolve(media_type, all_media_types)
+
+    monkeypatch.setattr(handlers, '_resolve_media_type', resolve_media_type)
+
+    for _ in range(3):
+        handler = handlers.find_by_media_type('application/json; charset=utf-8', None)
+        assert isinstance(handler, media.JSONHandler)
+
+        with pytest.raises(falcon.HTTPUnsupportedMediaType):
+            handlers.find_by_media_type('application/x-unknown', None)
+
+        # NOTE: Exact matches bypass the resolution cache altogether.
+        assert handlers.find_by_media_type('application/json', None) is json_handler
+
+    assert calls == ['application/json; charset=utf-8', 'application/x-unknown']
+
+
+def test_find_by_media_type_cache_invalidation():
+    handlers = media.Handlers()
+
+    with pytest.raises(falcon.HTTPUnsupportedMediaType):
+        handlers.find_by_media_type('application/x-custom; v=1', None)
+
+    custom_handler = media.JSONHandler()
+    handlers['application/x-custom'] = custom_handler
+    assert handlers.find_by_media_type('application/x-custom; v=1', None) is custom_handler
+
+    copied = handlers.copy()
+    del handlers['application/x-custom']
+    with pytest.raises(falcon.HTTPUnsupportedMediaType):
+        handlers.find_by_media_type('application/x-custom; v=1', None)
+
+    assert copied.find_by_media_type('application/x-custom; v=1', None) is custom_handler
+
+    handlers.update({'application/x-custom': custom_handler})
+    assert handlers.find_by_media_type('application/x-custom; v=1', None) is custom_handler
+
+
+def test_handlers_copy():
+    handlers = media.Handlers()
+    custom_handler = media.JSONHandler()
+    handlers['application/x-custom'] = custom_handler
+    assert handlers.find_by_media_type('application/x-custom; v=1', None) is custom_handler
+
+    for copied in (handlers.copy(), copy.copy(handlers)):
+        assert type(copied) is media.Handlers
+        assert copied == handlers
+        assert copied._resolved_media_types == {}
+
+        del copied['application/x-custom']
+        assert 'application/x-custom' in handlers
+        assert handlers.find_by_media_type('application/x-custom', None) is custom_handler
+
+
+def test_find_by_media_type_cache_bounded():
+    handlers = media.Handlers()
+
+    for version in range(handlers._MAX_RESOLVED_MEDIA_TYPES * 2):
+        media_type = 'application/json; v={}'.format(version)
+        assert isinstance(handlers.find_by_media_type(media_type, None), media.JSONHandler)
+
+    assert len(handlers._resolved_media_types) <= handlers._MAX_RESOLVED_MEDIA_TYPES
+
+
+def test_json_serialize_stream_chunks():
+    handler = media.JSONHandler()
+    items = ['x' * 1000 for _ in range(200)]
+
+    chunks = list(handler.serialize_stream(iter(items), falcon.MEDIA_JSON))
+    assert len(chunks) > 1
+    assert all(len(chunk) < handler._STREAM_CHUNK_SIZE + 1024 for chunk in chunks)
+    assert json.loads(b''.join(chunks)) == items
+
+    async def collect(media):
+        return [chunk async for chunk in handler.serialize_stream_async(
+            media, falcon.MEDIA_JSON)]
+
+    async def items_async():
+        for item in items:
+            yield item
+
+    assert falcon.invoke_coroutine_sync(collect, items_async()) == chunks
+    assert falcon.invoke_coroutine_sync(collect, iter(items)) == chunks
+
+
+@pytest.mark.parametrize('count', [1, 1024, 1025, 2048, 5000])
+def test_json_serialize_long_array_slices(count):
+    handler = media.JSONHandler()
+    document = [{'id': i, 'name': 'ñ {0}'.format(i), 'tags': []} for i in range(count)]
+
+    calls = []
+    default_dumps = handler.dumps
+
+    def dumps(media):
+        calls.append(len(media))
+        return default_dumps(media)
+
+    handler.dumps = dumps
+
+    # NOTE: Arrays are only sliced when serialized by a MediaOffloadPool.
+    expected = json.dumps(document, ensure_ascii=False).encode()
+    assert handler.serialize(document, falcon.MEDIA_JSON) == expected
+    assert falcon.invoke_coroutine_sync(
+        handler.serialize_async, document, falcon.MEDIA_JSON) == expected
+    assert calls == [count, count]
+
+    del calls[:]
+    assert handler._serialize_offloaded(document, falcon.MEDIA_JSON) == expected
+    assert sum(calls) == count
+    assert max(calls) == min(count, handler._SLICE_SIZE)
+
+    # NOTE: Custom dumps() functions are always passed the whole array.
+    del calls[:]
+    handler = media.JSONHandler(dumps=dumps)
+    assert handler._serialize_offloaded(document, falcon.MEDIA_JSON) == expected
+    assert calls == [count]
+
+    # NOTE: Overridden serialize() methods are always used.
+    class WrappingHandler(media.JSONHandler):
+        def serialize(self, media, content_type):
+            return b'[' + super().serialize(media, content_type) + b']'
+
+    handler = WrappingHandler()
+    assert handler._serialize_offloaded(document, falcon.MEDIA_JSON) == b'[' + expected + b']'
+
+
+@pytest.mark.parametrize('read_size', [1, 3, 7, None])
+def test_json_deserialize_stream_chunk_boundaries(read_size):
+    class TrickleStream(io.BytesIO):
+        def read(self, size=-1):
+            return super().read(min(size, read_size) if read_size else size)
+
+    doc = {
+        'meta': {'tags': ['a', 'b', {'c': None}]},
+        'items': [{'id': i, 'name': 'ŝ' * (i % 5), 'value': i * 1.5e-3} for i in range(200)],
+        'total': 1234567890,
+    }
+    data = json.dumps(doc).encode()
+    handler = media.JSONHandler()
+
+    def iter_media(path):
+        stream = TrickleStream(data)
+        return list(handler.deserialize_stream(stream, falcon.MEDIA_JSON, len(data), path))
+
+    assert iter_media('items.item') == doc['items']
+    assert iter_media('items.item.value') == [item['value'] for item in doc['items']]
+    assert iter_media('meta.tags.item') == doc['meta']['tags']
+    assert iter_media('total') == [1234567890]
+    assert iter_media('') == [doc]
+
+
+@pytest.mark.parametrize('body,path,description', [
+    (b'[' + b'1, ' * 50000 + b'2}', 'item',
+     "expecting ',' or ']' at char 150002, found '}'"),
+    (b'[' + b'1, ' * 50000 + b'"x]', 'item', 'Unterminated string starting at (char 150001)'),
+    (b'[' + b'1, ' * 50000 + b'2]  x', 'item', 'extra data at char 150005'),
+    (b'{"a": [1]}\n{"b": 2}', 'a.item', 'extra data at char 11'),
+])
+def test_json_deserialize_stream_error_position(body, path, description):
+    stream = io.BytesIO(body)
+    handler = media.JSONHandler()
+
+    with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+        list(handler.deserialize_stream(stream, falcon.MEDIA_JSON, len(body), path))
+
+    assert exc_info.value.description == 'Could not parse JSON body - ' + description
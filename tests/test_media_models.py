@@ -0,0 +1,151 @@
+from typing import Dict, List, Optional
+
+import msgpack
+import pytest
+
+import falcon
+from falcon import media
+from falcon import testing
+from falcon.media import models
+
+pytest.importorskip('dataclasses')
+
+from _media_models import Order, Tag  # NOQA
+from _util import create_app  # NOQA
+
+
+ORDER = Order(1, [Tag('a'), Tag('b', 2.0)], Order(2, []), {'eur': Tag('c')})
+
+ORDER_MEDIA = {
+    'id': 1,
+    'tags': [{'name': 'a', 'weight': 1.0}, {'name': 'b', 'weight': 2.0}],
+    'parent': {'id': 2, 'tags': [], 'parent': None, 'totals': {}, 'notes': ''},
+    'totals': {'eur': {'name': 'c', 'weight': 1.0}},
+    'notes': '',
+}
+
+
+def test_encode_model():
+    assert models.encode_model(Tag('a')) == {'name': 'a', 'weight': 1.0}
+
+    with pytest.raises(TypeError):
+        models.encode_model(object())
+
+
+def test_encoder_cached():
+    models.encode_model(Tag('a'))
+    encoder = models._ENCODERS[Tag]
+
+    models.encode_model(Tag('b'))
+    assert models._ENCODERS[Tag] is encoder
+
+
+@pytest.mark.parametrize('into,media,expected', [
+    (Tag, {'name': 'a'}, Tag('a')),
+    (Tag, {'name': 'a', 'weight': 3.0, 'unknown': True}, Tag('a', 3.0)),
+    (Order, ORDER_MEDIA, ORDER),
+    (List[Tag], [{'name': 'a'}, {'name': 'b'}], [Tag('a'), Tag('b')]),
+    (Dict[str, Tag], {'x': {'name': 'a'}}, {'x': Tag('a')}),
+    (Optional[Tag], None, None),
+])
+def test_decode_media(into, media, expected):
+    assert models.decode_media(media, into) == expected
+
+
+@pytest.mark.parametrize('into,media,description', [
+    (Tag, [], 'Expected an object'),
+    (Tag, {'weight': 1.0}, 'Missing required field "name"'),
+    (Order, {'id': 1, 'tags': {}}, 'Expected an array'),
+    (Order, {'id': 1, 'tags': [{}]}, 'Missing required field "name"'),
+    (Order, {'id': 1, 'tags': [], 'totals': []}, 'Expected an object'),
+])
+def test_decode_media_invalid(into, media, description):
+    with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+        models.decode_media(media, into)
+
+    assert exc_info.value.description == description
+
+
+def test_decode_attrs_model():
+    attr = pytest.importorskip('attr')
+
+    @attr.s
+    class Item:
+        _id = attr.ib(type=int)
+        tag = attr.ib(type=Tag)
+        count = attr.ib(type=int, default=0)
+
+    item = models.decode_media({'_id': 1, 'tag': {'name': 'a'}}, Item)
+    assert item == Item(1, Tag('a'))
+    assert models.encode_model(item) == {'_id': 1, 'tag': Tag('a'), 'count': 0}
+
+
+def test_msgpack_handler():
+    handler = media.MessagePackHandler()
+    data = handler.serialize([ORDER], 'application/msgpack')
+
+    assert msgpack.unpackb(data, raw=False) == [ORDER_MEDIA]
+
+
+class OrdersResource:
+
+    def on_get(self, req, resp):
+        resp.media = [ORDER, ORDER.parent]
+
+    def on_post(self, req, resp):
+        orders = req.get_media(into=List[Order])
+        resp.media = {'ids': [order.id for order in orders]}
+
+    def on_put(self, req, resp):
+        assert req.get_media(into=Order) == ORDER
+        resp.media = req.get_media(into=Order)
+
+
+class OrdersResourceAsync:
+
+    async def on_get(self, req, resp):
+        resp.media = [ORDER, ORDER.parent]
+
+    async def on_post(self, req, resp):
+        orders = await req.get_media(into=List[Order])
+        resp.media = {'ids': [order.id for order in orders]}
+
+    async def on_put(self, req, resp):
+        assert await req.get_media(into=Order) == ORDER
+        resp.media = await req.get_media(into=Order)
+
+
+@pytest.fixture
+def client(asgi):
+    app = create_app(asgi)
+    app.add_route('/orders', OrdersResourceAsync() if asgi else OrdersResource())
+    return testing.TestClient(app)
+
+
+def test_get_models(client):
+    result = client.simulate_get('/orders')
+
+    assert result.status_code == 200
+    assert result.json == [ORDER_MEDIA, ORDER_MEDIA['parent']]
+
+
+def test_post_models(client):
+    result = client.simulate_post('/orders', json=[ORDER_MEDIA, ORDER_MEDIA['parent']])
+
+    assert result.status_code == 200
+    assert result.json == {'ids': [1, 2]}
+
+
+def test_put_model(client):
+    result = client.simulate_put('/orders', json=ORDER_MEDIA)
+
+    assert result.status_code == 200
+    assert result.json == ORDER_MEDIA
+
+
+def test_post_invalid_models(client):
+    result = client.simulate_post('/orders', json=[{'id': 1}])
+
+    assert result.status_code == 400
+    assert result.json['title'] == 'Invalid media'
+    assert result.json['description'] == 'Missing required field "tags"'
@@ -0,0 +1,186 @@
+import io
+
+import msgpack
+import pytest
+
+import falcon
+from falcon import media
+from falcon import testing
+
+from _util import create_app  # NOQA
+
+
+MEDIA_MSGPACK_SEQ = 'application/x-msgpack-seq'
+
+RECORDS = [{'id': i, 'name': 'record {0}'.format(i)} for i in range(100)]
+RECORDS_DATA = b''.join(msgpack.packb(record) for record in RECORDS)
+
+
+class TrickleStream(io.BytesIO):
+    """Return at most a few bytes per read, in order to exercise buffering."""
+
+    def read(self, size=-1):
+        return super().read(size if size is None or size < 0 else min(size, 3))
+
+
+@pytest.mark.parametrize('stream_type', [io.BytesIO, TrickleStream])
+def test_deserialize_sequence(stream_type):
+    handler = media.MessagePackHandler(sequence=True)
+    records = handler.deserialize(stream_type(RECORDS_DATA), MEDIA_MSGPACK_SEQ, None)
+
+    assert list(records) == RECORDS
+
+
+def test_deserialize_sequence_incremental():
+    handler = media.MessagePackHandler(sequence=True)
+    stream = io.BytesIO(msgpack.packb(1) + msgpack.packb(2) + b'\xc1')
+    records = handler.deserialize(stream, MEDIA_MSGPACK_SEQ, None)
+
+    assert next(records) == 1
+    assert next(records) == 2
+    with pytest.raises(falcon.HTTPBadRequest):
+        next(records)
+
+
+def test_deserialize_sequence_truncated():
+    handler = media.MessagePackHandler(sequence=True)
+    records = handler.deserialize(
+        TrickleStream(RECORDS_DATA[:-1]), MEDIA_MSGPACK_SEQ, None)
+
+    with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+        list(records)
+
+    assert 'Unexpected end of data' in exc_info.value.description
+
+
+@pytest.mark.parametrize('path,expected', [
+    ('item', RECORDS),
+    ('item.id', list(range(100))),
+    ('', [RECORDS]),
+])
+def test_deserialize_stream_sequence(path, expected):
+    handler = media.MessagePackHandler(sequence=True)
+    values = handler.deserialize_stream(
+        TrickleStream(RECORDS_DATA), MEDIA_MSGPACK_SEQ, None, path)
+
+    assert list(values) == expected
+
+
+@pytest.mark.parametrize('media_object,path,expected', [
+    (RECORDS, 'item', RECORDS),
+    (RECORDS, 'item.name', [record['name'] for record in RECORDS]),
+    ({'records': RECORDS}, 'item', []),
+    ({'records': RECORDS}, 'records.item.id', list(range(100))),
+])
+def test_deserialize_stream(media_object, path, expected):
+    handler = media.MessagePackHandler()
+    values = handler.deserialize_stream(
+        TrickleStream(msgpack.packb(media_object)), falcon.MEDIA_MSGPACK, None, path)
+
+    assert list(values) == expected
+
+
+@pytest.mark.parametrize('data', [
+    msgpack.packb(RECORDS)[:-1],
+    msgpack.packb(RECORDS) + b'\x00',
+    b'\xc1',
+])
+def test_deserialize_stream_invalid(data):
+    handler = media.MessagePackHandler()
+    values = handler.deserialize_stream(
+        TrickleStream(data), falcon.MEDIA_MSGPACK, None, 'item')
+
+    with pytest.raises(falcon.HTTPBadRequest):
+        list(values)
+
+
+def test_serialize_sequence():
+    handler = media.MessagePackHandler(sequence=True)
+
+    assert handler.serialize(RECORDS, MEDIA_MSGPACK_SEQ) == RECORDS_DATA
+    assert b''.join(handler.serialize_stream(iter(RECORDS), MEDIA_MSGPACK_SEQ)) == RECORDS_DATA
+
+
+def test_serialize_stream_array():
+    handler = media.MessagePackHandler()
+    data = b''.join(handler.serialize_stream(iter(RECORDS), falcon.MEDIA_MSGPACK))
+
+    assert msgpack.unpackb(data, raw=False) == RECORDS
+
+
+class TelemetryResource:
+
+    def __init__(self, count=0):
+        self.count = count
+
+    def on_get(self, req, resp):
+        resp.content_type = MEDIA_MSGPACK_SEQ
+        resp.media = ({'id': i} for i in range(self.count))
+
+    def on_post(self, req, resp):
+        resp.media = {'ids': [record['id'] for record in req.get_media()]}
+
+    def on_put(self, req, resp):
+        resp.media = {'ids': list(req.iter_media('item.id'))}
+
+
+class TelemetryResourceAsync(TelemetryResource):
+
+    async def on_get(self, req, resp):
+        async def records():
+            for i in range(self.count):
+                yield {'id': i}
+
+        resp.content_type = MEDIA_MSGPACK_SEQ
+        resp.media = records()
+
+    async def on_post(self, req, resp):
+        resp.media = {'ids': [record['id'] async for record in await req.get_media()]}
+
+    async def on_put(self, req, resp):
+        resp.media = {'ids': [value async for value in req.iter_media('item.id')]}
+
+
+@pytest.fixture
+def client(asgi):
+    app = create_app(asgi)
+
+    handler = media.MessagePackHandler(sequence=True)
+    app.req_options.media_handlers[MEDIA_MSGPACK_SEQ] = handler
+    app.resp_options.media_handlers[MEDIA_MSGPACK_SEQ] = handler
+    app.req_options.media_handlers[falcon.MEDIA_MSGPACK] = media.MessagePackHandler()
+
+    resource = TelemetryResourceAsync(10000) if asgi else TelemetryResource(10000)
+    app.add_route('/telemetry', resource)
+
+    return testing.TestClient(app)
+
+
+@pytest.mark.parametrize('method', ['POST', 'PUT'])
+def test_post_records(client, method):
+    body = b''.join(msgpack.packb({'id': i}) for i in range(10000))
+    result = client.simulate_request(
+        method, '/telemetry', body=body, headers={'Content-Type': MEDIA_MSGPACK_SEQ})
+
+    assert result.status_code == 200
+    assert result.json == {'ids': list(range(10000))}
+
+
+def test_put_array(client):
+    body = msgpack.packb([{'id': i} for i in range(10000)])
+    result = client.simulate_put(
+        '/telemetry', body=body, headers={'Content-Type': falcon.MEDIA_MSGPACK})
+
+    assert result.status_code == 200
+    assert result.json == {'ids': list(range(10000))}
+
+
+def test_get_records(client):
+    result = client.simulate_get('/telemetry')
+
+    assert result.status_code == 200
+    assert result.headers['Content-Type'] == MEDIA_MSGPACK_SEQ
+
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(result.content)
+    assert list(unpacker) == [{'id': i} for i in range(10000)]
@@ -0,0 +1,127 @@
+import io
+import json
+
+import pytest
+
+import falcon
+from falcon import media
+from falcon import testing
+
+from _util import create_app  # NOQA
+
+
+MEDIA_NDJSON = 'application/x-ndjson'
+
+
+@pytest.mark.parametrize('data,expected', [
+    (b'', []),
+    (b'\n\n', []),
+    (b'{"a": 1}', [{'a': 1}]),
+    (b'{"a": 1}\n', [{'a': 1}]),
+    (b'{"a": 1}\r\n\r\n[2, 3]\r\n"\xe2\x99\xa0"', [{'a': 1}, [2, 3], '♠']),
+])
+def test_deserialize(data, expected):
+    handler = media.NDJSONHandler()
+    records = handler.deserialize(io.BytesIO(data), MEDIA_NDJSON, len(data))
+    assert list(records) == expected
+
+
+def test_deserialize_incremental():
+    handler = media.NDJSONHandler()
+    stream = io.BytesIO(b'1\n2\n{"invalid\n')
+    records = handler.deserialize(stream, MEDIA_NDJSON, len(stream.getvalue()))
+
+    assert next(records) == 1
+    assert next(records) == 2
+    with pytest.raises(falcon.HTTPBadRequest):
+        next(records)
+
+
+@pytest.mark.parametrize('data', [
+    b'"' + b'x' * 16 + b'"',
+    b'1\n"' + b'x' * 16 + b'"\n2\n',
+])
+def test_deserialize_max_record_size(data):
+    handler = media.NDJSONHandler(max_record_size=16)
+    records = handler.deserialize(io.BytesIO(data), MEDIA_NDJSON, len(data))
+
+    with pytest.raises(falcon.HTTPPayloadTooLarge):
+        list(records)
+
+
+def test_serialize():
+    handler = media.NDJSONHandler()
+    records = [{'a': 1}, [2, 3], '♠']
+    expected = b'{"a": 1}\n[2, 3]\n"\xe2\x99\xa0"\n'
+
+    assert handler.serialize(records, MEDIA_NDJSON) == expected
+    assert b''.join(handler.serialize_stream(iter(records), MEDIA_NDJSON)) == expected
+
+
+class EventsResource:
+
+    def __init__(self, count=0):
+        self.count = count
+
+    def on_get(self, req, resp):
+        resp.content_type = MEDIA_NDJSON
+        resp.media = ({'id': i} for i in range(self.count))
+
+    def on_post(self, req, resp):
+        resp.media = {'ids': [event['id'] for event in req.get_media()]}
+
+
+class EventsResourceAsync(EventsResource):
+
+    async def on_get(self, req, resp):
+        async def events():
+            for i in range(self.count):
+                yield {'id': i}
+
+        resp.content_type = MEDIA_NDJSON
+        resp.media = events()
+
+    async def on_post(self, req, resp):
+        resp.media = {'ids': [event['id'] async for event in await req.get_media()]}
+
+
+@pytest.fixture
+def client(asgi):
+    app = create_app(asgi)
+
+    handler = media.NDJSONHandler(max_record_size=1024)
+    app.req_options.media_handlers[MEDIA_NDJSON] = handler
+    app.resp_options.media_handlers[MEDIA_NDJSON] = handler
+
+    resource = EventsResourceAsync(10000) if asgi else EventsResource(10000)
+    app.add_route('/events', resource)
+
+    return testing.TestClient(app)
+
+
+def test_post_events(client):
+    body = ''.join(json.dumps({'id': i}) + '\n' for i in range(10000))
+    result = client.simulate_post(
+        '/events', body=body, headers={'Content-Type': MEDIA_NDJSON})
+
+    assert result.status_code == 200
+    assert result.json == {'ids': list(range(10000))}
+
+
+def test_post_events_record_too_large(client):
+    body = '{"id": 1}\n{"id": 2, "padding": "' + 'x' * 1024 + '"}\n'
+    result = client.simulate_post(
+        '/events', body=body, headers={'Content-Type': MEDIA_NDJSON})
+
+    assert result.status_code == 413
+
+
+def test_get_events(client):
+    result = client.simulate_get('/events')
+
+    assert result.status_code == 200
+    assert result.headers['Content-Type'] == MEDIA_NDJSON
+
+    lines = result.content.split(b'\n')
+    assert lines.pop() == b''
+    assert [json.loads(line) for line in lines] == [{'id': i} for i in range(10000)]
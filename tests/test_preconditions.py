@@ -0,0 +1,169 @@
+from datetime import datetime
+
+import pytest
+
+import falcon
+import falcon.testing as testing
+from falcon.util.structures import ETag
+
+from _util import create_app  # NOQA
+
+
+LAST_MODIFIED = datetime(2020, 1, 15, 12, 30, 45, 123456)
+
+
+class VersionedResource:
+    def __init__(self, etag='"abc"', last_modified=LAST_MODIFIED):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.loaded = 0
+
+    def on_get(self, req, resp):
+        if resp.check_preconditions(req, etag=self.etag, last_modified=self.last_modified):
+            return
+
+        self.loaded += 1
+        resp.body = 'Hello, World!'
+
+    on_head = on_get
+
+    def on_put(self, req, resp):
+        if resp.check_preconditions(req, etag=self.etag, last_modified=self.last_modified):
+            return
+
+        self.loaded += 1
+        resp.status = falcon.HTTP_204
+
+
+@pytest.fixture
+def resource():
+    return VersionedResource()
+
+
+@pytest.fixture
+def client(asgi, resource):
+    app = create_app(asgi)
+    app.add_route('/', resource)
+    return testing.TestClient(app)
+
+
+@pytest.mark.parametrize('method', ['GET', 'HEAD'])
+def test_no_preconditions(client, resource, method):
+    result = client.simulate_request(method, '/')
+    assert result.status_code == 200
+    assert result.headers['ETag'] == '"abc"'
+    assert result.headers['Last-Modified'] == 'Wed, 15 Jan 2020 12:30:45 GMT'
+    assert resource.loaded == 1
+
+
+@pytest.mark.parametrize('method', ['GET', 'HEAD'])
+@pytest.mark.parametrize('headers', [
+    {'If-None-Match': '"abc"'},
+    {'If-None-Match': 'W/"abc"'},
+    {'If-None-Match': '"xyz", "abc"'},
+    {'If-None-Match': '*'},
+    {'If-Modified-Since': 'Wed, 15 Jan 2020 12:30:45 GMT'},
+    {'If-Modified-Since': 'Thu, 16 Jan 2020 00:00:00 GMT'},
+    {'If-Match': '"abc"', 'If-None-Match': '"abc"'},
+])
+def test_not_modified(client, resource, method, headers):
+    result = client.simulate_request(method, '/', headers=headers)
+    assert result.status_code == 304
+    assert result.headers['ETag'] == '"abc"'
+    assert not result.content
+    assert resource.loaded == 0
+
+
+@pytest.mark.parametrize('headers', [
+    {'If-None-Match': '"xyz"'},
+    {'If-Modified-Since': 'Tue, 14 Jan 2020 00:00:00 GMT'},
+    {'If-Modified-Since': 'not a date'},
+    {'If-Unmodified-Since': 'not a date'},
+    {'If-Match': '"abc"'},
+    {'If-Match': '*'},
+    {'If-Unmodified-Since': 'Wed, 15 Jan 2020 12:30:45 GMT'},
+
+    # NOTE: If-Modified-Since is ignored when If-None-Match is present.
+    {'If-None-Match': '"xyz"', 'If-Modified-Since': 'Thu, 16 Jan 2020 00:00:00 GMT'},
+])
+def test_precondition_passed(client, resource, headers):
+    result = client.simulate_get('/', headers=headers)
+    assert result.status_code == 200
+    assert result.text == 'Hello, World!'
+    assert resource.loaded == 1
+
+
+@pytest.mark.parametrize('method', ['GET', 'PUT'])
+@pytest.mark.parametrize('headers', [
+    {'If-Match': '"xyz"'},
+    {'If-Match': 'W/"abc"'},
+    {'If-Unmodified-Since': 'Tue, 14 Jan 2020 00:00:00 GMT'},
+
+    # NOTE: If-Match takes precedence over If-None-Match.
+    {'If-Match': '"xyz"', 'If-None-Match': '"xyz"'},
+])
+def test_precondition_failed(client, resource, method, headers):
+    result = client.simulate_request(method, '/', headers=headers)
+    assert result.status_code == 412
+    assert resource.loaded == 0
+
+
+@pytest.mark.parametrize('headers', [
+    {'If-None-Match': '*'},
+    {'If-None-Match': '"abc"'},
+])
+def test_unsafe_method_if_none_match(client, resource, headers):
+    result = client.simulate_put('/', headers=headers)
+    assert result.status_code == 412
+    assert resource.loaded == 0
+
+
+def test_unsafe_method_if_modified_since_ignored(client, resource):
+    headers = {'If-Modified-Since': 'Thu, 16 Jan 2020 00:00:00 GMT'}
+    result = client.simulate_put('/', headers=headers)
+    assert result.status_code == 204
+    assert resource.loaded == 1
+
+
+def test_if_match_takes_precedence_over_if_unmodified_since(client, resource):
+    headers = {
+        'If-Match': '"abc"',
+        'If-Unmodified-Since': 'Tue, 14 Jan 2020 00:00:00 GMT',
+    }
+    result = client.simulate_put('/', headers=headers)
+    assert result.status_code == 204
+
+
+def test_missing_representation(client, resource):
+    resource.etag = None
+    resource.last_modified = None
+
+    result = client.simulate_put('/', headers={'If-None-Match': '*'})
+    assert result.status_code == 204
+
+    result = client.simulate_put('/', headers={'If-Match': '*'})
+    assert result.status_code == 412
+
+
+@pytest.mark.parametrize('etag', [
+    'W/"abc"',
+    ETag.loads('W/"abc"'),
+])
+def test_weak_etag(client, resource, etag):
+    resource.etag = etag
+
+    result = client.simulate_get('/', headers={'If-None-Match': '"abc"'})
+    assert result.status_code == 304
+    assert result.headers['ETag'] == 'W/"abc"'
+
+    # NOTE: The strong comparison function never matches a weak entity-tag.
+    result = client.simulate_get('/', headers={'If-Match': 'W/"abc"'})
+    assert result.status_code == 412
+
+
+def test_unquoted_etag(client, resource):
+    resource.etag = 'abc'
+
+    result = client.simulate_get('/', headers={'If-None-Match': '"abc"'})
+    assert result.status_code == 304
+    assert result.headers['ETag'] == '"abc"'
@@ -8,7 +8,7 @@ import falcon
 from falcon.errors import HTTPInvalidParam, UnsupportedError
 import falcon.testing as testing
 
-from _util import create_app  # NOQA
+from _util import create_app, create_req  # NOQA
 
 
 class Resource(testing.SimpleTestResource):
@@ -945,3 +945,12 @@ class TestPostQueryParamsDefaultBehavior:
 
         req = resource.captured_req
         assert req.get_param('q') is None
+
+
+def test_params_parsed_lazily(asgi):
+    req = create_req(asgi, query_string='limit=25&marker=zxcv')
+    req.query_string = 'limit=100'
+
+    assert req.params == {'limit': '100'}
+    assert req.get_param_as_int('limit') == 100
+    assert not req.has_param('marker')
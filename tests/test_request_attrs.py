@@ -5,10 +5,11 @@ import pytest
 
 import falcon
 from falcon.request import Request, RequestOptions
-from falcon.request_helpers import _parse_etags
+from falcon.request_helpers import _parse_accept, _parse_etags
 import falcon.testing as testing
 import falcon.uri
 from falcon.util.structures import ETag
+from falcon.vendor import mimeparse
 
 from _util import create_req  # NOQA
 
@@ -470,6 +471,46 @@ class TestRequestAttributes:
         preferred_type = req.client_prefers(['application/xhtml+xml'])
         assert preferred_type is None
 
+    @pytest.mark.parametrize('accept', [
+        'text/*; q=0.1, application/xhtml+xml; q=0.5',
+        'application/json;q=0.8, application/*;q=0.2, */*;q=0.1',
+        'text/html;level=1, text/html;q=0.7, text/*;q=0.3, */*;q=0.5',
+        'application/msgpack, application/x-msgpack;q=0.9, application/json;q=bogus',
+        'application/json, , text/plain;q=0',
+        'text/plain; charset=utf-8, application/JSON',
+        '*;q=0.4, image/png',
+    ])
+    @pytest.mark.parametrize('media_types', [
+        ['application/json'],
+        ['application/xml', 'application/json'],
+        ['text/plain', 'text/html', 'text/html;level=1'],
+        ['application/x-msgpack', 'application/msgpack', 'application/json'],
+        ['text/plain; charset=utf-8', 'image/png', 'image/*'],
+    ])
+    def test_client_accepts_and_prefers_like_mimeparse(self, asgi, accept, media_types):
+        req = create_req(asgi, headers={'Accept': accept})
+        parsed = [mimeparse.parse_media_range(r) for r in accept.split(',') if r.strip()]
+
+        for media_type in media_types:
+            expected = mimeparse.quality_parsed(media_type, parsed) != 0.0
+            assert req.client_accepts(media_type) is expected
+
+        expected = mimeparse.best_match(media_types, accept) or None
+        assert req.client_prefers(media_types) == expected
+
+    def test_client_accepts_cached(self, asgi):
+        accept = 'application/json;q=0.8, application/xml;q=0.9'
+        req = create_req(asgi, headers={'Accept': accept})
+
+        assert req.client_accepts_json
+        assert not req.client_accepts_msgpack
+        assert req.client_prefers(['application/json', 'application/xml']) == 'application/xml'
+
+        media_ranges = req._get_accepted_media_ranges()
+        assert media_ranges is _parse_accept(accept)
+        assert create_req(asgi, headers={'Accept': accept})._get_accepted_media_ranges() is (
+            media_ranges)
+
     def test_range(self, asgi):
         headers = {'Range': 'bytes=10-'}
         req = create_req(asgi, headers=headers)
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from falcon import errors, media, testing
@@ -216,3 +218,91 @@ def _create_client_invalid_media(asgi, error_type, handlers=None):
     resource_type = ResourceInvalidMediaAsync if asgi else ResourceInvalidMedia
     resource = resource_type(error_type)
     return create_client(asgi, handlers=handlers, resource=resource)
+
+
+class ResourceIterMedia:
+    def __init__(self, path):
+        self._path = path
+
+    def on_post(self, req, resp, **kwargs):
+        resp.media = list(req.iter_media(self._path))
+
+
+class ResourceIterMediaAsync(ResourceIterMedia):
+    async def on_post(self, req, resp, **kwargs):
+        resp.media = [value async for value in req.iter_media(self._path)]
+
+
+def create_iter_media_client(asgi, path):
+    resource = ResourceIterMediaAsync(path) if asgi else ResourceIterMedia(path)
+    return create_client(asgi, resource=resource, handlers={
+        'application/msgpack': media.MessagePackHandler(),
+        'application/x-ndjson': media.NDJSONHandler(),
+    })
+
+
+@pytest.mark.parametrize('body,path,expected', [
+    (b'[1, 2, {"three": 3}, [4]]', 'item', [1, 2, {'three': 3}, [4]]),
+    (b'  [ ]  ', 'item', []),
+    (b'{"items": [{"id": 1}, {"id": 2}], "total": 2}', 'items.item', [{'id': 1}, {'id': 2}]),
+    (b'{"items": [{"id": 1}, {"id": 2}], "total": 2}', 'items.item.id', [1, 2]),
+    (b'{"meta": {"n": [1.5e3]}, "items": []}', 'meta.n.item', [1500.0]),
+    (b'{"items": {"id": 1}}', 'items.item', []),
+    (b'{"total": 2}', 'items.item', []),
+    (b'{"total": 2}', '', [{'total': 2}]),
+    (b'', 'item', []),
+])
+def test_iter_media_json(asgi, body, path, expected):
+    client = create_iter_media_client(asgi, path)
+    result = client.simulate_post('/', body=body, headers={'Content-Type': 'application/json'})
+    assert result.status_code == 200
+    assert result.json == expected
+
+
+@pytest.mark.parametrize('body', [
+    b'[1, 2',
+    b'[1, 2}',
+    b'[1, 2,]',
+    b'{"items" [1]}',
+    b'{1: [1]}',
+    b'[1.]',
+    b'["\xff"]',
+    b'[1,2] garbage',
+    b'{"a":[1]} x',
+    b'[1] [2]',
+])
+def test_iter_media_json_invalid(asgi, body):
+    client = create_iter_media_client(asgi, 'item')
+    result = client.simulate_post('/', body=body, headers={'Content-Type': 'application/json'})
+    assert result.status_code == 400
+    assert result.json['title'] == 'Invalid JSON'
+
+
+def test_iter_media_json_large(asgi):
+    items = [{'id': i, 'name': 'ŝ' * (i % 11), 'value': i / 7} for i in range(20000)]
+    body = json.dumps({'count': len(items), 'items': items})
+
+    client = create_iter_media_client(asgi, 'items.item')
+    result = client.simulate_post('/', body=body, headers={'Content-Type': 'application/json'})
+    assert result.status_code == 200
+    assert result.json == items
+
+
+@pytest.mark.parametrize('path,expected', [
+    ('item', [{'id': 1}, {'id': 2}]),
+    ('item.id', [1, 2]),
+])
+def test_iter_media_ndjson(asgi, path, expected):
+    client = create_iter_media_client(asgi, path)
+    result = client.simulate_post(
+        '/', body=b'{"id": 1}\n{"id": 2}\n', headers={'Content-Type': 'application/x-ndjson'})
+    assert result.status_code == 200
+    assert result.json == expected
+
+
+def test_iter_media_default_implementation(asgi):
+    client = create_iter_media_client(asgi, 'items.item')
+    result = client.simulate_post(
+        '/', body=b'\x81\xa5items\x92\x01\x02', headers={'Content-Type': 'application/msgpack'})
+    assert result.status_code == 200
+    assert result.json == [1, 2]
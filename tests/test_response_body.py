@@ -90,3 +90,81 @@ def test_content_length_not_set_when_streaming_response(asgi, method):
 
     if method == 'GET':
         assert result.text == 'Hello, World!'
+
+
+class PollingResource:
+
+    def __init__(self):
+        self.version = 1
+
+    def on_get(self, req, resp):
+        resp.media = {'version': self.version}
+
+        if req.get_param_as_bool('explicit'):
+            resp.etag = 'explicit'
+        if req.get_param_as_bool('error'):
+            resp.status = falcon.HTTP_500
+
+    on_head = on_get
+
+    def on_post(self, req, resp):
+        resp.media = {'version': self.version}
+
+
+@pytest.fixture
+def polling_client(asgi):
+    app = create_app(asgi)
+    app.resp_options.auto_etag = True
+
+    client = testing.TestClient(app)
+    client.resource = PollingResource()
+    app.add_route('/poll', client.resource)
+    return client
+
+
+def test_auto_etag_disabled_by_default(asgi):
+    app = create_app(asgi)
+    app.add_route('/poll', PollingResource())
+
+    result = testing.simulate_get(app, '/poll')
+    assert 'ETag' not in result.headers
+
+
+@pytest.mark.parametrize('method', ['GET', 'HEAD'])
+def test_auto_etag(polling_client, method):
+    result = polling_client.simulate_request(method, '/poll')
+    assert result.status_code == 200
+    etag = result.headers['ETag']
+    assert etag.startswith('W/"') and etag.endswith('"')
+
+    assert polling_client.simulate_request(method, '/poll').headers['ETag'] == etag
+
+    for if_none_match in (etag, etag[2:], '"other", ' + etag, '*'):
+        result = polling_client.simulate_request(method, '/poll',
+                                                 headers={'If-None-Match': if_none_match})
+        assert result.status_code == 304
+        assert result.content == b''
+        assert result.headers['ETag'] == etag
+        assert 'Content-Type' not in result.headers
+
+    polling_client.resource.version = 2
+
+    result = polling_client.simulate_request(method, '/poll', headers={'If-None-Match': etag})
+    assert result.status_code == 200
+    assert result.headers['ETag'] != etag
+
+    if method == 'GET':
+        assert result.json == {'version': 2}
+
+
+@pytest.mark.parametrize('method,params', [
+    ('POST', None),
+    ('GET', {'explicit': True}),
+    ('GET', {'error': True}),
+])
+def test_auto_etag_not_applicable(polling_client, method, params):
+    result = polling_client.simulate_request(method, '/poll', params=params,
+                                             headers={'If-None-Match': '*'})
+    assert result.status_code != 304
+    assert result.json == {'version': 1}
+    assert result.headers.get('ETag') in (None, '"explicit"')
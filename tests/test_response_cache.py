@@ -0,0 +1,340 @@
+from datetime import datetime, timedelta
+import multiprocessing
+import os
+
+import pytest
+
+import falcon
+from falcon import testing
+
+from _util import create_app  # NOQA
+
+
+class ThingsResource:
+
+    def __init__(self):
+        self.calls = 0
+
+    def on_get(self, req, resp):
+        self.calls += 1
+
+        resp.media = {'calls': self.calls, 'limit': req.get_param_as_int('limit')}
+        resp.cache_control = req.get_param_as_list('cc', default=['max-age=60'])
+
+        if req.get_param_as_bool('expires'):
+            resp.cache_control = []
+            resp.expires = datetime.utcnow() + timedelta(minutes=5)
+
+        if req.get_param_as_bool('vary'):
+            resp.vary = ['Accept-Language']
+
+        if req.get_param_as_bool('cookie'):
+            resp.set_cookie('session', 'xyz')
+
+    def on_post(self, req, resp):
+        self.calls += 1
+        resp.media = {'calls': self.calls}
+        resp.cache_control = ['max-age=60']
+
+
+class StreamResource:
+
+    def __init__(self, asgi):
+        self._asgi = asgi
+
+    def on_get(self, req, resp):
+        chunks = [b'Hello, ', b'World!']
+
+        if self._asgi:
+            async def emitter():
+                for chunk in chunks:
+                    yield chunk
+
+            resp.stream = emitter()
+        else:
+            resp.stream = iter(chunks)
+
+        resp.cache_control = ['max-age=60']
+
+
+class Middleware:
+
+    def __init__(self):
+        self.calls = 0
+
+    def process_request(self, req, resp):
+        self.calls += 1
+
+
+@pytest.fixture
+def resource():
+    return ThingsResource()
+
+
+@pytest.fixture
+def middleware():
+    return Middleware()
+
+
+@pytest.fixture(params=['memory', 'shared'])
+def cache(request):
+    if request.param == 'shared':
+        return falcon.SharedMemoryResponseCache(max_size=1024 * 1024, stripes=4)
+
+    return falcon.ResponseCache()
+
+
+@pytest.fixture
+def client(asgi, resource, middleware, cache):
+    app = create_app(asgi, middleware=[middleware], response_cache=cache)
+    app.add_route('/things', resource)
+    app.add_route('/stream', StreamResource(asgi))
+    return testing.TestClient(app)
+
+
+def test_hit(client, resource, middleware, cache):
+    result = client.simulate_get('/things', params={'limit': 10})
+    assert result.json == {'calls': 1, 'limit': 10}
+    assert 'Age' not in result.headers
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    for __ in range(3):
+        cached = client.simulate_get('/things', params={'limit': 10})
+        assert cached.status == falcon.HTTP_200
+        assert cached.json == {'calls': 1, 'limit': 10}
+        assert cached.headers['Age'] == '0'
+        assert cached.headers['Cache-Control'] == 'max-age=60'
+        assert cached.headers['Content-Type'] == result.headers['Content-Type']
+        assert cached.headers['Content-Length'] == result.headers['Content-Length']
+
+    assert resource.calls == 1
+    assert middleware.calls == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    result = client.simulate_head('/things', params={'limit': 10})
+    assert result.content == b''
+    assert result.headers['Content-Length'] == cached.headers['Content-Length']
+    assert (cache.hits, cache.misses) == (4, 1)
+
+    result = client.simulate_get('/things', params={'limit': 20})
+    assert result.json == {'calls': 2, 'limit': 20}
+    assert (cache.hits, cache.misses) == (4, 2)
+
+
+@pytest.mark.parametrize('params', [
+    {'cc': 'no-cache'},
+    {'cc': 'no-store'},
+    {'cc': ['private', 'max-age=60']},
+    {'cc': 'max-age=0'},
+    {'cc': 'max-age=soon'},
+    {'cc': 'public'},
+    {'cookie': True},
+])
+def test_not_cacheable(client, resource, cache, params):
+    for expected_calls in (1, 2):
+        result = client.simulate_get('/things', params=params)
+        assert result.json['calls'] == expected_calls
+
+    assert cache.hits == 0
+    assert len(cache) == 0
+
+
+def test_not_cacheable_requests(client, resource, cache):
+    for expected_calls in (1, 2):
+        result = client.simulate_post('/things')
+        assert result.json['calls'] == expected_calls
+
+        result = client.simulate_get('/stream')
+        assert result.text == 'Hello, World!'
+
+    for expected_calls in (3, 4):
+        result = client.simulate_get('/things', headers={'Authorization': 'Token abc'})
+        assert result.json['calls'] == expected_calls
+
+    result = client.simulate_get('/things', headers={'Authorization': 'Token abc'},
+                                 params={'cc': 'public, max-age=60'})
+    assert result.json['calls'] == 5
+    assert len(cache) == 2
+
+
+def test_expires(client, resource):
+    for __ in range(2):
+        result = client.simulate_get('/things', params={'expires': True})
+        assert result.json['calls'] == 1
+
+
+def test_vary(client, resource, cache):
+    for language, expected_calls in (('en', 1), ('fr', 2), ('en', 1), (None, 3), ('fr', 2)):
+        headers = {'Accept-Language': language} if language else None
+        result = client.simulate_get('/things', params={'vary': True}, headers=headers)
+        assert result.json['calls'] == expected_calls
+        assert result.headers['Vary'] == 'Accept-Language'
+
+    assert cache.hits == 2
+
+
+def test_purge(client, resource, cache):
+    client.simulate_get('/things', params={'vary': True}, headers={'Accept-Language': 'en'})
+    client.simulate_get('/things', params={'vary': True}, headers={'Accept-Language': 'fr'})
+    client.simulate_get('/things', params={'limit': 1})
+    assert resource.calls == 3
+
+    assert cache.purge('/things?vary=true') == 2
+    assert cache.purge('/things?vary=true') == 0
+
+    client.simulate_get('/things', params={'vary': True}, headers={'Accept-Language': 'en'})
+    client.simulate_get('/things', params={'limit': 1})
+    assert resource.calls == 4
+
+    cache.clear()
+    assert (len(cache), cache.size, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+    client.simulate_get('/things', params={'limit': 1})
+    assert resource.calls == 5
+
+
+def test_ttl(client, resource, cache, monkeypatch):
+    client.simulate_get('/things', params={'cc': 'max-age=10'})
+    client.simulate_get('/things', params={'cc': 'max-age=10'})
+    assert resource.calls == 1
+
+    now = falcon.response_cache.time.monotonic() + 11
+    monkeypatch.setattr('falcon.response_cache.time.monotonic', lambda: now)
+
+    client.simulate_get('/things', params={'cc': 'max-age=10'})
+    assert resource.calls == 2
+
+
+def test_max_ttl(asgi, resource):
+    cache = falcon.ResponseCache(max_ttl=0)
+    app = create_app(asgi, response_cache=cache)
+    app.add_route('/things', resource)
+
+    testing.simulate_get(app, '/things')
+    testing.simulate_get(app, '/things')
+    assert resource.calls == 2
+
+
+def test_eviction(asgi, resource):
+    cache = falcon.ResponseCache(max_size=1600)
+    app = create_app(asgi, response_cache=cache)
+    app.add_route('/things', resource)
+
+    for limit in (1, 2, 1, 3):
+        testing.simulate_get(app, '/things', params={'limit': limit})
+
+    assert resource.calls == 3
+    assert cache.evictions > 0
+    assert cache.size <= 1600
+
+    # NOTE: The response for limit=2 was the least recently used one.
+    for limit in (1, 3, 2):
+        testing.simulate_get(app, '/things', params={'limit': limit})
+
+    assert resource.calls == 4
+
+
+def test_max_entry_size(asgi, resource):
+    cache = falcon.ResponseCache(max_entry_size=300)
+    app = create_app(asgi, response_cache=cache)
+    app.add_route('/things', resource)
+
+    testing.simulate_get(app, '/things')
+    testing.simulate_get(app, '/things')
+    assert resource.calls == 2
+    assert len(cache) == 0
+
+
+def _populate(cache, resource):
+    app = create_app(False, response_cache=cache)
+    app.add_route('/things', resource)
+
+    testing.simulate_get(app, '/things', params={'limit': 7})
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork()')
+def test_shared_memory_fork(resource):
+    cache = falcon.SharedMemoryResponseCache(max_size=1024 * 1024)
+
+    process = multiprocessing.get_context('fork').Process(target=_populate,
+                                                          args=(cache, resource))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+    assert (len(cache), cache.hits, cache.misses) == (2, 0, 1)
+
+    app = create_app(False, response_cache=cache)
+    app.add_route('/things', resource)
+
+    result = testing.simulate_get(app, '/things', params={'limit': 7})
+    assert result.json == {'calls': 1, 'limit': 7}
+    assert resource.calls == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_shared_memory_wraparound(resource):
+    cache = falcon.SharedMemoryResponseCache(max_size=16 * 1024, stripes=1)
+    app = create_app(False, response_cache=cache)
+    app.add_route('/things', resource)
+
+    for limit in range(200):
+        result = testing.simulate_get(app, '/things', params={'limit': limit})
+        assert result.json['limit'] == limit
+
+    assert resource.calls == 200
+    assert 0 < len(cache) < 200
+    assert cache.size <= 16 * 1024
+    assert cache.evictions > 0
+
+    # NOTE: The most recent responses are still cached, and intact.
+    for limit in range(195, 200):
+        result = testing.simulate_get(app, '/things', params={'limit': limit})
+        assert result.json['limit'] == limit
+        assert 'Age' in result.headers
+
+    assert resource.calls == 200
+
+    result = testing.simulate_get(app, '/things', params={'limit': 0})
+    assert resource.calls == 201
+
+    cache.clear()
+    assert (len(cache), cache.size, cache.hits, cache.misses, cache.evictions) == (0, 0, 0, 0, 0)
+
+
+def test_shared_memory_too_small():
+    with pytest.raises(ValueError):
+        falcon.SharedMemoryResponseCache(max_size=1024, stripes=4)
+
+
+def test_shared_memory_orphaned_lock(resource):
+    cache = falcon.SharedMemoryResponseCache(max_size=1024 * 1024, stripes=4,
+                                             lock_timeout=0.01)
+    app = create_app(False, response_cache=cache)
+    app.add_route('/things', resource)
+
+    for limit in range(20):
+        testing.simulate_get(app, '/things', params={'limit': limit})
+    assert len(cache) == 40
+
+    # NOTE: Simulate a worker that was killed while holding a lock.
+    orphaned = cache._locks[0]
+    assert orphaned.acquire()
+
+    try:
+        locked_count = cache._HEADER.unpack_from(cache._mmap, 0)[cache._COUNT]
+        assert locked_count > 0
+
+        with pytest.raises(TimeoutError):
+            cache.purge('/things?limit=0')
+
+        with pytest.raises(TimeoutError):
+            cache.clear()
+
+        # NOTE: The other stripes were cleared nonetheless.
+        assert len(cache) == locked_count
+    finally:
+        orphaned.release()
+
+    cache.clear()
+    assert len(cache) == 0
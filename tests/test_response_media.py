@@ -1,3 +1,5 @@
+import gzip
+import io
 import json
 
 import pytest
@@ -5,6 +7,8 @@ import pytest
 import falcon
 from falcon import errors, media, testing
 
+from _util import create_app  # NOQA
+
 
 @pytest.fixture
 def client():
@@ -202,3 +206,174 @@ def test_media_rendered_cached(client):
 
     resp.media = 123
     assert first is not resp.render_body()
+
+
+class NegotiatedMediaResource:
+
+    def __init__(self, content_type=None, document=None):
+        self._content_type = content_type
+        self._document = document or {'message': 'Hello'}
+
+    def on_get(self, req, resp):
+        if self._content_type:
+            resp.content_type = self._content_type
+        resp.media = self._document
+
+
+def create_negotiating_client(asgi, content_type=None, middleware=None):
+    app = create_app(asgi, middleware=middleware)
+    app.resp_options.negotiate_media_type = True
+    app.resp_options.media_handlers.update({
+        'application/msgpack': media.MessagePackHandler(),
+        'application/x-msgpack': media.MessagePackHandler(),
+    })
+    app.add_route('/', NegotiatedMediaResource(content_type))
+
+    return testing.TestClient(app)
+
+
+@pytest.mark.parametrize('accept,content_type', [
+    (None, falcon.MEDIA_JSON),
+    ('*/*', falcon.MEDIA_JSON),
+    ('application/json', falcon.MEDIA_JSON),
+    ('application/*', falcon.MEDIA_JSON),
+    ('application/msgpack', 'application/msgpack'),
+    ('application/x-msgpack', 'application/x-msgpack'),
+    ('application/json;q=0.5, application/msgpack', 'application/msgpack'),
+    ('application/json, application/msgpack;q=0.5', falcon.MEDIA_JSON),
+    ('text/html', falcon.MEDIA_JSON),
+    ('multipart/form-data', falcon.MEDIA_JSON),
+])
+def test_negotiate_media_type(asgi, accept, content_type):
+    client = create_negotiating_client(asgi)
+
+    headers = {'Accept': accept} if accept else {}
+    result = client.simulate_get('/', headers=headers)
+
+    assert result.status_code == 200
+    assert result.headers['Content-Type'] == content_type
+    assert result.headers['Vary'] == 'Accept'
+
+    if content_type == falcon.MEDIA_JSON:
+        assert result.json == {'message': 'Hello'}
+    else:
+        assert result.content == b'\x81\xa7message\xa5Hello'
+
+
+def test_negotiate_media_type_explicit_content_type(asgi):
+    client = create_negotiating_client(asgi, content_type='application/x-msgpack')
+
+    result = client.simulate_get('/', headers={'Accept': 'application/json'})
+    assert result.headers['Content-Type'] == 'application/x-msgpack'
+    assert 'Vary' not in result.headers
+
+
+def test_negotiate_media_type_disabled(asgi):
+    client = create_negotiating_client(asgi)
+    client.app.resp_options.negotiate_media_type = False
+
+    result = client.simulate_get('/', headers={'Accept': 'application/msgpack'})
+    assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+    assert 'Vary' not in result.headers
+
+
+def test_negotiate_media_type_handlers_mutation(asgi):
+    client = create_negotiating_client(asgi)
+    handlers = client.app.resp_options.media_handlers
+
+    result = client.simulate_get('/', headers={'Accept': 'application/msgpack'})
+    assert result.headers['Content-Type'] == 'application/msgpack'
+
+    del handlers['application/msgpack']
+    result = client.simulate_get('/', headers={'Accept': 'application/msgpack'})
+    assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+
+
+@pytest.mark.parametrize('accept,content_type', [
+    ('application/json', falcon.MEDIA_JSON),
+    ('application/msgpack', 'application/msgpack'),
+])
+def test_negotiate_media_type_compressed(asgi, accept, content_type):
+    # NOTE: The middleware renders the body in process_response(), i.e.,
+    #   before the app would otherwise negotiate the media type.
+    document = {'messages': ['Hello'] * 1000}
+    client = create_negotiating_client(asgi, middleware=[falcon.CompressionMiddleware()])
+    client.app.add_route('/messages', NegotiatedMediaResource(document=document))
+
+    result = client.simulate_get(
+        '/messages', headers={'Accept': accept, 'Accept-Encoding': 'gzip'})
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert result.headers['Content-Type'] == content_type
+    assert result.headers['Vary'] == 'Accept, Accept-Encoding'
+
+    handler = client.app.resp_options.media_handlers[content_type]
+    assert handler.deserialize(
+        io.BytesIO(gzip.decompress(result.content)), content_type, None) == document
+
+
+class StreamedMediaResource:
+
+    def __init__(self, count, content_type=None):
+        self._count = count
+        self._content_type = content_type
+
+    def on_get(self, req, resp):
+        if self._content_type:
+            resp.content_type = self._content_type
+        resp.media = ({'id': i, 'name': 'item-{}'.format(i)} for i in range(self._count))
+
+
+class StreamedMediaResourceAsync(StreamedMediaResource):
+
+    async def on_get(self, req, resp):
+        async def items():
+            for i in range(self._count):
+                yield {'id': i, 'name': 'item-{}'.format(i)}
+
+        if self._content_type:
+            resp.content_type = self._content_type
+        resp.media = items()
+
+
+@pytest.mark.parametrize('count', [0, 1, 3, 10000])
+@pytest.mark.parametrize('use_async', [False, True])
+def test_media_generator(asgi, count, use_async):
+    if use_async and not asgi:
+        pytest.skip('async generators are only supported by ASGI apps')
+
+    app = create_app(asgi)
+    resource = StreamedMediaResourceAsync(count) if use_async else StreamedMediaResource(count)
+    app.add_route('/', resource)
+
+    result = testing.simulate_get(app, '/')
+    assert result.status_code == 200
+    assert result.headers['Content-Type'] == falcon.MEDIA_JSON
+    assert 'Content-Length' not in result.headers
+    assert result.json == [{'id': i, 'name': 'item-{}'.format(i)} for i in range(count)]
+
+
+def test_media_generator_fallback(asgi):
+    app = create_app(asgi)
+    app.resp_options.media_handlers['application/msgpack'] = media.MessagePackHandler()
+    app.add_route('/', StreamedMediaResource(2, content_type='application/msgpack'))
+
+    result = testing.simulate_get(app, '/')
+    assert result.status_code == 200
+    assert result.headers['Content-Type'] == 'application/msgpack'
+    assert result.content == (
+        b'\x92\x82\xa2id\x00\xa4name\xa6item-0\x82\xa2id\x01\xa4name\xa6item-1')
+
+
+def test_media_generator_compressed(asgi):
+    app = create_app(asgi, middleware=[falcon.CompressionMiddleware()])
+    app.resp_options.negotiate_media_type = True
+    app.add_route('/', StreamedMediaResource(1000))
+
+    headers = {'Accept': 'application/json', 'Accept-Encoding': 'gzip'}
+    result = testing.simulate_get(app, '/', headers=headers)
+    assert result.status_code == 200
+    assert result.headers['Content-Encoding'] == 'gzip'
+    assert result.headers['Vary'] == 'Accept, Accept-Encoding'
+
+    data = json.loads(gzip.decompress(result.content))
+    assert data == [{'id': i, 'name': 'item-{}'.format(i)} for i in range(1000)]
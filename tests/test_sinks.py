@@ -137,3 +137,43 @@ class TestDefaultRouting:
         response = client.simulate_request(path='/books/123')
         assert resource.called
         assert response.status == falcon.HTTP_200
+
+    def test_add_sink_after_request(self, client, sink, resource):
+        client.app.add_sink(sink, r'/foo')
+
+        response = client.simulate_request(path='/bar')
+        assert response.status == falcon.HTTP_404
+
+        client.app.add_sink(sink, r'/bar/(?P<id>\d+)')
+
+        response = client.simulate_request(path='/bar/42')
+        assert response.status == falcon.HTTP_503
+        assert sink.kwargs == {'id': '42'}
+
+
+@pytest.mark.parametrize('path', [
+    '/', '/foo', '/foo/bar', '/user/42', '/user/42/42', '/user/42/43', '/USER/7',
+    '/items/1.json', '/items/1.xml', '/static/x', '/katza',
+])
+def test_compile_sink_finder(path):
+    sinks = [
+        (re.compile(r'/user/(?P<id>\d+)/(?P=id)$'), 'repeated'),
+        (re.compile(r'/user/(?P<id>\d+)'), 'user'),
+        (re.compile(r'(?i)/user/(\d+)'), 'flags'),
+        (re.compile(r'/items/(\d+)\.(json|yaml)'), 'items'),
+        (re.compile(r'/items/(?P<id>\d+)\.(?P<ext>\w+)'), 'items_ext'),
+        (re.compile(r'/foo/(?P<rest>.*)|/katza'), 'foo'),
+        (re.compile(r'/(\w+)/\1'), 'backref'),
+        (re.compile(r'/static', re.IGNORECASE), 'static'),
+    ]
+
+    def reference(path):
+        for pattern, sink in sinks:
+            m = pattern.match(path)
+            if m:
+                return sink, m.groupdict()
+
+        return None
+
+    find = falcon.app_helpers.compile_sink_finder(sinks)
+    assert find(path) == reference(path)
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import gzip
 import io
+import mimetypes
 import os
 
 import pytest
 
 import falcon
-from falcon.routing import StaticRoute, StaticRouteAsync
+import falcon.asgi
+from falcon.routing import StaticFileCache, StaticRoute, StaticRouteAsync
 import falcon.testing as testing
 
 import _util  # NOQA
@@ -375,6 +378,42 @@ def test_match(asgi, default, path, expected, monkeypatch):
     assert sr.match(path) == expected
 
 
+@pytest.mark.parametrize('path', [
+    '/', '/static', '/static/', '/staticfoo', '/static/foo', '/static/css/a.css',
+    '/static/css', '/assets', '/assets/', '/assets/img/x.png', '/a/b/c/d', '/a/b/c',
+])
+def test_compile_static_route_finder(asgi, path, monkeypatch):
+    monkeypatch.setattr('os.path.isfile', lambda file: True)
+
+    static_routes = [
+        create_sr(asgi, '/a/b/c', '/var/www/c'),
+        create_sr(asgi, '/static/css', '/var/www/css', fallback_filename='index.html'),
+        create_sr(asgi, '/assets', '/var/www/assets', fallback_filename='index.html'),
+        create_sr(asgi, '/static', '/var/www/statics'),
+        create_sr(asgi, '/static/css', '/var/www/other'),
+        create_sr(asgi, '/', '/var/www/root'),
+    ]
+    expected = next((sr for sr in static_routes if sr.match(path)), None)
+
+    find = falcon.app_helpers.compile_static_route_finder(static_routes)
+    assert find(path) is expected
+
+
+def test_add_static_route_after_request(client, monkeypatch):
+    monkeypatch.setattr(io, 'open', lambda path, mode: io.BytesIO(path.encode()))
+
+    client.app.add_static_route('/downloads', '/opt/somesite/downloads')
+
+    response = client.simulate_request(path='/assets/thing.zip')
+    assert response.status == falcon.HTTP_404
+
+    client.app.add_static_route('/assets', '/opt/somesite/assets')
+
+    response = client.simulate_request(path='/assets/thing.zip')
+    assert response.status == falcon.HTTP_200
+    assert response.text == os.path.normpath('/opt/somesite/assets/thing.zip')
+
+
 def test_filesystem_traversal_fuse(client, monkeypatch):
 
     def suspicious_normpath(path):
@@ -384,3 +423,353 @@ def test_filesystem_traversal_fuse(client, monkeypatch):
     monkeypatch.setattr('os.path.normpath', suspicious_normpath)
     response = client.simulate_request(path='/static/shadow')
     assert response.status == falcon.HTTP_404
+
+
+@pytest.fixture
+def static_dir(tmpdir):
+    tmpdir.join('app.js').write('console.log("Hello, World!");')
+    tmpdir.join('index.html').write('<p>Hello, World!</p>')
+    tmpdir.join('README').write('Hello, World!')
+    return tmpdir
+
+
+@pytest.mark.parametrize('method', ['GET', 'HEAD'])
+def test_conditional_get(client, static_dir, method):
+    client.app.add_static_route('/assets', str(static_dir))
+
+    response = client.simulate_request(method, '/assets/app.js')
+    assert response.status == falcon.HTTP_200
+    etag = response.headers['ETag']
+    last_modified = response.headers['Last-Modified']
+    assert etag.startswith('"') and etag.endswith('"')
+
+    for headers in (
+        {'If-None-Match': etag},
+        {'If-None-Match': 'W/' + etag},
+        {'If-None-Match': '"other", ' + etag},
+        {'If-None-Match': '*'},
+        {'If-Modified-Since': last_modified},
+        {'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'},
+    ):
+        response = client.simulate_request(method, '/assets/app.js', headers=headers)
+        assert response.status == falcon.HTTP_304
+        assert response.content == b''
+        assert response.headers['ETag'] == etag
+        assert response.headers['Last-Modified'] == last_modified
+
+    for headers in (
+        {'If-None-Match': '"other"'},
+        {'If-None-Match': '"other"', 'If-Modified-Since': last_modified},
+        {'If-Modified-Since': 'Fri, 01 Jan 1999 00:00:00 GMT'},
+        {'If-Modified-Since': 'yesterday'},
+    ):
+        response = client.simulate_request(method, '/assets/app.js', headers=headers)
+        assert response.status == falcon.HTTP_200
+
+        if method == 'GET':
+            assert response.text == 'console.log("Hello, World!");'
+
+
+def test_conditional_post(client, static_dir):
+    client.app.add_static_route('/assets', str(static_dir))
+
+    etag = client.simulate_get('/assets/app.js').headers['ETag']
+    response = client.simulate_post('/assets/app.js', headers={'If-None-Match': etag})
+    assert response.status == falcon.HTTP_200
+
+
+def test_conditional_get_fallback_filename(client, static_dir):
+    client.app.add_static_route('/assets', str(static_dir), fallback_filename='index.html')
+
+    response = client.simulate_get('/assets/missing.js')
+    assert response.text == '<p>Hello, World!</p>'
+
+    etag = response.headers['ETag']
+    assert etag == client.simulate_get('/assets/index.html').headers['ETag']
+
+    response = client.simulate_get('/assets/missing.js', headers={'If-None-Match': etag})
+    assert response.status == falcon.HTTP_304
+
+
+def test_cache_control(client, static_dir):
+    client.app.add_static_route('/assets', str(static_dir), cache_control={
+        '.html': 'no-cache',
+        '.js': ['public', 'max-age=86400'],
+    })
+    client.app.add_static_route('/other', str(static_dir), cache_control={
+        '.html': 'no-cache',
+        '*': 'max-age=60',
+    })
+
+    response = client.simulate_get('/assets/index.html')
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    response = client.simulate_get('/assets/app.js')
+    assert response.headers['Cache-Control'] == 'public, max-age=86400'
+
+    response = client.simulate_get('/assets/README')
+    assert 'Cache-Control' not in response.headers
+
+    response = client.simulate_get('/other/README')
+    assert response.headers['Cache-Control'] == 'max-age=60'
+
+    etag = response.headers['ETag']
+    response = client.simulate_get('/other/README', headers={'If-None-Match': etag})
+    assert response.status == falcon.HTTP_304
+    assert response.headers['Cache-Control'] == 'max-age=60'
+
+
+@pytest.mark.parametrize('stat_cache_ttl, stale', [(0, False), (3600, True)])
+def test_stat_cache_ttl(client, static_dir, stat_cache_ttl, stale):
+    client.app.add_static_route('/assets', str(static_dir), stat_cache_ttl=stat_cache_ttl)
+
+    etag = client.simulate_get('/assets/app.js').headers['ETag']
+
+    path = str(static_dir.join('app.js'))
+    os.utime(path, (0, 0))
+
+    response = client.simulate_get('/assets/app.js', headers={'If-None-Match': etag})
+    if stale:
+        assert response.status == falcon.HTTP_304
+    else:
+        assert response.status == falcon.HTTP_200
+        assert response.headers['Last-Modified'] == 'Thu, 01 Jan 1970 00:00:00 GMT'
+
+
+def test_stat_cache_removed_file(client, static_dir):
+    client.app.add_static_route('/assets', str(static_dir), fallback_filename='index.html',
+                                stat_cache_ttl=3600, cache_control={'.js': 'max-age=86400'})
+
+    response = client.simulate_get('/assets/app.js')
+    assert response.headers['Cache-Control'] == 'max-age=86400'
+    etag = response.headers['ETag']
+
+    fallback = client.simulate_get('/assets/index.html')
+    static_dir.join('app.js').remove()
+
+    # NOTE: The cached stat of the removed file is still used to evaluate
+    #   preconditions, but the fallback file is served with its own
+    #   validators and Cache-Control header.
+    response = client.simulate_get('/assets/app.js')
+    assert response.status == falcon.HTTP_200
+    assert response.text == '<p>Hello, World!</p>'
+    assert response.headers['Content-Type'] == 'text/html'
+    assert response.headers['ETag'] == fallback.headers['ETag'] != etag
+    assert response.headers['Last-Modified'] == fallback.headers['Last-Modified']
+    assert 'Cache-Control' not in response.headers
+
+
+def test_stat_cache_bounded(static_dir, monkeypatch):
+    monkeypatch.setattr(StaticRoute, '_STAT_CACHE_MAX_SIZE', 2)
+    sr = StaticRoute('/assets', str(static_dir))
+
+    for name in ('app.js', 'index.html', 'README', 'missing'):
+        path = str(static_dir.join(name))
+        stat_result = sr._stat_cache.stat(path)
+        assert (stat_result is None) == (name == 'missing')
+
+    assert len(sr._stat_cache._entries) == 2
+
+    # NOTE: Directories are not served.
+    assert sr._stat_cache.stat(str(static_dir)) is None
+
+
+def test_file_cache(client, static_dir):
+    file_cache = StaticFileCache(max_size=64, max_file_size=25)
+    client.app.add_static_route('/assets', str(static_dir), file_cache=file_cache)
+    client.app.add_static_route('/other', str(static_dir), file_cache=file_cache,
+                                stat_cache_ttl=0, downloadable=True)
+
+    for __ in range(3):
+        response = client.simulate_get('/assets/index.html')
+        assert response.text == '<p>Hello, World!</p>'
+        assert response.headers['Content-Type'] == 'text/html'
+        assert response.headers['Content-Length'] == '20'
+
+    assert (file_cache.hits, file_cache.misses) == (2, 1)
+    assert file_cache.size == 20
+
+    # NOTE: Too large to be cached.
+    for __ in range(2):
+        response = client.simulate_get('/assets/app.js')
+        assert response.text == 'console.log("Hello, World!");'
+
+    assert (file_cache.hits, file_cache.misses) == (2, 3)
+    assert len(file_cache) == 1
+
+    response = client.simulate_get('/other/README')
+    assert response.text == 'Hello, World!'
+    assert response.headers['Content-Disposition'] == 'attachment; filename="README"'
+    assert (file_cache.hits, file_cache.misses) == (2, 4)
+    assert file_cache.size == 33
+
+    static_dir.join('README').write('Hello, cache!!')
+    os.utime(str(static_dir.join('README')), (0, 0))
+
+    response = client.simulate_get('/other/README')
+    assert response.text == 'Hello, cache!!'
+    assert (file_cache.hits, file_cache.misses) == (2, 5)
+    assert file_cache.size == 34
+
+    etag = response.headers['ETag']
+    response = client.simulate_get('/other/README', headers={'If-None-Match': etag})
+    assert response.status == falcon.HTTP_304
+    assert (file_cache.hits, file_cache.misses) == (2, 5)
+
+    file_cache.clear()
+    assert (len(file_cache), file_cache.size, file_cache.hits, file_cache.misses) == (0, 0, 0, 0)
+
+
+def test_file_cache_eviction(static_dir):
+    file_cache = StaticFileCache(max_size=40)
+
+    for name in ('index.html', 'README', 'index.html', 'app.js'):
+        path = str(static_dir.join(name))
+        assert file_cache.get(path, os.stat(path)) == static_dir.join(name).read_binary()
+
+    assert (file_cache.hits, file_cache.misses) == (1, 3)
+    assert list(file_cache._entries) == [str(static_dir.join('app.js'))]
+    assert file_cache.size == 29
+
+    path = str(static_dir.join('missing'))
+    assert file_cache.get(path, os.stat(str(static_dir.join('README')))) is None
+
+
+@pytest.fixture
+def precompressed_dir(static_dir):
+    static_dir.join('app.js.gz').write_binary(gzip.compress(b'console.log("Hello, World!");'))
+    static_dir.join('app.js.br').write_binary(b'<brotli>')
+    static_dir.join('index.html.gz').write_binary(gzip.compress(b'<p>Hello, World!</p>'))
+    return static_dir
+
+
+@pytest.mark.parametrize('accept_encoding,encoding', [
+    (None, None),
+    ('identity', None),
+    ('gzip', 'gzip'),
+    ('gzip, deflate, br', 'br'),
+    ('GZIP;q=0.5, br;q=0.4', 'gzip'),
+    ('br;q=0, gzip', 'gzip'),
+    ('br;q=0, gzip;q=0', None),
+    ('gzip;q=0.5, identity', None),
+    ('*', 'br'),
+    ('*;q=0.1, identity;q=0', 'br'),
+    ('compress, deflate', None),
+])
+def test_precompressed(client, precompressed_dir, accept_encoding, encoding):
+    client.app.add_static_route('/assets', str(precompressed_dir), precompressed=True)
+
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding else None
+    response = client.simulate_get('/assets/app.js', headers=headers)
+    assert response.status == falcon.HTTP_200
+    assert response.headers['Content-Type'] == mimetypes.types_map['.js']
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert response.headers.get('Content-Encoding') == encoding
+
+    expected = {
+        None: b'console.log("Hello, World!");',
+        'gzip': precompressed_dir.join('app.js.gz').read_binary(),
+        'br': b'<brotli>',
+    }[encoding]
+    assert response.content == expected
+
+    etag = response.headers['ETag']
+    headers = dict(headers or {}, **{'If-None-Match': etag})
+    response = client.simulate_get('/assets/app.js', headers=headers)
+    assert response.status == falcon.HTTP_304
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_precompressed_missing_sibling(client, precompressed_dir):
+    client.app.add_static_route('/assets', str(precompressed_dir), precompressed=True,
+                                fallback_filename='index.html')
+
+    response = client.simulate_get('/assets/index.html', headers={'Accept-Encoding': 'br'})
+    assert response.text == '<p>Hello, World!</p>'
+    assert 'Content-Encoding' not in response.headers
+
+    response = client.simulate_get('/assets/missing.js', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Type'] == 'text/html'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert 'Content-Encoding' not in response.headers
+    assert response.text == '<p>Hello, World!</p>'
+
+
+def test_precompressed_disabled(client, precompressed_dir):
+    client.app.add_static_route('/assets', str(precompressed_dir))
+
+    response = client.simulate_get('/assets/app.js', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.text == 'console.log("Hello, World!");'
+    assert 'Content-Encoding' not in response.headers
+    assert 'Vary' not in response.headers
+
+
+def _simulate_asgi_static(app, path, extensions=None):
+    scope = testing.create_scope(path=path)
+    if extensions is not None:
+        scope['extensions'] = extensions
+
+    events = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(event):
+        events.append(event)
+
+    falcon.invoke_coroutine_sync(app, scope, receive, send)
+    return events
+
+
+@pytest.mark.parametrize('extensions', [
+    {'http.response.pathsend': {}},
+    {'http.response.pathsend': {}, 'http.response.zerocopysend': {}},
+])
+def test_asgi_pathsend(static_dir, extensions):
+    app = falcon.asgi.App()
+    app.add_static_route('/assets', str(static_dir))
+
+    events = _simulate_asgi_static(app, '/assets/app.js', extensions)
+    assert [event['type'] for event in events] == [
+        'http.response.start', 'http.response.pathsend']
+    assert events[0]['status'] == 200
+    assert events[1]['path'] == os.path.abspath(str(static_dir.join('app.js')))
+
+
+def test_asgi_zerocopysend(static_dir):
+    app = falcon.asgi.App()
+    app.add_static_route('/assets', str(static_dir))
+
+    files = []
+
+    async def send(event):
+        if event['type'] == 'http.response.zerocopysend':
+            files.append(event['file'])
+            assert os.read(event['file'].fileno(), 1024) == b'console.log("Hello, World!");'
+
+    scope = testing.create_scope(path='/assets/app.js')
+    scope['extensions'] = {'http.response.zerocopysend': {}}
+    falcon.invoke_coroutine_sync(app, scope, None, send)
+
+    assert len(files) == 1
+    assert files[0].closed
+
+
+@pytest.mark.parametrize('size', [0, 10, 64 * 1024, 200 * 1024 + 1, 3 * 1024 * 1024])
+def test_asgi_adaptive_block_size(tmpdir, size):
+    content = os.urandom(size)
+    tmpdir.join('blob.bin').write_binary(content)
+
+    app = falcon.asgi.App()
+    app.add_static_route('/assets', str(tmpdir))
+
+    events = _simulate_asgi_static(app, '/assets/blob.bin', extensions={})
+    chunks = [event.get('body', b'') for event in events[1:]]
+    assert b''.join(chunks) == content
+    assert events[-1].get('more_body', False) is False
+
+    sizes = [len(chunk) for chunk in chunks if chunk]
+    assert all(size <= 1024 * 1024 for size in sizes)
+    if size == 3 * 1024 * 1024:
+        assert sizes[:5] == [64 * 1024, 128 * 1024, 256 * 1024, 512 * 1024, 1024 * 1024]